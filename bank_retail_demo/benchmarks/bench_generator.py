@@ -0,0 +1,133 @@
+"""
+Generator benchmark - wall time, rows/second and peak RSS per pipeline stage at several scale tiers.
+
+    python benchmarks/bench_generator.py                      # 1k, 10k and 100k customers
+    python benchmarks/bench_generator.py --tiers 1000 1000000 --engine numpy --format parquet
+    python benchmarks/bench_generator.py --format csv-arrow --compression zstd --export-threads 4
+    python benchmarks/bench_generator.py --compare benchmarks/results/<earlier run>.json
+
+Each tier runs generate_files() in a fresh process with streaming output (so the 1M tier keeps
+memory bounded) and keeps the per-stage totals of its run report: dim_customer, dim_account, the
+fact tables and their sub-steps, and export (one call per flushed chunk). Results are written as
+JSON tagged with the git commit and the run settings, so runs can be compared across commits;
+--compare flags stages whose rows/second dropped by more than --tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from mockup import GeneratorConfig, generate_files
+from mockup.export import TABLE_WRITERS
+from mockup.identities import identity_pool
+from mockup.report import format_report
+
+DEFAULT_TIERS = [1_000, 10_000, 100_000]
+SETTINGS = ["engine", "format", "shard_size", "compression", "export_threads"]  # recorded with the results
+RESULTS_DIR = f"{BENCH_DIR}/results"
+
+# --- ONE TIER ---
+def run_tier(num_customers, settings):
+    """
+    generate_files() for num_customers customers into a scratch directory with the SETTINGS in
+    settings; returns the tier's per-stage totals from the run report. The identity pool is built first so it is not charged to dim_customer.
+    """
+    identity_pool(GeneratorConfig.seed)
+    with tempfile.TemporaryDirectory() as output_dir:
+        config = GeneratorConfig(num_customers=num_customers, output_dir=output_dir, stream=True,
+                                 as_of_date=datetime(2025, 1, 1), **settings)
+        stages = generate_files(config)["report"]["stages"]
+    return {"customers": num_customers, "wall_seconds": stages["run"]["seconds"],
+            "peak_rss_mb": stages["run"]["peak_rss_mb"], "stages": stages}
+
+# --- RESULTS ---
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline, tolerance):
+    """
+    Print rows/second against a baseline run; returns the (tier, stage) pairs slower than tolerance allows.
+    Settings that differ from the baseline's are listed first - those runs are not like for like.
+    """
+    regressions = []
+    baseline_tiers = {tier["customers"]: tier for tier in baseline["tiers"]}
+    print(f"\nAgainst {baseline['commit']} ({baseline['timestamp']}):")
+    for setting in SETTINGS:
+        if baseline.get(setting) != results.get(setting):
+            print(f"  {setting} differs: {baseline.get(setting)} in the baseline, {results.get(setting)} now")
+    for tier in results["tiers"]:
+        old_tier = baseline_tiers.get(tier["customers"])
+        if old_tier is None:
+            continue
+        for stage, record in tier["stages"].items():
+            old_rate = old_tier["stages"].get(stage, {}).get("rows_per_second")
+            if not old_rate or not record["rows_per_second"]:
+                continue
+            change = record["rows_per_second"] / old_rate - 1
+            flag = "  REGRESSION" if change < -tolerance else ""
+            print(f"  {tier['customers']:>9,} {stage:<34} {change:+7.1%}{flag}")
+            if flag:
+                regressions.append((tier["customers"], stage))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the generator pipeline stage by stage.")
+    parser.add_argument("--tiers", type=int, nargs="+", default=DEFAULT_TIERS, metavar="CUSTOMERS",
+                        help="Customer counts to run (default: 1k, 10k and 100k; add 1000000 for the 1M tier)")
+    parser.add_argument("--engine", choices=["python", "numpy"], default="python", help="Discretionary spend engine")
+    parser.add_argument("--format", choices=sorted(TABLE_WRITERS), default="csv", help="Export format")
+    parser.add_argument("--shard-size", type=int, default=GeneratorConfig.shard_size, help="Customers per shard")
+    parser.add_argument("--compression", choices=["gzip", "zstd"], help="CSV compression / Parquet codec")
+    parser.add_argument("--export-threads", type=int, help="Tables written concurrently (default: one per CPU)")
+    parser.add_argument("--output", help="Results JSON (default: benchmarks/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="Earlier results to compare rows/second against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Slowdown in rows/second reported as a regression (default: 0.15)")
+    args = parser.parse_args()
+
+    settings = {setting: getattr(args, setting) for setting in SETTINGS}
+    results = {
+        "commit": git_commit(), "timestamp": datetime.now().isoformat(timespec="seconds"), **settings,
+        "python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+        "cpus": os.cpu_count(), "tiers": [],
+    }
+    for num_customers in args.tiers:
+        print(f"{num_customers:,} customers...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            tier = executor.submit(run_tier, num_customers, settings).result()
+        results["tiers"].append(tier)
+        print(format_report(tier))
+        print(f"Peak RSS: {tier['peak_rss_mb']:,.0f} MB")
+
+    output = args.output or f"{RESULTS_DIR}/{results['timestamp'].replace(':', '')}-{results['commit']}.json"
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            sys.exit(f"{len(regressions)} stage(s) slower than the baseline by more than {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Table loader shared by the EDA scripts.
+Reads the Parquet output of `financial_data_mockup.py --format parquet` when present
+(month-partitioned datasets for the big fact tables), otherwise the CSV files (plain, .gz or .zst).
+"""
+
+import os
+import pandas as pd
+
+DATA_DIR = "data"
+CSV_EXTENSIONS = [".csv", ".csv.gz", ".csv.zst"]  # as written with --compression none / gzip / zstd
+
+# Low-cardinality columns returned as pandas Categoricals (from Parquet dictionaries or CSV text)
+CATEGORICAL_COLUMNS = {
+    "dim_customer": ["gender", "address_city", "address_state", "address_country", "marital_status",
+                     "employment_type", "income_bracket", "home_ownership", "segment", "kyc_status",
+                     "preferred_channel", "persona_tag", "risk_tolerance"],
+    "dim_account": ["account_type", "product_name", "status", "tin_type", "policy_status",
+                    "policy_sub_status", "security_type", "currency"],
+    "fact_transaction": ["merchant_id", "transaction_type", "payment_method", "mcc_category",
+                         "recurring_frequency", "counterparty_type", "counterparty_name", "description", "channel"],
+    "fact_interaction": ["channel", "interaction_type", "reason", "resolution_status"],
+    "fact_loan_schedule": ["payment_status"],
+}
+
+
+def load_table(table, columns=None, filters=None, data_dir=DATA_DIR):
+    """
+    Load one generated table as a DataFrame with the same columns as the CSV.
+    Columns listed in CATEGORICAL_COLUMNS come back as Categoricals.
+
+    columns: read only these columns (Parquet skips the others on disk).
+    filters: Parquet row filters, e.g. [("month", ">=", 202410)] to read only the
+             matching month partitions of fact_transaction / fact_account_snapshot / fact_interaction.
+    """
+    categorical = CATEGORICAL_COLUMNS.get(table, [])
+    dataset_dir = f"{data_dir}/{table}"
+    parquet_file = f"{data_dir}/{table}.parquet"
+    if os.path.isdir(dataset_dir) or os.path.exists(parquet_file):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = dataset_dir if os.path.isdir(dataset_dir) else parquet_file
+        arrow_table = pq.read_table(path, columns=columns, filters=filters, partitioning="hive")
+        # The hive partition column is only there when no columns were asked for (or "month" was)
+        partition_column = os.path.isdir(dataset_dir) and "month" in arrow_table.column_names
+        if partition_column and "month" not in (columns or []):
+            arrow_table = arrow_table.drop_columns(["month"])
+        # Dictionary-encoded strings map to Categoricals; decode the high-cardinality ones to plain strings
+        plain = pa.schema([pa.field(f.name, f.type.value_type)
+                           if pa.types.is_dictionary(f.type) and f.name not in categorical else f
+                           for f in arrow_table.schema])
+        return arrow_table.cast(plain).to_pandas()
+
+    csv_file = next((f"{data_dir}/{table}{ext}" for ext in CSV_EXTENSIONS if os.path.exists(f"{data_dir}/{table}{ext}")),
+                    f"{data_dir}/{table}.csv")
+    if filters:
+        raise ValueError(f"filters need the Parquet output; only {csv_file} was found")
+    source = csv_file
+    if csv_file.endswith(".zst"):  # pandas would need the zstandard package; Arrow decompresses it
+        import pyarrow as pa
+
+        source = pa.input_stream(csv_file, compression="zstd")
+    return pd.read_csv(source, usecols=columns,
+                       dtype={col: "category" for col in categorical if columns is None or col in columns})
@@ -7,6 +7,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+from data_loader import load_table
 
 # Set style
 plt.style.use('seaborn-v0_8-whitegrid')
@@ -14,11 +15,11 @@ sns.set_palette("husl")
 
 # Load data
 print("Loading data...")
-df_customer = pd.read_csv("data/dim_customer.csv")
-df_account = pd.read_csv("data/dim_account.csv")
-df_transaction = pd.read_csv("data/fact_transaction.csv")
-df_interaction = pd.read_csv("data/fact_interaction.csv")
-df_product = pd.read_csv("data/dim_product.csv")
+df_customer = load_table("dim_customer")
+df_account = load_table("dim_account")
+df_transaction = load_table("fact_transaction")
+df_interaction = load_table("fact_interaction")
+df_product = load_table("dim_product")
 
 # Convert dates
 df_transaction['transaction_date'] = pd.to_datetime(df_transaction['transaction_date'])
@@ -377,6 +378,7 @@ print("="*70)
 print("\n📊 CREDIT CARD ANALYSIS:")
 print(f"   Total cardholders: {len(cards['customer_id'].unique()):,}")
 card_type_dist = cards['product_name'].value_counts()
+card_type_dist = card_type_dist[card_type_dist > 0]  # product_name is categorical; drop the non-card products
 for card, count in card_type_dist.items():
     print(f"   {card}: {count:,} ({count/len(cards)*100:.1f}%)")
 
@@ -7,15 +7,16 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+from data_loader import load_table
 
 plt.style.use('seaborn-v0_8-whitegrid')
 
 # Load data
 print("Loading data...")
-df_customer = pd.read_csv("data/dim_customer.csv")
-df_account = pd.read_csv("data/dim_account.csv")
-df_transaction = pd.read_csv("data/fact_transaction.csv")
-df_interaction = pd.read_csv("data/fact_interaction.csv")
+df_customer = load_table("dim_customer")
+df_account = load_table("dim_account")
+df_transaction = load_table("fact_transaction")
+df_interaction = load_table("fact_interaction")
 
 # Convert dates
 df_transaction['transaction_date'] = pd.to_datetime(df_transaction['transaction_date'])
@@ -0,0 +1,20 @@
+"""
+Customer 360 mock banking data generator.
+
+    from mockup import GeneratorConfig, generate
+    tables = generate(GeneratorConfig(num_customers=1000, seed=7))
+    tables["fact_transaction"].groupby("mcc_category")["amount"].sum()
+
+generate() returns DataFrames in memory; generate_files() writes them as CSV or Parquet
+(this is what financial_data_mockup.py runs). append_files() extends a written output
+directory past its end date, generating only the new days of the fact tables.
+"""
+
+from .config import GeneratorConfig
+from .pipeline import ALL_TABLES, generate, generate_files
+from .schemas import TABLE_SCHEMAS, conform_table
+from .export import write_table
+from .append import append_files
+
+__all__ = ["GeneratorConfig", "ALL_TABLES", "generate", "generate_files", "TABLE_SCHEMAS", "conform_table", "write_table",
+           "append_files"]
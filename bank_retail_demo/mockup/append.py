@@ -0,0 +1,136 @@
+"""
+Append mode: extend a generated output directory past its end date.
+The existing dims and the generator state saved by generate_files() are read back and only the
+new days of the fact tables are generated and appended, so a month costs one month of data.
+"""
+
+from collections import Counter
+from datetime import datetime
+import pandas as pd
+
+from .config import CHUNK_ROWS
+from .dims import dim_date_end, generate_dim_date
+from .facts import (
+    extend_transactions, extend_snapshots, extend_interactions, extend_loan_schedules, settle_loan_payments,
+    transaction_calendar,
+)
+from .export import TABLE_WRITERS, export_pool, read_table, run_concurrently, write_table
+from .pipeline import PROFILE_DIR, SHARD_TABLES, globalize_shard, map_shards
+from .report import APPEND_REPORT_FILE, finish_profiling, run_report, stage, start_profiling, take_records, write_report
+from .state import load_state, save_state
+
+def split_by_shard(df, customer_ids, shard_size):
+    """{shard index: rows of df} by the position of each row's customer in customer_ids"""
+    shard_of = pd.Index(customer_ids).get_indexer(df["customer_id"]) // shard_size
+    return dict(tuple(df.groupby(shard_of)))
+
+def settle_loan_schedule(output_dir, manifest, previous_end, end_date, compression):
+    """
+    Settle the written fact_loan_schedule payments that the new window makes due (settle_loan_payments).
+    The rows keep their IDs, but the table is read and written back whole - CSV and Parquet files cannot
+    change rows in place. Returns the number of payments settled.
+    """
+    fmt = manifest["format"]
+    with stage("fact_loan_schedule.settle") as record:
+        df = read_table("fact_loan_schedule", output_dir, fmt)
+        record["rows"] = settle_loan_payments(df, previous_end, end_date, manifest["seed"])
+    if record["rows"]:
+        write_table("fact_loan_schedule", df, output_dir, fmt, manifest["numeric_ids"], compression)
+    return record["rows"]
+
+def extend_shard(shard_index, df_customer, df_account, state, manifest, calendar, previous_end, end_date):
+    """
+    Fact rows for one shard of customers over the days after previous_end up to end_date.
+    Customer streams are keyed by (seed, customer, table, previous_end), so every append draws
+    fresh numbers. Fact IDs are shard-local like in generate_shard; customer and account IDs are global.
+    """
+    seed = manifest["seed"]
+    extenders = {
+        "fact_transaction": lambda table_state: extend_transactions(
+            df_customer, df_account, table_state, manifest["engine"], previous_end, end_date, seed, calendar),
+        "fact_account_snapshot": lambda table_state: extend_snapshots(
+            df_customer, df_account, table_state, previous_end, end_date, seed),
+        "fact_interaction": lambda table_state: extend_interactions(df_customer, table_state, previous_end, end_date, seed),
+        "fact_loan_schedule": lambda table_state: extend_loan_schedules(
+            table_state, previous_end, end_date, seed, manifest["loan_horizon"]),
+    }
+    tables, new_state = {}, {}
+    for table, extend in extenders.items():
+        if table in state:
+            with stage(table) as record:
+                tables[table], new_state[table] = extend(state[table])
+                record["rows"] = len(tables[table])
+    return tables, new_state
+
+def append_files(output_dir, end_date, workers=1, chunk_rows=CHUNK_ROWS, profile=None, profile_dir=None,
+                 export_threads=None):
+    """
+    Extend the fact tables in output_dir (written by generate_files) through end_date.
+    Seed, engine, loan horizon, format, ID style, compression and shard size come from the saved manifest.
+    New rows are appended to the CSV files / added as Parquet part files, dim_date is rewritten for the longer
+    range (if the original run wrote it) and the saved state moves on to end_date. Loan payments written as
+    Scheduled that the new window makes due are settled. Stage timings go to <output_dir>/append_report.json;
+    profile / profile_dir / export_threads work like GeneratorConfig's.
+    Returns {"rows": rows appended per table, "settled": loan payments settled, "report": the run report,
+    "hotspots": the profile summary or ""}.
+    """
+    manifest, state = load_state(output_dir)
+    previous_end = datetime.fromisoformat(manifest["end_date"])
+    if end_date <= previous_end:
+        raise ValueError(f"{output_dir} already runs through {previous_end.date()}")
+    fmt, numeric_ids = manifest["format"], manifest["numeric_ids"]
+    compression = manifest.get("compression")  # not recorded by older runs, which were uncompressed
+    take_records()  # drop records an earlier run left in this process
+    start_profiling(profile, profile_dir or f"{output_dir}/{PROFILE_DIR}")
+    with stage("run") as run_record:
+        df_date = generate_dim_date(datetime.fromisoformat(manifest["start_date"]),
+                                    dim_date_end(end_date, manifest["loan_horizon"]))
+        calendar = transaction_calendar(df_date)
+
+        df_customer = read_table("dim_customer", output_dir, fmt)
+        df_account = read_table("dim_account", output_dir, fmt)
+        customer_ids = df_customer["customer_id"]
+        shard_size = manifest["shard_size"]
+        customer_shards = split_by_shard(df_customer, customer_ids, shard_size)
+        account_shards = split_by_shard(df_account, customer_ids, shard_size)
+        state_shards = {table: split_by_shard(df, customer_ids, shard_size) for table, df in state.items()}
+
+        shard_args = (
+            (shard_index, shard_customers, account_shards.get(shard_index, df_account.iloc[:0]),
+             {table: shards.get(shard_index, state[table].iloc[:0]) for table, shards in state_shards.items()},
+             manifest, calendar, previous_end.date(), end_date)
+            for shard_index, shard_customers in customer_shards.items()
+        )
+
+        settled = 0
+        if "fact_loan_schedule" in state:
+            settled = settle_loan_schedule(output_dir, manifest, previous_end, end_date, compression)
+
+        # Account IDs are already global; fact IDs continue after the rows written so far
+        offsets = dict.fromkeys(SHARD_TABLES, 0)
+        offsets.update(manifest["rows"])
+        writers = {table: TABLE_WRITERS[fmt](table, output_dir, chunk_rows, numeric_ids, append=True,
+                                             compression=compression) for table in state}
+        shard_states = []
+        with export_pool(fmt, export_threads) as pool:
+            for tables, shard_state in map_shards(extend_shard, shard_args, workers):
+                tables, shard_state = globalize_shard(tables, shard_state, offsets)
+                shard_states.append(shard_state)
+                run_concurrently(pool, [(writers[table].write, df) for table, df in tables.items()])
+            run_concurrently(pool, [(writer.close,) for writer in writers.values()])
+
+        if manifest.get("tables") is None or "dim_date" in manifest["tables"]:
+            write_table("dim_date", df_date, output_dir, fmt, compression=compression)
+
+        rows = Counter({table: offsets[table] - manifest["rows"].get(table, 0) for table in state})
+        new_state = {table: pd.concat([shard_state[table] for shard_state in shard_states], ignore_index=True)
+                     for table in state} if shard_states else state
+        save_state(output_dir, {**manifest, "end_date": end_date.date().isoformat(),
+                                "rows": {table: int(offsets[table]) for table in manifest["rows"]}}, new_state)
+        run_record["rows"] = sum(rows.values())
+    settings = {"append": True, "previous_end": manifest["end_date"], "end_date": end_date.date().isoformat(),
+                "seed": manifest["seed"], "engine": manifest["engine"], "format": fmt, "workers": workers,
+                "chunk_rows": chunk_rows, "compression": compression, "export_threads": export_threads}
+    report = run_report(settings, take_records())
+    write_report(report, f"{output_dir}/{APPEND_REPORT_FILE}")
+    return {"rows": rows, "settled": settled, "report": report, "hotspots": finish_profiling()}
@@ -0,0 +1,239 @@
+"""
+Personas, product and merchant catalogs, geography and spend parameters shared by all stages.
+"""
+
+import numpy as np
+import pandas as pd
+
+# --- PERSONA DEFINITIONS ---
+# More realistic distributions and constraints
+PERSONAS = {
+    "Frequent Traveler": {
+        "weight": 0.08,  # Rare - requires high income
+        "age_range": (32, 58),
+        "income_brackets": ["100-250K", "250K+"],
+        "segment_weights": {"Affluent": 0.6, "High Net Worth": 0.4},  # No mass market
+        "spending_categories": ["Travel", "Dining", "Dining", "Entertainment", "Shopping"],  # More balanced
+        "monthly_spend_range": (4000, 12000),
+        "card_types": ["Gold Credit Card", "Platinum Credit Card", "Platinum Credit Card"],  # Premium cards
+        "preferred_channels": ["App", "App", "App", "App", "Chatbot"],  # 80% app
+        "weekend_spending_mult": 1.6,
+        "product_count_range": (3, 5),
+    },
+    "Young Parent": {
+        "weight": 0.20,
+        "age_range": (28, 42),
+        "income_brackets": ["50-100K", "100-250K"],
+        "segment_weights": {"Mass Market": 0.55, "Affluent": 0.45},
+        "spending_categories": ["Groceries", "Shopping", "Healthcare", "Dining", "Gas"],  # More varied
+        "monthly_spend_range": (2500, 6000),
+        "card_types": ["Basic Credit Card", "Gold Credit Card", "Gold Credit Card"],
+        "preferred_channels": ["App", "App", "App", "Branch", "Chatbot"],  # Mostly app
+        "weekend_spending_mult": 1.4,
+        "product_count_range": (2, 4),
+    },
+    "Digital Native": {
+        "weight": 0.25,
+        "age_range": (23, 35),
+        "income_brackets": ["25-50K", "50-100K", "50-100K"],
+        "segment_weights": {"Mass Market": 0.7, "Affluent": 0.3},
+        "spending_categories": ["Dining", "Entertainment", "Shopping", "Subscriptions", "Groceries"],  # More varied
+        "monthly_spend_range": (1200, 3500),
+        "card_types": ["Basic Credit Card", "Basic Credit Card", "Gold Credit Card"],  # Mostly basic
+        "preferred_channels": ["App", "App", "App", "App", "App", "Chatbot"],  # 83% app
+        "weekend_spending_mult": 1.7,
+        "product_count_range": (1, 3),
+    },
+    "College Student": {
+        "weight": 0.12,
+        "age_range": (18, 24),
+        "income_brackets": ["<25K", "<25K", "25-50K"],  # Mostly low income
+        "segment_weights": {"Mass Market": 1.0},  # 100% mass market
+        "spending_categories": ["Dining", "Entertainment", "Shopping", "Subscriptions", "Groceries"],  # More varied
+        "monthly_spend_range": (400, 1200),
+        "card_types": ["Basic Credit Card"],  # Only basic cards
+        "preferred_channels": ["App", "App", "App", "App", "Chatbot", "Chatbot"],  # Never branch
+        "weekend_spending_mult": 2.0,  # Heavy weekend spending
+        "product_count_range": (1, 2),  # Minimal products
+    },
+    "Boomer": {
+        "weight": 0.35,  # Largest segment - most banking customers are older
+        "age_range": (55, 78),
+        "income_brackets": ["50-100K", "100-250K", "100-250K", "250K+"],
+        "segment_weights": {"Mass Market": 0.3, "Affluent": 0.5, "High Net Worth": 0.2},
+        "spending_categories": ["Healthcare", "Groceries", "Shopping", "Utilities", "Dining"],  # More varied
+        "monthly_spend_range": (2000, 7000),
+        "card_types": ["Gold Credit Card", "Gold Credit Card", "Platinum Credit Card"],
+        "preferred_channels": ["Branch", "Branch", "Branch", "Call Center", "Call Center", "App"],  # 50% branch
+        "weekend_spending_mult": 0.6,  # Much less weekend spending
+        "product_count_range": (2, 5),
+    },
+}
+
+# --- PRODUCT CATALOG ---
+PRODUCTS = [
+    # CASA
+    {"product_id": "PROD-001", "product_name": "Savings Account", "product_type": "Savings", "product_category": "CASA", "min_balance": 100, "annual_fee": 0, "interest_rate_min": 0.01, "interest_rate_max": 0.02},
+    {"product_id": "PROD-002", "product_name": "Premium Savings", "product_type": "Savings", "product_category": "CASA", "min_balance": 10000, "annual_fee": 0, "interest_rate_min": 0.03, "interest_rate_max": 0.04},
+    {"product_id": "PROD-003", "product_name": "Checking Account", "product_type": "Checking", "product_category": "CASA", "min_balance": 0, "annual_fee": 0, "interest_rate_min": 0, "interest_rate_max": 0.005},
+    {"product_id": "PROD-004", "product_name": "Money Market", "product_type": "Money Market", "product_category": "CASA", "min_balance": 25000, "annual_fee": 0, "interest_rate_min": 0.04, "interest_rate_max": 0.05},
+    # Cards
+    {"product_id": "PROD-010", "product_name": "Basic Credit Card", "product_type": "Credit Card", "product_category": "Cards", "min_balance": None, "annual_fee": 0, "interest_rate_min": 0.18, "interest_rate_max": 0.24},
+    {"product_id": "PROD-011", "product_name": "Gold Credit Card", "product_type": "Credit Card", "product_category": "Cards", "min_balance": None, "annual_fee": 95, "interest_rate_min": 0.15, "interest_rate_max": 0.21},
+    {"product_id": "PROD-012", "product_name": "Platinum Credit Card", "product_type": "Credit Card", "product_category": "Cards", "min_balance": None, "annual_fee": 450, "interest_rate_min": 0.12, "interest_rate_max": 0.18},
+    # Loans
+    {"product_id": "PROD-020", "product_name": "Personal Loan", "product_type": "Personal Loan", "product_category": "Loans", "min_balance": None, "annual_fee": 0, "interest_rate_min": 0.08, "interest_rate_max": 0.15},
+    {"product_id": "PROD-021", "product_name": "Home Mortgage", "product_type": "Mortgage", "product_category": "Loans", "min_balance": None, "annual_fee": 0, "interest_rate_min": 0.05, "interest_rate_max": 0.07},
+    {"product_id": "PROD-022", "product_name": "Auto Loan", "product_type": "Auto Loan", "product_category": "Loans", "min_balance": None, "annual_fee": 0, "interest_rate_min": 0.06, "interest_rate_max": 0.10},
+    {"product_id": "PROD-023", "product_name": "Education Loan", "product_type": "Education Loan", "product_category": "Loans", "min_balance": None, "annual_fee": 0, "interest_rate_min": 0.04, "interest_rate_max": 0.08},
+    # CDs
+    {"product_id": "PROD-030", "product_name": "Standard CD", "product_type": "CD", "product_category": "CDs", "min_balance": 1000, "annual_fee": 0, "interest_rate_min": 0.04, "interest_rate_max": 0.045},
+    {"product_id": "PROD-031", "product_name": "High-Yield CD", "product_type": "CD", "product_category": "CDs", "min_balance": 10000, "annual_fee": 0, "interest_rate_min": 0.05, "interest_rate_max": 0.055},
+    {"product_id": "PROD-032", "product_name": "Jumbo CD", "product_type": "CD", "product_category": "CDs", "min_balance": 100000, "annual_fee": 0, "interest_rate_min": 0.055, "interest_rate_max": 0.06},
+    # Insurance
+    {"product_id": "PROD-040", "product_name": "Term Life Insurance", "product_type": "Life Insurance", "product_category": "Insurance", "min_balance": None, "annual_fee": None, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-041", "product_name": "Whole Life Insurance", "product_type": "Life Insurance", "product_category": "Insurance", "min_balance": None, "annual_fee": None, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-042", "product_name": "Property Insurance", "product_type": "Property Insurance", "product_category": "Insurance", "min_balance": None, "annual_fee": None, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-043", "product_name": "Travel Insurance", "product_type": "Travel Insurance", "product_category": "Insurance", "min_balance": None, "annual_fee": None, "interest_rate_min": None, "interest_rate_max": None},
+    # Securities
+    {"product_id": "PROD-050", "product_name": "Equity Fund", "product_type": "Equity", "product_category": "Securities", "min_balance": 500, "annual_fee": 0.005, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-051", "product_name": "Bond Fund", "product_type": "Bond", "product_category": "Securities", "min_balance": 1000, "annual_fee": 0.003, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-052", "product_name": "Mutual Fund", "product_type": "Mutual Fund", "product_category": "Securities", "min_balance": 1000, "annual_fee": 0.01, "interest_rate_min": None, "interest_rate_max": None},
+    {"product_id": "PROD-053", "product_name": "SIP Investment", "product_type": "SIP", "product_category": "Securities", "min_balance": 100, "annual_fee": 0.008, "interest_rate_min": None, "interest_rate_max": None},
+]
+
+# --- MERCHANT CATALOG ---
+MERCHANTS = [
+    # Groceries
+    {"merchant_id": "MERCH-001", "merchant_name": "Whole Foods", "mcc_code": "5411", "mcc_category": "Groceries", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-002", "merchant_name": "Kroger", "mcc_code": "5411", "mcc_category": "Groceries", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-003", "merchant_name": "Trader Joe's", "mcc_code": "5411", "mcc_category": "Groceries", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-004", "merchant_name": "Costco", "mcc_code": "5411", "mcc_category": "Groceries", "merchant_type": "Retail", "is_subscription_merchant": False},
+    # Dining
+    {"merchant_id": "MERCH-010", "merchant_name": "Starbucks", "mcc_code": "5814", "mcc_category": "Dining", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-011", "merchant_name": "Chipotle", "mcc_code": "5812", "mcc_category": "Dining", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-012", "merchant_name": "Uber Eats", "mcc_code": "5812", "mcc_category": "Dining", "merchant_type": "Online", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-013", "merchant_name": "DoorDash", "mcc_code": "5812", "mcc_category": "Dining", "merchant_type": "Online", "is_subscription_merchant": False},
+    # Travel
+    {"merchant_id": "MERCH-020", "merchant_name": "Delta Airlines", "mcc_code": "3058", "mcc_category": "Travel", "merchant_type": "Service", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-021", "merchant_name": "United Airlines", "mcc_code": "3000", "mcc_category": "Travel", "merchant_type": "Service", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-022", "merchant_name": "Marriott Hotels", "mcc_code": "7011", "mcc_category": "Travel", "merchant_type": "Service", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-023", "merchant_name": "Hilton Hotels", "mcc_code": "7011", "mcc_category": "Travel", "merchant_type": "Service", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-024", "merchant_name": "Uber", "mcc_code": "4121", "mcc_category": "Travel", "merchant_type": "Service", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-025", "merchant_name": "Airbnb", "mcc_code": "7011", "mcc_category": "Travel", "merchant_type": "Online", "is_subscription_merchant": False},
+    # Utilities
+    {"merchant_id": "MERCH-030", "merchant_name": "Verizon", "mcc_code": "4814", "mcc_category": "Utilities", "merchant_type": "Service", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-031", "merchant_name": "AT&T", "mcc_code": "4814", "mcc_category": "Utilities", "merchant_type": "Service", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-032", "merchant_name": "Comcast", "mcc_code": "4899", "mcc_category": "Utilities", "merchant_type": "Service", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-033", "merchant_name": "City Power Co", "mcc_code": "4900", "mcc_category": "Utilities", "merchant_type": "Service", "is_subscription_merchant": True},
+    # Entertainment / Subscriptions
+    {"merchant_id": "MERCH-040", "merchant_name": "Netflix", "mcc_code": "4899", "mcc_category": "Subscriptions", "merchant_type": "Online", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-041", "merchant_name": "Spotify", "mcc_code": "5968", "mcc_category": "Subscriptions", "merchant_type": "Online", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-042", "merchant_name": "Amazon Prime", "mcc_code": "5968", "mcc_category": "Subscriptions", "merchant_type": "Online", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-043", "merchant_name": "Disney+", "mcc_code": "4899", "mcc_category": "Subscriptions", "merchant_type": "Online", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-044", "merchant_name": "Planet Fitness", "mcc_code": "7941", "mcc_category": "Subscriptions", "merchant_type": "Service", "is_subscription_merchant": True},
+    {"merchant_id": "MERCH-045", "merchant_name": "Apple Music", "mcc_code": "5968", "mcc_category": "Subscriptions", "merchant_type": "Online", "is_subscription_merchant": True},
+    # Healthcare
+    {"merchant_id": "MERCH-050", "merchant_name": "CVS Pharmacy", "mcc_code": "5912", "mcc_category": "Healthcare", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-051", "merchant_name": "Walgreens", "mcc_code": "5912", "mcc_category": "Healthcare", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-052", "merchant_name": "Kaiser Permanente", "mcc_code": "8011", "mcc_category": "Healthcare", "merchant_type": "Service", "is_subscription_merchant": False},
+    # Shopping
+    {"merchant_id": "MERCH-060", "merchant_name": "Amazon", "mcc_code": "5311", "mcc_category": "Shopping", "merchant_type": "Online", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-061", "merchant_name": "Target", "mcc_code": "5311", "mcc_category": "Shopping", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-062", "merchant_name": "Walmart", "mcc_code": "5311", "mcc_category": "Shopping", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-063", "merchant_name": "Best Buy", "mcc_code": "5732", "mcc_category": "Shopping", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-064", "merchant_name": "Buy Buy Baby", "mcc_code": "5641", "mcc_category": "Shopping", "merchant_type": "Retail", "is_subscription_merchant": False},
+    # Gas
+    {"merchant_id": "MERCH-070", "merchant_name": "Shell", "mcc_code": "5541", "mcc_category": "Gas", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-071", "merchant_name": "Chevron", "mcc_code": "5541", "mcc_category": "Gas", "merchant_type": "Retail", "is_subscription_merchant": False},
+    {"merchant_id": "MERCH-072", "merchant_name": "ExxonMobil", "mcc_code": "5541", "mcc_category": "Gas", "merchant_type": "Retail", "is_subscription_merchant": False},
+    # Salary (internal transfers)
+    {"merchant_id": "MERCH-100", "merchant_name": "Employer Direct Deposit", "mcc_code": "0000", "mcc_category": "Income", "merchant_type": "Internal", "is_subscription_merchant": False},
+]
+
+MERCHANTS_BY_CATEGORY = {}
+for m in MERCHANTS:
+    cat = m["mcc_category"]
+    if cat not in MERCHANTS_BY_CATEGORY:
+        MERCHANTS_BY_CATEGORY[cat] = []
+    MERCHANTS_BY_CATEGORY[cat].append(m)
+
+# Fixed category sets for the low-cardinality fact_transaction columns. Every shard builds
+# these columns with the same CategoricalDtype, so they stay categorical through concat.
+TRANSACTION_CATEGORIES = {
+    "merchant_id": [m["merchant_id"] for m in MERCHANTS],
+    "transaction_type": ["credit", "debit"],
+    "payment_method": ["Bank Transfer", "Credit Card", "Debit Card", "Direct Debit"],
+    "mcc_category": sorted({m["mcc_category"] for m in MERCHANTS}),
+    "recurring_frequency": ["monthly"],
+    "counterparty_type": ["external"],
+    "counterparty_name": ["Employer"] + [m["merchant_name"] for m in MERCHANTS],
+    "description": (["Direct Deposit - Salary"]
+                    + [f"{m['merchant_name']} Monthly" for m in MERCHANTS if m["is_subscription_merchant"]]
+                    + [f"Purchase at {m['merchant_name']}" for m in MERCHANTS]),
+    "channel": ["App", "POS", "Online"],
+}
+TRANSACTION_DTYPES = {col: pd.CategoricalDtype(values) for col, values in TRANSACTION_CATEGORIES.items()}
+
+# Category codes of a purchase at each merchant (by position in MERCHANTS)
+PURCHASE_CODES = {
+    "merchant_id": np.arange(len(MERCHANTS)),
+    "mcc_category": TRANSACTION_DTYPES["mcc_category"].categories.get_indexer([m["mcc_category"] for m in MERCHANTS]),
+    "counterparty_name": TRANSACTION_DTYPES["counterparty_name"].categories.get_indexer([m["merchant_name"] for m in MERCHANTS]),
+    "description": TRANSACTION_DTYPES["description"].categories.get_indexer([f"Purchase at {m['merchant_name']}" for m in MERCHANTS]),
+}
+MERCHANT_POSITIONS_BY_CATEGORY = {cat: np.array([MERCHANTS.index(m) for m in merchants])
+                                  for cat, merchants in MERCHANTS_BY_CATEGORY.items()}
+
+# Products by category for easy lookup
+PRODUCTS_BY_CAT = {}
+for p in PRODUCTS:
+    cat = p["product_category"]
+    if cat not in PRODUCTS_BY_CAT:
+        PRODUCTS_BY_CAT[cat] = []
+    PRODUCTS_BY_CAT[cat].append(p)
+
+
+STATES = ["CA", "TX", "NY", "FL", "IL", "PA", "OH", "GA", "NC", "MI"]
+CITIES = {
+    "CA": ["Los Angeles", "San Francisco", "San Diego"],
+    "TX": ["Houston", "Dallas", "Austin"],
+    "NY": ["New York", "Buffalo", "Albany"],
+    "FL": ["Miami", "Orlando", "Tampa"],
+    "IL": ["Chicago", "Springfield"],
+    "PA": ["Philadelphia", "Pittsburgh"],
+    "OH": ["Columbus", "Cleveland"],
+    "GA": ["Atlanta", "Savannah"],
+    "NC": ["Charlotte", "Raleigh"],
+    "MI": ["Detroit", "Grand Rapids"],
+}
+
+
+INTERACTION_REASONS = ["Account Inquiry", "Card Issue", "Loan Question", "Fee Dispute", "Password Reset",
+                       "Statement Request", "Address Change", "New Product Interest", "Complaint", "General Info"]
+
+# --- DISCRETIONARY SPEND PARAMETERS ---
+# General categories everyone uses, with base weights before individual adjustments
+GENERAL_CATEGORIES = ["Groceries", "Dining", "Shopping", "Gas", "Healthcare", "Entertainment"]
+GENERAL_CATEGORY_WEIGHTS = [1.0, 1.0, 1.0, 0.8, 0.5, 0.7]
+
+# Amount based on category - REDUCED Travel, more realistic ranges
+# Travel: Most travel purchases are small (Uber $15-40, meals while traveling $30-80)
+# Big travel purchases (flights, hotels) are occasional, handled separately
+AMOUNT_RANGES = {
+    "Groceries": (20, 180),
+    "Dining": (8, 85),
+    "Travel": (15, 150),  # Reduced! Most travel txns are small (rideshare, parking, snacks)
+    "Utilities": (40, 200),
+    "Subscriptions": (5, 50),
+    "Healthcare": (15, 350),
+    "Shopping": (15, 400),
+    "Gas": (25, 75),
+    "Entertainment": (8, 100),
+}
+BIG_TRAVEL_RANGES = [
+    (200, 600),   # Domestic flight
+    (400, 1200),  # International flight
+    (100, 400),   # Hotel night
+    (300, 800),   # Weekend getaway package
+]
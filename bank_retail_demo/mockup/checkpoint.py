@@ -0,0 +1,92 @@
+"""
+Checkpoints for long runs: finished stages (static dims, then each shard's tables) are kept in a
+work directory with a manifest, and a rerun with the same settings resumes from them.
+"""
+
+import dataclasses
+import json
+import os
+from datetime import datetime
+import pandas as pd
+
+from . import report
+
+# GeneratorConfig fields that change the generated rows; a checkpoint only resumes a run that matches them
+RUN_FIELDS = ["num_customers", "start_date", "end_date", "seed", "tables", "engine", "loan_horizon", "shard_size",
+              "as_of_date"]
+
+def run_fingerprint(config):
+    fingerprint = {}
+    for field in RUN_FIELDS:
+        value = getattr(config, field)
+        fingerprint[field] = value.date().isoformat() if isinstance(value, datetime) else value
+    return fingerprint
+
+class RunCheckpoint:
+    """
+    Work directory of one run: manifest.json (run settings, pinned as_of_date, completed stages)
+    and one pickle per completed stage. Stage files are renamed into place once fully written,
+    so a crash leaves either the whole stage or none of it.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest = None
+
+    @property
+    def manifest_path(self):
+        return f"{self.directory}/manifest.json"
+
+    def exists(self):
+        return os.path.exists(self.manifest_path)
+
+    def start(self, config):
+        """
+        Resume the run saved in the directory, or start a new one there.
+        Returns config with as_of_date pinned - a resumed run keeps the original run's date.
+        Raises ValueError when the saved run was made with different settings.
+        """
+        if self.exists():
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if config.as_of_date is None:
+                config = dataclasses.replace(config, as_of_date=datetime.fromisoformat(manifest["run"]["as_of_date"]))
+            if run_fingerprint(config) != manifest["run"]:
+                raise ValueError(f"Checkpoint in {self.directory} belongs to a run with different settings: {manifest['run']}")
+            self.manifest = manifest
+            return config
+
+        if config.as_of_date is None:
+            config = dataclasses.replace(config, as_of_date=datetime.now())
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = {"run": run_fingerprint(config), "completed": []}
+        self.write_manifest()
+        return config
+
+    def write_manifest(self):
+        with open(f"{self.manifest_path}.tmp", "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
+
+    def has(self, stage):
+        return stage in self.manifest["completed"]
+
+    def load(self, stage):
+        with report.stage("checkpoint_load"):
+            return pd.read_pickle(f"{self.directory}/{stage}.pkl")
+
+    def save(self, stage, result):
+        path = f"{self.directory}/{stage}.pkl"
+        with report.stage("checkpoint_save"):
+            pd.to_pickle(result, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+        self.manifest["completed"].append(stage)
+        self.write_manifest()
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished (the directory too if nothing else is in it)"""
+        for stage in self.manifest["completed"]:
+            os.remove(f"{self.directory}/{stage}.pkl")
+        os.remove(self.manifest_path)
+        if not os.listdir(self.directory):
+            os.rmdir(self.directory)
@@ -0,0 +1,47 @@
+"""
+Generator defaults and the GeneratorConfig passed to generate() / generate_files().
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+NUM_CUSTOMERS = 5000
+START_DATE = datetime(2024, 1, 1)
+END_DATE = datetime(2024, 12, 31)
+OUTPUT_DIR = "data"
+SEED = 42
+SHARD_SIZE = 1000  # Customers per shard - output depends on this, not on the worker count
+CHUNK_ROWS = 100_000  # Rows buffered per table before a streaming flush
+LOCALE = "en_US"
+IDENTITY_POOL_SIZE = 10_000  # Faker-generated names/emails/occupations sampled from for dim_customer
+
+
+@dataclass
+class GeneratorConfig:
+    """
+    One generator run. tables=None builds every table; otherwise only the listed ones
+    (dim_customer and dim_account are still generated internally when a fact table needs them).
+    """
+    num_customers: int = NUM_CUSTOMERS
+    start_date: datetime = START_DATE
+    end_date: datetime = END_DATE
+    seed: int = SEED
+    output_dir: str = OUTPUT_DIR
+    tables: Optional[list] = None
+    engine: str = "python"  # discretionary spend engine: "python" (per-row reference) or "numpy"
+    loan_horizon: Optional[int] = None  # months of loan schedule written past end_date; None runs every loan to maturity
+    workers: int = 1
+    shard_size: int = SHARD_SIZE
+    identity_cache: Optional[str] = None
+    as_of_date: Optional[datetime] = None  # "today" for dates of birth; None pins the current date when the run starts
+    checkpoint_dir: Optional[str] = None  # keep finished stages here and resume from them on a rerun
+    profile: Optional[list] = None  # stage names (e.g. ["fact_transaction"]) to run under cProfile
+    profile_dir: Optional[str] = None  # where profiles and hotspots.txt go; None means <output_dir>/_profile
+    # Export options, used by generate_files()
+    format: str = "csv"
+    stream: bool = False
+    chunk_rows: int = CHUNK_ROWS
+    numeric_ids: bool = False
+    compression: Optional[str] = None  # "gzip" or "zstd" for CSV / Parquet files; None writes plain CSV and snappy Parquet
+    export_threads: Optional[int] = None  # tables written concurrently; None means one thread per CPU
@@ -0,0 +1,413 @@
+"""
+Dimension tables: dim_date, dim_product, dim_merchant, dim_customer and dim_account.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import USFederalHolidayCalendar
+
+from .catalogs import PERSONAS, PRODUCTS, PRODUCTS_BY_CAT, MERCHANTS, STATES, CITIES
+from .helpers import generate_phones, lookup, pick, pick_weighted, weighted_rows, random_days, to_day_numbers, to_dates
+from .schemas import TABLE_SCHEMAS
+
+# --- 1. GENERATE dim_date ---
+MAX_LOAN_TERM = 360  # months - the Home Mortgage term, the longest loan
+
+def dim_date_end(end_date, loan_horizon=None):
+    """
+    Last day of dim_date: the end of the month of the last loan payment a run through end_date
+    can schedule, so every fact_loan_schedule date_key has its dim_date row.
+    """
+    months = MAX_LOAN_TERM if loan_horizon is None else min(loan_horizon, MAX_LOAN_TERM)
+    last_day = (np.datetime64(end_date.date(), "M") + months + 1).astype("datetime64[D]") - 1
+    return max(end_date, pd.Timestamp(last_day).to_pydatetime())
+
+def generate_dim_date(start_date, end_date):
+    """
+    One row per day from start_date to end_date, built column-wise over pd.date_range so long
+    histories cost no more per day than one year. is_holiday follows the US federal holiday
+    calendar (observed dates). transaction_calendar() turns this table into the fact generators'
+    per-day lookup arrays.
+    """
+    dates = pd.date_range(start_date.date(), end_date.date(), freq="D")
+    year, month, day, day_of_week = (values.to_numpy(dtype=np.int64)
+                                     for values in (dates.year, dates.month, dates.day, dates.dayofweek))
+    holidays = USFederalHolidayCalendar().holidays(dates.min(), dates.max()) if len(dates) else dates
+    return pd.DataFrame({
+        "date_key": year * 10000 + month * 100 + day,
+        "full_date": dates.date,
+        "year": year,
+        "quarter": (month - 1) // 3 + 1,
+        "month": month,
+        "month_name": dates.month_name().to_numpy(dtype=object),
+        "week_of_year": dates.isocalendar()["week"].to_numpy(dtype=np.int64),
+        "day_of_month": day,
+        "day_of_week": day_of_week,
+        "day_name": dates.day_name().to_numpy(dtype=object),
+        "is_weekend": day_of_week >= 5,
+        "is_holiday": dates.isin(holidays),
+        "fiscal_year": np.where(month >= 7, year, year - 1),
+        "fiscal_quarter": ((month - 7) % 12) // 3 + 1,
+    })
+
+# --- 2. GENERATE dim_product ---
+def generate_dim_product():
+    return pd.DataFrame([
+        {**p, "is_active": True, "description": f"{p['product_name']} - {p['product_category']}"}
+        for p in PRODUCTS
+    ])
+
+# --- 3. GENERATE dim_merchant ---
+def generate_dim_merchant():
+    return pd.DataFrame(MERCHANTS)
+
+# --- 4. GENERATE dim_customer ---
+def generate_customers(customer_ids, identities, start_date, end_date, as_of_date, rng):
+    """
+    Columnar dim_customer builder. Every attribute is drawn for all customers at once;
+    names, emails and occupations are sampled by index from the identity pool instead of Faker.
+    Dates of birth count back from as_of_date.
+    """
+    n = len(customer_ids)
+    start_day, end_day = to_day_numbers([start_date.date(), end_date.date()])
+    today = to_day_numbers([as_of_date.date()])[0]
+
+    # Persona - add noise to weights (+/- 15%) per customer
+    persona_names = list(PERSONAS)
+    persona_weights = np.array([PERSONAS[p]["weight"] for p in persona_names]) * rng.uniform(0.85, 1.15, (n, len(persona_names)))
+    persona = np.array(persona_names, dtype=object)[weighted_rows(persona_weights, rng)]
+
+    age_low = lookup(persona, {p: c["age_range"][0] for p, c in PERSONAS.items()})
+    age_high = lookup(persona, {p: c["age_range"][1] for p, c in PERSONAS.items()})
+    age = rng.integers(age_low, age_high + 1)
+    dob = today - (age * 365 + rng.integers(0, 365, size=n))
+
+    state = pick(STATES, n, rng)
+    city = np.empty(n, dtype=object)
+    for state_name, cities in CITIES.items():
+        in_state = state == state_name
+        city[in_state] = pick(cities, in_state.sum(), rng)
+
+    join_days = random_days(np.full(n, start_day), np.full(n, end_day - 90), rng)
+
+    # Use segment weights for realistic distribution (need segment first for churn calc)
+    segment = np.empty(n, dtype=object)
+    preferred_channel = np.empty(n, dtype=object)
+    income_bracket = np.empty(n, dtype=object)
+    for persona_name, p_config in PERSONAS.items():
+        is_persona = persona == persona_name
+        k = is_persona.sum()
+        segment_weights = p_config.get("segment_weights", {"Mass Market": 0.7, "Affluent": 0.25, "High Net Worth": 0.05})
+        segment[is_persona] = pick_weighted(list(segment_weights), list(segment_weights.values()), k, rng)
+        # Preferred channel based on persona
+        preferred_channel[is_persona] = pick(p_config.get("preferred_channels", ["App", "Branch", "Call Center", "Chatbot"]), k, rng)
+        income_bracket[is_persona] = pick(p_config["income_brackets"], k, rng)
+
+    # Churn rate based on real industry data:
+    # - HNW: ~6-8% (very sticky - dedicated relationship managers, bespoke services)
+    # - Affluent/Mass-Affluent: ~15-20% (highest - underserved "no-man's land", looking for personalization)
+    # - Mass Market: ~10-15% (transactional, product-centric)
+    base_churn = lookup(segment, {
+        "High Net Worth": 0.07,
+        "Affluent": 0.17,
+        "Mass Market": 0.12,
+    }, 0.12)
+
+    # Persona adjustment
+    base_churn = base_churn * lookup(persona, {
+        "Young Parent": 0.65,  # Very sticky - mortgages, life stage, family accounts
+        "College Student": 1.4,  # Higher - life changes, graduating, moving
+        "Boomer": 0.8,  # Stickier - inertia, relationship with branch
+    }, 1.0)
+
+    # Age adjustment - younger more likely to switch
+    age_factor = np.clip(1.0 + (35 - age) * 0.01, 0.7, 1.3)  # Younger = higher churn
+    churn_rate = base_churn * age_factor * rng.uniform(0.85, 1.15, n)
+    # Churn at least 60 days after joining; customers who join too late to churn stay active
+    min_active = join_days + 60
+    is_churned = (rng.random(n) < churn_rate) & (min_active < end_day)
+    churn_date = np.full(n, None, dtype=object)
+    churn_date[is_churned] = to_dates(random_days(min_active[is_churned], np.full(is_churned.sum(), end_day), rng))
+
+    # Employment type
+    employment_type = np.where(
+        persona == "College Student", "Student",
+        np.where((persona == "Boomer") & (age > 62),
+                 pick_weighted(["Retired", "Salaried", "Self-Employed"], [0.6, 0.25, 0.15], n, rng),
+                 pick_weighted(["Salaried", "Self-Employed", "Retired"], [0.7, 0.2, 0.1], n, rng)),
+    ).astype(object)
+
+    # Home ownership based on persona/segment
+    own_chance = np.select([persona == "College Student", segment == "High Net Worth", persona == "Young Parent"],
+                           [0.0, 0.95, 0.55], 0.5)
+    home_ownership = np.where(rng.random(n) < own_chance, "Own", "Rent").astype(object)
+
+    # Engagement score varies by persona
+    engagement_low = lookup(persona, {"Digital Native": 50, "College Student": 30, "Boomer": 20}, 30)
+    engagement_high = lookup(persona, {"Digital Native": 100, "College Student": 80, "Boomer": 70}, 90)  # Digital high, Boomer lower
+    engagement_score = rng.integers(engagement_low, engagement_high + 1)
+
+    is_student = persona == "College Student"
+    marital_status = np.where(is_student, np.where(rng.random(n) < 0.95, "Single", "Married"),
+                              pick(["Single", "Married", "Divorced"], n, rng)).astype(object)
+    has_children = ((persona == "Young Parent") | ((persona == "Boomer") & (rng.random(n) < 0.7))
+                    | (rng.random(n) < 0.2))
+    num_dependents = np.select([persona == "Young Parent", is_student],
+                               [rng.integers(1, 4, size=n), 0], rng.integers(0, 3, size=n))
+    risk_tolerance = np.select([persona == "Boomer", np.isin(persona, ["Digital Native", "Frequent Traveler"])],
+                               ["Low", "High"], pick(["Low", "Medium", "High"], n, rng)).astype(object)
+
+    return pd.DataFrame({
+        "customer_id": customer_ids,
+        "first_name": pick(identities["first_name"], n, rng),
+        "last_name": pick(identities["last_name"], n, rng),
+        "date_of_birth": to_dates(dob),
+        "age": age,
+        "gender": pick(["Male", "Female", "Other"], n, rng),
+        "email": pick(identities["email_local_part"], n, rng) + "@" + pick(identities["email_domain"], n, rng),
+        "phone": generate_phones(n, rng),
+        "address_city": city,
+        "address_state": state,
+        "address_country": "USA",
+        "marital_status": marital_status,
+        "has_children": has_children,
+        "num_dependents": num_dependents,
+        "occupation": pick(identities["occupation"], n, rng),
+        "employment_type": employment_type,
+        "income_bracket": income_bracket,
+        "home_ownership": home_ownership,
+        "segment": segment,
+        "kyc_status": pick_weighted(["Verified", "Pending", "Expired"], [0.88, 0.08, 0.04], n, rng),
+        "join_date": to_dates(join_days),
+        "preferred_channel": preferred_channel,
+        "engagement_score": engagement_score,
+        "persona_tag": persona,
+        "risk_tolerance": risk_tolerance,
+        "churn_status": is_churned,
+        "churn_date": churn_date,
+    })
+
+# --- 5. GENERATE dim_account ---
+def masked_numbers(size, rng):
+    """Masked account numbers (****1234) for `size` rows"""
+    return np.char.add("****", rng.integers(1000, 10000, size=size).astype(str)).astype(object)
+
+def product_rates(products, rng):
+    """Uniform draw between each product's interest_rate_min and interest_rate_max"""
+    low = lookup(products, {p["product_name"]: p["interest_rate_min"] for p in PRODUCTS}).astype(float)
+    high = lookup(products, {p["product_name"]: p["interest_rate_max"] for p in PRODUCTS}).astype(float)
+    return rng.uniform(low, high)
+
+def generate_accounts(df_customer, end_date, rng):
+    """
+    Columnar dim_account builder. Each product type is drawn for all eligible customers at once
+    into typed column arrays; the per-type blocks are merged into dim_account once, ordered by
+    customer and then product type (CASA, card, loan, CD, insurance, securities).
+    """
+    n = len(df_customer)
+    positions = np.arange(n)
+    customer_ids = df_customer["customer_id"].to_numpy(dtype=object)
+    persona = df_customer["persona_tag"].to_numpy(dtype=object)
+    segment = df_customer["segment"].to_numpy(dtype=object)
+    age = df_customer["age"].to_numpy()
+    income = df_customer["income_bracket"].to_numpy(dtype=object)
+    join_days = to_day_numbers(df_customer["join_date"])
+    end_day = to_day_numbers([end_date.date()])[0]
+    blocks = []
+
+    def add_block(rows, account_type, **columns):
+        blocks.append(pd.DataFrame({"_position": rows, "account_type": account_type, "status": "Active",
+                                    "account_number": masked_numbers(len(rows), rng), **columns, "currency": "USD"}))
+
+    # Get persona config for each customer
+    count_low = lookup(persona, {p: c.get("product_count_range", (1, 3))[0] for p, c in PERSONAS.items()})
+    count_high = lookup(persona, {p: c.get("product_count_range", (1, 3))[1] for p, c in PERSONAS.items()})
+    product_count_target = rng.integers(count_low.astype(int), count_high.astype(int) + 1)
+
+    # Everyone gets a CASA account - balance based on segment with realistic variance
+    balance = np.empty(n)
+    casa_product = np.empty(n, dtype=object)
+    # Mass Market: most have low balances, few have moderate savings, rare savers
+    mass = segment == "Mass Market"
+    r1, r2 = rng.random(n), rng.random(n)
+    mass_low, mass_high = np.where(r1 < 0.7, 200, np.where(r2 < 0.9, 3000, 8000)), np.where(r1 < 0.7, 3000, np.where(r2 < 0.9, 8000, 15000))
+    balance[mass] = rng.uniform(mass_low[mass], mass_high[mass])
+    casa_product[mass] = pick([p["product_name"] for p in PRODUCTS_BY_CAT["CASA"] if "Premium" not in p["product_name"]], mass.sum(), rng)
+    # Affluent: median ~36K, long tail
+    affluent = segment == "Affluent"
+    balance[affluent] = np.clip(rng.lognormal(mean=10.5, sigma=0.8, size=affluent.sum()), 5000, 200000)
+    casa_product[affluent] = pick([p["product_name"] for p in PRODUCTS_BY_CAT["CASA"]], affluent.sum(), rng)
+    # High Net Worth: median ~270K, long tail
+    hnw = ~mass & ~affluent
+    balance[hnw] = np.clip(rng.lognormal(mean=12.5, sigma=0.7, size=hnw.sum()), 50000, 2000000)
+    casa_product[hnw] = pick([p["product_name"] for p in PRODUCTS_BY_CAT["CASA"]
+                              if "Premium" in p["product_name"] or "Money Market" in p["product_name"]], hnw.sum(), rng)
+
+    add_block(positions, "CASA", product_name=casa_product, open_date=to_dates(join_days),
+              interest_rate=product_rates(casa_product, rng), average_balance=balance * 0.9,
+              current_balance=np.round(balance, 2))
+    current_product_count = np.ones(n, dtype=int)  # CASA already added
+
+    # Credit card probability and type based on persona
+    card_probability = lookup(persona, {
+        "College Student": 0.50,  # Many students don't have cards
+        "Digital Native": 0.75,
+        "Young Parent": 0.85,
+        "Frequent Traveler": 0.95,  # Almost all have cards
+        "Boomer": 0.80,
+    }, 0.70)
+    has_card = (rng.random(n) < card_probability) & (current_product_count < product_count_target + 1)
+    rows = positions[has_card]
+    k = len(rows)
+
+    # Card type probabilities (Basic, Gold, Platinum) from persona, then age/income/segment shifts
+    card_names = ["Basic Credit Card", "Gold Credit Card", "Platinum Credit Card"]
+    probs = lookup(persona[rows], {
+        "College Student": (0.80, 0.18, 0.02),
+        "Frequent Traveler": (0.05, 0.35, 0.60),
+        "Boomer": (0.15, 0.50, 0.35),
+        "Digital Native": (0.55, 0.35, 0.10),
+        "Young Parent": (0.30, 0.50, 0.20),
+    }, (0.33, 0.34, 0.33)).reshape(k, 3)
+    # Age adjustment (older = more credit history = better cards)
+    probs[age[rows] > 45] += [-0.15, 0.10, 0.05]
+    probs[age[rows] < 25] += [0.15, -0.05, -0.10]
+    # Income adjustment
+    probs[np.isin(income[rows], ["100-250K", "250K+"])] += [-0.25, 0.10, 0.15]
+    probs[income[rows] == "<25K"] += [0.20, -0.05, -0.15]
+    # Segment adjustment
+    probs[segment[rows] == "High Net Worth"] += [-0.20, 0.0, 0.20]
+    probs[segment[rows] == "Mass Market"] += [0.15, 0.0, -0.15]
+    # Normalize probabilities and select card type
+    probs = np.maximum(0.01, probs)
+    card_type = weighted_rows(probs / probs.sum(axis=1, keepdims=True), rng)
+
+    # Credit limit based on card type, then segment adjustment
+    limit = np.empty(k)
+    for type_idx, limits in enumerate([[1000, 2000, 3000, 5000], [5000, 7500, 10000, 15000],
+                                       [15000, 25000, 50000, 75000, 100000]]):
+        mask = card_type == type_idx
+        limit[mask] = np.array(limits)[rng.integers(0, len(limits), size=mask.sum())]
+    limit_mult = np.select([segment[rows] == "High Net Worth", segment[rows] == "Mass Market"],
+                           [rng.uniform(1.5, 2.5, k), rng.uniform(0.6, 1.0, k)], 1.0)
+    limit = np.floor(limit * limit_mult)
+
+    # Utilization varies - some people max out, some barely use
+    utilization_pattern = rng.random(k)
+    util_low = np.select([utilization_pattern < 0.3, utilization_pattern < 0.7], [0.0, 0.1], 0.4)
+    util_high = np.select([utilization_pattern < 0.3, utilization_pattern < 0.7], [0.1, 0.4], 0.8)
+    outstanding = rng.uniform(limit * util_low, limit * util_high)
+
+    card_product = np.array(card_names, dtype=object)[card_type]
+    add_block(rows, "Credit Card", product_name=card_product,
+              open_date=to_dates(random_days(join_days[rows], np.full(k, end_day), rng)),
+              credit_limit=limit, available_balance=np.round(limit - outstanding, 2),
+              interest_rate=product_rates(card_product, rng), outstanding_balance=np.round(outstanding, 2),
+              current_balance=np.round(outstanding, 2))
+    current_product_count += has_card
+
+    # Loans - probability based on persona and segment
+    loan_chance = lookup(persona, {
+        "College Student": 0.15,  # Only education loans
+        "Digital Native": 0.20,
+        "Young Parent": 0.55,  # High - mortgages, auto loans
+        "Frequent Traveler": 0.30,
+        "Boomer": 0.35,  # Many have paid off, some refinance
+    }, 0.25)
+    has_loan = (rng.random(n) < loan_chance) & (current_product_count < product_count_target + 2)
+    rows = positions[has_loan]
+    k = len(rows)
+    loan_product = pick([p["product_name"] for p in PRODUCTS_BY_CAT["Loans"]], k, rng)
+    mortgage_override = (persona[rows] == "Young Parent") & (rng.random(k) < 0.6)
+    loan_product[mortgage_override] = "Home Mortgage"
+    has_mortgage = np.zeros(n, dtype=bool)
+    has_mortgage[rows[mortgage_override]] = True
+
+    is_mortgage = loan_product == "Home Mortgage"
+    principal = np.where(is_mortgage, pick([200000, 300000, 400000, 500000], k, rng), pick([10000, 25000, 50000, 100000], k, rng)).astype(float)
+    term = np.where(is_mortgage, MAX_LOAN_TERM, 60)
+    months_elapsed = rng.integers(6, np.minimum(term, 36) + 1)
+    remaining = principal * (1 - months_elapsed / term * 0.8)
+
+    loan_end = np.full(k, end_day - 180)
+    loan_end = np.where(join_days[rows] >= loan_end, join_days[rows] + 30, loan_end)
+    loan_open = random_days(join_days[rows], loan_end, rng)
+    add_block(rows, "Loan", product_name=loan_product, open_date=to_dates(loan_open),
+              maturity_date=to_dates(loan_open + term * 30), principal_amount=principal,
+              interest_rate=product_rates(loan_product, rng), loan_term_months=term,
+              payoff_amount=np.round(remaining * 1.02, 2), outstanding_balance=np.round(remaining, 2),
+              current_balance=np.round(remaining, 2))
+    current_product_count += has_loan
+
+    # CDs - mostly for Boomers and HNW, rare for young people
+    cd_chance = lookup(persona, {
+        "College Student": 0.02,  # Almost never
+        "Digital Native": 0.05,
+        "Young Parent": 0.10,
+        "Frequent Traveler": 0.15,
+        "Boomer": 0.45,  # Common for retirement savings
+    }, 0.10) + np.where(segment == "High Net Worth", 0.20, 0.0)  # HNW more likely to have CDs
+    has_cd = (rng.random(n) < cd_chance) & (current_product_count < product_count_target + 2)
+    rows = positions[has_cd]
+    k = len(rows)
+    cd_product = pick([p["product_name"] for p in PRODUCTS_BY_CAT["CDs"]], k, rng)
+    cd_balance = pick([5000, 10000, 25000, 50000, 100000], k, rng).astype(float)
+    term = pick([6, 12, 24, 36, 60], k, rng).astype(int)
+    rate = product_rates(cd_product, rng)
+    cd_open = random_days(join_days[rows], np.full(k, end_day), rng)
+    add_block(rows, "CD", product_name=cd_product, open_date=to_dates(cd_open),
+              maturity_date=to_dates(cd_open + term * 30), principal_amount=cd_balance, interest_rate=rate,
+              cd_term_months=term, annual_yield=np.round(rate * 100, 2), average_balance=cd_balance,
+              tin_type=pick(["SSN", "EIN"], k, rng),
+              tin_number=np.char.add("***-**-", rng.integers(1000, 10000, size=k).astype(str)).astype(object),
+              current_balance=np.round(cd_balance * (1 + rate * term / 12 / 2), 2))
+    current_product_count += has_cd
+
+    # Insurance - varies significantly by life stage
+    insurance_chance = lookup(persona, {
+        "College Student": 0.05,  # Almost never
+        "Digital Native": 0.12,
+        "Young Parent": 0.50,  # High - protecting family
+        "Frequent Traveler": 0.35,  # Travel insurance
+        "Boomer": 0.45,  # Life insurance, property
+    }, 0.20)
+    wants_insurance = (rng.random(n) < insurance_chance) & (current_product_count < product_count_target + 2)
+    # Cross-sell signal: 40% of mortgage holders DON'T have life insurance
+    has_insurance = wants_insurance & ~(has_mortgage & (rng.random(n) < 0.4))
+    rows = positions[has_insurance]
+    k = len(rows)
+    coverage = pick([100000, 250000, 500000, 1000000], k, rng).astype(float)
+    add_block(rows, "Insurance", product_name=pick([p["product_name"] for p in PRODUCTS_BY_CAT["Insurance"]], k, rng),
+              open_date=to_dates(random_days(join_days[rows], np.full(k, end_day), rng)),
+              coverage_amount=coverage, premium_amount=np.round(coverage * 0.005 / 12, 2),
+              beneficiary_count=rng.integers(1, 4, size=k),
+              policy_status=pick(["Active", "Active", "Active", "New Business"], k, rng),
+              policy_sub_status="Premium Paying", current_balance=0.0)
+    current_product_count += has_insurance
+
+    # Securities - varies by wealth and age
+    sec_chance = lookup(persona, {
+        "College Student": 0.03,  # Almost never
+        "Digital Native": 0.15,  # Some into crypto/stocks
+        "Young Parent": 0.20,
+        "Frequent Traveler": 0.40,  # High income, investing
+        "Boomer": 0.50,  # Retirement investments
+    }, 0.15) + np.where(segment == "High Net Worth", 0.30, 0.0)  # HNW definitely investing
+    has_securities = (rng.random(n) < sec_chance) & (current_product_count < product_count_target + 2)
+    rows = positions[has_securities]
+    k = len(rows)
+    sec_product = pick([p["product_name"] for p in PRODUCTS_BY_CAT["Securities"]], k, rng)
+    units = rng.integers(10, 501, size=k)
+    purchase_price = rng.uniform(20, 200, k)
+    current_price = purchase_price * rng.uniform(0.8, 1.4, k)
+    add_block(rows, "Securities", product_name=sec_product,
+              open_date=to_dates(random_days(join_days[rows], np.full(k, end_day), rng)),
+              security_type=lookup(sec_product, {p["product_name"]: p["product_type"] for p in PRODUCTS}),
+              units_held=units, purchase_price=np.round(purchase_price, 2),
+              current_value=np.round(current_price * units, 2), current_balance=np.round(current_price * units, 2))
+
+    # Merge the per-type blocks once: customer order, then product type order (stable sort)
+    df_account = pd.concat(blocks, ignore_index=True).sort_values("_position", kind="stable", ignore_index=True)
+    df_account["account_id"] = np.arange(1, len(df_account) + 1, dtype=np.int64)
+    df_account["customer_id"] = customer_ids[df_account["_position"].to_numpy()]
+    return df_account.reindex(columns=list(TABLE_SCHEMAS["dim_account"]))
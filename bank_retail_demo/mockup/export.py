@@ -0,0 +1,328 @@
+"""
+Chunked CSV / Parquet table writers and bulk loaders for a local DuckDB / SQLite warehouse.
+Tables are written concurrently, one thread per table.
+"""
+
+import os
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # Optional - only needed for --format parquet / csv-arrow and compressed CSV
+    pa = pacsv = pq = None
+try:
+    import duckdb
+except ImportError:  # Optional - only needed for --format duckdb
+    duckdb = None
+
+from .report import stage
+from .schemas import TABLE_SCHEMAS, conform_table, restore_table, warehouse_ddl
+
+# --- EXPORT ---
+# Fact tables written as Parquet datasets partitioned by month (YYYYMM from date_key)
+PARTITIONED_TABLES = {"fact_transaction", "fact_account_snapshot", "fact_interaction"}
+# CSV file name suffix per --compression
+CSV_EXTENSIONS = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+# Formats whose tables must be written one at a time (SQLite allows a single writer per database)
+SERIAL_FORMATS = {"sqlite"}
+
+def arrow_schema(table, numeric_ids=False, dictionaries=True):
+    """Arrow schema for a table: dictionary-encoded (or plain) strings, date32 dates, bools, int64/float64 numbers"""
+    arrow_types = {
+        "str": pa.dictionary(pa.int32(), pa.string()) if dictionaries else pa.string(),
+        "id": pa.int64() if numeric_ids else pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "date": pa.date32(),
+    }
+    return pa.schema([(col, arrow_types[kind]) for col, kind in TABLE_SCHEMAS[table].items()])
+
+class ChunkedTableWriter:
+    """
+    Appends one table to disk in chunks of at least chunk_rows rows.
+    Only the unflushed buffer is held in memory. Subclasses implement write_chunk/finish.
+    With append=True the rows are added to the table already on disk. compression ("gzip" / "zstd") applies
+    to file formats. Each flush, and the final finish, is timed as an "export" stage. One writer may be used
+    from any one thread at a time.
+    """
+
+    def __init__(self, table, output_dir, chunk_rows, numeric_ids=False, append=False, compression=None):
+        self.table = table
+        self.output_dir = output_dir
+        self.chunk_rows = chunk_rows
+        self.numeric_ids = numeric_ids
+        self.append = append
+        self.compression = compression
+        self.buffer = []
+        self.buffered_rows = 0
+        self.started = append
+
+    def write(self, df):
+        if not df.empty:
+            self.buffer.append(df)
+            self.buffered_rows += len(df)
+        if self.buffered_rows >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer and self.started:
+            return
+        with stage("export") as record:
+            chunk = pd.concat(self.buffer, ignore_index=True) if self.buffer else pd.DataFrame()
+            record["rows"] = len(chunk)
+            self.write_chunk(conform_table(self.table, chunk, self.numeric_ids))
+        self.started = True
+        self.buffer = []
+        self.buffered_rows = 0
+
+    def close(self):
+        self.flush()
+        with stage("export"):
+            self.finish()
+
+    def write_chunk(self, chunk):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+class CsvTableWriter(ChunkedTableWriter):
+    """
+    Writes <table>.csv (.csv.gz / .csv.zst when compressed) with DataFrame.to_csv, header with the
+    first chunk. Each compressed chunk is its own gzip member / zstd frame, compressed by Arrow;
+    readers see one continuous stream.
+    """
+
+    def __init__(self, table, output_dir, chunk_rows, numeric_ids=False, append=False, compression=None):
+        if compression and pa is None:
+            raise SystemExit("--compression requires pyarrow (pip install pyarrow)")
+        super().__init__(table, output_dir, chunk_rows, numeric_ids, append, compression)
+        self.path = f"{output_dir}/{table}{CSV_EXTENSIONS[compression]}"
+        if not append:  # a differently compressed copy from an earlier run would shadow this one
+            for extension in CSV_EXTENSIONS.values():
+                if f"{output_dir}/{table}{extension}" != self.path and os.path.exists(f"{output_dir}/{table}{extension}"):
+                    os.remove(f"{output_dir}/{table}{extension}")
+
+    def write_chunk(self, chunk):
+        with open(self.path, "ab" if self.started else "wb") as f:
+            if self.compression is None:
+                self.write_csv(chunk, f)
+                return
+            with pa.CompressedOutputStream(f, self.compression) as sink:
+                self.write_csv(chunk, sink)
+
+    def write_csv(self, chunk, sink):
+        chunk.to_csv(sink, header=not self.started, index=False)
+
+class ArrowCsvTableWriter(CsvTableWriter):
+    """
+    --format csv-arrow: the same files formatted by Arrow's C++ CSV writer, which is several times
+    faster and releases the GIL while tables are exported concurrently. Values parse back the same,
+    but the bytes differ from --format csv: strings are quoted, booleans are true/false and whole
+    floats have no ".0".
+    """
+
+    def __init__(self, table, output_dir, chunk_rows, numeric_ids=False, append=False, compression=None):
+        if pa is None:
+            raise SystemExit("--format csv-arrow requires pyarrow (pip install pyarrow)")
+        super().__init__(table, output_dir, chunk_rows, numeric_ids, append, compression)
+
+    def write_csv(self, chunk, sink):
+        rows = pa.Table.from_pandas(chunk, preserve_index=False).cast(
+            arrow_schema(self.table, self.numeric_ids, dictionaries=False))
+        pacsv.write_csv(rows, sink, pacsv.WriteOptions(include_header=not self.started, quoting_header="none"))
+
+class ParquetTableWriter(ChunkedTableWriter):
+    """
+    Writes <table>.parquet, or a <table>/month=YYYYMM/part-N.parquet dataset for partitioned
+    fact tables. Each chunk becomes one row group per file it touches.
+    Appending adds part files to the dataset; a single-file table is rewritten with the new rows at the end.
+    """
+
+    def __init__(self, table, output_dir, chunk_rows, numeric_ids=False, append=False, compression=None):
+        if pq is None:
+            raise SystemExit("--format parquet requires pyarrow (pip install pyarrow)")
+        super().__init__(table, output_dir, chunk_rows, numeric_ids, append, compression)
+        self.codec = compression or "snappy"
+        self.schema = arrow_schema(table, numeric_ids)
+        self.partitioned = table in PARTITIONED_TABLES
+        self.writers = {}
+        self.rewrite = None  # single-file table being rewritten to <path>.tmp by an append
+        if self.partitioned and not append:
+            shutil.rmtree(f"{output_dir}/{table}", ignore_errors=True)
+
+    def open_file(self, partition):
+        if partition is None:
+            path = f"{self.output_dir}/{self.table}.parquet"
+            if not (self.append and os.path.exists(path)):
+                return pq.ParquetWriter(path, self.schema, compression=self.codec)
+            writer = pq.ParquetWriter(f"{path}.tmp", self.schema, compression=self.codec)
+            writer.write_table(pq.read_table(path).cast(self.schema))
+            self.rewrite = path
+            return writer
+        directory = f"{self.output_dir}/{self.table}/month={partition}"
+        os.makedirs(directory, exist_ok=True)
+        return pq.ParquetWriter(f"{directory}/part-{len(os.listdir(directory))}.parquet", self.schema,
+                                compression=self.codec)
+
+    def write_rows(self, partition, rows):
+        if partition not in self.writers:
+            self.writers[partition] = self.open_file(partition)
+        self.writers[partition].write_table(rows)
+
+    def write_chunk(self, chunk):
+        rows = pa.Table.from_pandas(chunk, preserve_index=False).cast(self.schema)
+        if not self.partitioned:
+            self.write_rows(None, rows)
+            return
+        months = chunk["date_key"].to_numpy() // 100
+        for month in np.unique(months):
+            self.write_rows(int(month), rows.filter(pa.array(months == month)))
+
+    def finish(self):
+        if not self.writers and not self.append:
+            # Empty table - still leave a file carrying the schema
+            if self.partitioned:
+                os.makedirs(f"{self.output_dir}/{self.table}", exist_ok=True)
+                pq.write_table(self.schema.empty_table(), f"{self.output_dir}/{self.table}/part-0.parquet",
+                               compression=self.codec)
+            else:
+                pq.write_table(self.schema.empty_table(), f"{self.output_dir}/{self.table}.parquet",
+                               compression=self.codec)
+        for writer in self.writers.values():
+            writer.close()
+        if self.rewrite:
+            os.replace(f"{self.rewrite}.tmp", self.rewrite)
+
+class WarehouseTableWriter(ChunkedTableWriter):
+    """
+    Loads a table into the star schema of a local database, <output_dir>/warehouse.<dialect>.
+    The table is (re)created from schema/<table>.sql unless appending; each chunk is one bulk insert.
+    Subclasses implement insert_chunk. compression does not apply.
+    """
+    dialect = None
+
+    def __init__(self, table, output_dir, chunk_rows, numeric_ids=False, append=False, compression=None):
+        super().__init__(table, output_dir, chunk_rows, numeric_ids, append)
+        self.connection = connect_warehouse(output_dir, self.dialect)
+        if not append:
+            self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.execute(warehouse_ddl(table, self.dialect))
+
+    def insert_chunk(self, chunk):
+        raise NotImplementedError
+
+    def write_chunk(self, chunk):
+        if len(chunk):
+            self.insert_chunk(chunk)
+
+    def finish(self):
+        self.connection.commit()
+        self.connection.close()
+
+class DuckDbTableWriter(WarehouseTableWriter):
+    """Chunks go in as Arrow tables, scanned by DuckDB in one INSERT ... SELECT"""
+    dialect = "duckdb"
+
+    def insert_chunk(self, chunk):
+        rows = pa.Table.from_pandas(chunk, preserve_index=False).cast(arrow_schema(self.table, self.numeric_ids))
+        self.connection.register("chunk_rows", rows)
+        self.connection.execute(f"INSERT INTO {self.table} BY NAME SELECT * FROM chunk_rows")
+        self.connection.unregister("chunk_rows")
+
+class SqliteTableWriter(WarehouseTableWriter):
+    """Chunks go in through one executemany per chunk, dates as ISO text"""
+    dialect = "sqlite"
+
+    def insert_chunk(self, chunk):
+        columns = []
+        for col, kind in TABLE_SCHEMAS[self.table].items():
+            if kind == "date":
+                dates = pd.to_datetime(chunk[col])
+                columns.append(np.where(dates.isna(), None, dates.dt.strftime("%Y-%m-%d")).tolist())
+            else:
+                columns.append(chunk[col].tolist())
+        placeholders = ", ".join("?" * len(columns))
+        with self.connection:
+            self.connection.executemany(f"INSERT INTO {self.table} ({', '.join(chunk.columns)}) VALUES ({placeholders})",
+                                        zip(*columns))
+
+TABLE_WRITERS = {"csv": CsvTableWriter, "csv-arrow": ArrowCsvTableWriter, "parquet": ParquetTableWriter, "duckdb": DuckDbTableWriter,
+                 "sqlite": SqliteTableWriter}
+
+def connect_warehouse(output_dir, dialect):
+    """Connection to <output_dir>/warehouse.duckdb or warehouse.sqlite, usable from an export thread"""
+    path = f"{output_dir}/warehouse.{dialect}"
+    if dialect == "sqlite":
+        return sqlite3.connect(path, check_same_thread=False)
+    if duckdb is None or pa is None:
+        raise SystemExit("--format duckdb requires duckdb and pyarrow (pip install duckdb pyarrow)")
+    return duckdb.connect(path)
+
+def read_table(table, output_dir, fmt):
+    """Read a written table back in generator form (int64 keys, date objects)"""
+    if fmt in ("duckdb", "sqlite"):
+        connection = connect_warehouse(output_dir, fmt)
+        query = f"SELECT {', '.join(TABLE_SCHEMAS[table])} FROM {table}"
+        df = connection.execute(query).df() if fmt == "duckdb" else pd.read_sql_query(query, connection)
+        connection.close()
+    elif fmt == "parquet":
+        dataset_dir = f"{output_dir}/{table}"
+        if table in PARTITIONED_TABLES and os.path.isdir(dataset_dir):
+            # month is the hive partition column, not one of the table's own
+            df = pq.read_table(dataset_dir, partitioning="hive").to_pandas().drop(columns=["month"])
+        else:
+            df = pq.read_table(f"{output_dir}/{table}.parquet").to_pandas()
+    else:
+        df = pd.read_csv(open_csv(csv_path(table, output_dir)))
+    return restore_table(table, df)
+
+def csv_path(table, output_dir):
+    """The table's .csv, .csv.gz or .csv.zst file (.csv when none exists yet)"""
+    for extension in CSV_EXTENSIONS.values():
+        if os.path.exists(f"{output_dir}/{table}{extension}"):
+            return f"{output_dir}/{table}{extension}"
+    return f"{output_dir}/{table}.csv"
+
+def open_csv(path):
+    """path for pd.read_csv, or a decompressing Arrow stream for .zst (pandas needs zstandard for that)"""
+    if path.endswith(".zst") and pa is not None:
+        return pa.input_stream(path, compression="zstd")
+    return path
+
+def write_table(table, df, output_dir, fmt, numeric_ids=False, compression=None):
+    """Write a complete in-memory table"""
+    writer = TABLE_WRITERS[fmt](table, output_dir, chunk_rows=max(len(df), 1), numeric_ids=numeric_ids,
+                                compression=compression)
+    writer.write(df)
+    writer.close()
+
+# --- CONCURRENT EXPORT ---
+# Tables go to separate files (or separate DuckDB connections), so each can be written on its own
+# thread; Arrow's CSV / Parquet writers and compressors release the GIL while they work (to_csv does not).
+def export_pool(fmt, threads=None):
+    """Thread pool for writing tables; threads=None means one per CPU"""
+    return ThreadPoolExecutor(1 if fmt in SERIAL_FORMATS else threads or os.cpu_count() or 1,
+                              thread_name_prefix="export")
+
+def run_concurrently(pool, calls):
+    """Run each (fn, *args) of calls on pool and wait for all of them; re-raises the first error"""
+    futures = [pool.submit(fn, *args) for fn, *args in calls]
+    for future in futures:
+        future.result()
+
+def write_tables(tables, output_dir, fmt, numeric_ids=False, compression=None, threads=None):
+    """
+    Write complete in-memory tables {name: DataFrame} concurrently. Largest tables start first,
+    so the export takes about as long as the largest table.
+    """
+    with export_pool(fmt, threads) as pool:
+        run_concurrently(pool, [(write_table, table, df, output_dir, fmt, numeric_ids, compression)
+                                for table, df in sorted(tables.items(), key=lambda item: -len(item[1]))])
@@ -0,0 +1,964 @@
+"""
+Fact tables: fact_transaction, fact_account_snapshot, fact_interaction and fact_loan_schedule.
+"""
+
+from datetime import datetime, timedelta
+import time
+import numpy as np
+import pandas as pd
+
+from .catalogs import (
+    PERSONAS, MERCHANTS, MERCHANTS_BY_CATEGORY, TRANSACTION_DTYPES, PURCHASE_CODES, MERCHANT_POSITIONS_BY_CATEGORY,
+    INTERACTION_REASONS, GENERAL_CATEGORIES, AMOUNT_RANGES, BIG_TRAVEL_RANGES,
+)
+from .helpers import (
+    PAYDAYS, to_dates, weighted_rows, customer_rngs, get_customer_spending_profile, round_to_realistic_amount, round_to_realistic_amounts,
+    seasonal_range,
+)
+from .report import StepTimes
+from .schemas import REFERENCE_SALARY, REFERENCE_SUBSCRIPTION, REFERENCE_PURCHASE
+
+SALARY_BY_INCOME = {"<25K": 1500, "25-50K": 3000, "50-100K": 6000, "100-250K": 12000, "250K+": 20000}
+SUBSCRIPTION_AMOUNTS = {"Netflix": 15.99, "Spotify": 9.99, "Amazon Prime": 14.99, "Disney+": 7.99,
+                        "Planet Fitness": 24.99, "Apple Music": 10.99, "Verizon": 85, "AT&T": 75,
+                        "Comcast": 120, "City Power Co": 150}
+MERCHANTS_BY_ID = {m["merchant_id"]: m for m in MERCHANTS}
+
+# Per-customer / per-account generator state each fact table leaves behind for the extend_* functions
+FACT_STATE_COLUMNS = {
+    "fact_transaction": ["customer_id", "salary_day", "salary", "subscription_merchants", "subscription_days",
+                         "spending_profile", "daily_txn_rate"],
+    "fact_account_snapshot": ["account_id", "customer_id", "balance"],
+    "fact_interaction": ["customer_id", "daily_interactions"],
+    "fact_loan_schedule": ["account_id", "customer_id", "principal", "term", "monthly_rate", "monthly_payment",
+                           "remaining", "next_payment", "next_due_month"],
+}
+# Spawn key component of each fact table's per-customer random streams (see customer_rngs)
+FACT_STREAMS = {"fact_transaction": 0, "fact_account_snapshot": 1, "fact_interaction": 2, "fact_loan_schedule": 3}
+
+def customer_streams(seed, table, *stream):
+    """customer_id -> customer_rngs() of one fact table, for tables that visit a customer's accounts out of order"""
+    rngs = {}
+
+    def rngs_of(customer_id):
+        if customer_id not in rngs:
+            rngs[customer_id] = customer_rngs(seed, customer_id, FACT_STREAMS[table], *stream)
+        return rngs[customer_id]
+    return rngs_of
+
+def transaction_calendar(df_date):
+    """
+    Per-day arrays of the calendar factors used by the transaction generators, built once from
+    dim_date and indexed by day offset from its first day (see calendar_window): date_key, month,
+    is_weekend, is_payday, seasonal multiplier range and seasonal travel chance.
+    """
+    month = df_date["month"].to_numpy()
+    day = df_date["day_of_month"].to_numpy()
+    season_low, season_high = seasonal_range(month, day)
+    return {
+        "first_date": df_date["full_date"].iloc[0],
+        "date_key": df_date["date_key"].to_numpy(),
+        "month": month,
+        "is_weekend": df_date["is_weekend"].to_numpy(dtype=bool),
+        "is_payday": np.isin(day, PAYDAYS),
+        "season_low": season_low,
+        "season_high": season_high,
+        # Seasonal travel boost (summer vacation, holidays, spring break)
+        "travel_boost": np.select([np.isin(month, [6, 7, 8]), np.isin(month, [11, 12]), month == 3],
+                                  [0.03, 0.025, 0.015], 0.0),  # summer, holiday season, spring break
+    }
+
+def calendar_window(calendar, first_date, active_end):
+    """Calendar positions of the days first_date..active_end"""
+    start = (first_date - calendar["first_date"]).days
+    return np.arange(start, start + (active_end - first_date).days + 1)
+
+def sample_transaction_offsets(on_weekend, weekend_mult, size, rng):
+    """
+    Draw `size` transaction days of a window (on_weekend flags each of its days) as day offsets
+    into the window. Each day is weighted by the persona's day-of-week bias and all draws come
+    from one cumulative distribution over the window.
+
+    The weights reproduce the old rejection loop exactly: it skipped a disfavored day
+    (weekdays for weekend-heavy personas, weekends for Boomers) with probability p and
+    retried, keeping the 10th draw regardless.
+    """
+    weights = np.ones(len(on_weekend))
+    if weekend_mult > 1.3 or weekend_mult < 0.9:
+        skip_weekend = weekend_mult < 0.9  # Boomers skip weekends, weekend-heavy personas skip weekdays
+        skip_prob = 0.45 if skip_weekend else 0.35
+        disfavored = on_weekend == skip_weekend
+        weights[disfavored] = 1 - skip_prob
+        reject = disfavored.mean() * skip_prob  # chance a single draw is rejected
+        weights = weights * (1 - reject ** 9) / (1 - reject) + reject ** 9
+    cdf = np.cumsum(weights)
+    return np.searchsorted(cdf, rng.random(size) * cdf[-1], side="right")
+
+def generate_discretionary_numpy(cust, persona, spending_profile, first_date, active_end, num_txns,
+                                 primary_account_id, card_account_id, calendar, rng):
+    """
+    Bulk version of the discretionary spend loop for one customer.
+    Draws dates, categories, merchants, amounts and payment methods as NumPy arrays
+    with the same persona, seasonal, weekend and payday behavior as the per-row loop.
+    Returns a dict of column arrays (without transaction_id / reference_kind); columns in
+    TRANSACTION_DTYPES hold category codes.
+    """
+    n = num_txns
+    p_config = PERSONAS[persona]
+    weekend_mult = p_config.get("weekend_spending_mult", 1.0)
+
+    # Dates - day-of-week weighted by persona; calendar factors are gathered per transaction
+    window = calendar_window(calendar, first_date, active_end)
+    offsets = sample_transaction_offsets(calendar["is_weekend"][window], weekend_mult, n, rng)
+    txn_dates = np.datetime64(first_date, "D") + offsets
+    days = window[offsets]
+    is_weekend = calendar["is_weekend"][days]
+
+    # Category selection - seasonal travel, persona preference, then weighted general categories
+    travel_boost = calendar["travel_boost"][days] + spending_profile["travel_boost"]
+
+    preferred_categories = p_config["spending_categories"]
+    categories = np.empty(n, dtype=object)
+    is_travel = (rng.random(n) < travel_boost) & (persona != "Frequent Traveler")
+    is_preferred = ~is_travel & (rng.random(n) < 0.45) & bool(preferred_categories)
+    is_general = ~is_travel & ~is_preferred
+    categories[is_travel] = "Travel"
+    if is_preferred.any():
+        categories[is_preferred] = np.array(preferred_categories, dtype=object)[
+            rng.integers(0, len(preferred_categories), size=is_preferred.sum())]
+
+    m = int(is_general.sum())
+    if m:
+        # Customer's category mix with +/-30% noise per transaction, one weighted pick per row
+        weights = spending_profile["category_weights"] * rng.uniform(0.7, 1.3, (m, len(GENERAL_CATEGORIES)))
+        categories[is_general] = np.array(GENERAL_CATEGORIES, dtype=object)[weighted_rows(weights, rng)]
+
+    # Merchant and base amount per category
+    merchant_pos = np.empty(n, dtype=np.int64)
+    amount = np.empty(n)
+    cat_pref = np.empty(n)
+    for category in np.unique(categories):
+        mask = categories == category
+        k = int(mask.sum())
+        merchants_in_cat = MERCHANT_POSITIONS_BY_CATEGORY.get(category, MERCHANT_POSITIONS_BY_CATEGORY["Shopping"])
+        merchant_pos[mask] = merchants_in_cat[rng.integers(0, len(merchants_in_cat), size=k)]
+        amount[mask] = rng.uniform(*AMOUNT_RANGES.get(category, (10, 100)), size=k)
+        cat_pref[mask] = spending_profile["category_preferences"].get(category, 1.0)
+
+    # Occasional BIG travel purchases (flights, hotels) - 15% of travel transactions
+    big_travel = (categories == "Travel") & (rng.random(n) < 0.15)
+    if big_travel.any():
+        ranges = np.array(BIG_TRAVEL_RANGES, dtype=float)[rng.integers(0, len(BIG_TRAVEL_RANGES), size=big_travel.sum())]
+        amount[big_travel] = rng.uniform(ranges[:, 0], ranges[:, 1])
+
+    amount *= spending_profile["overall_multiplier"] * cat_pref
+
+    amount *= rng.uniform(calendar["season_low"][days], calendar["season_high"][days])
+
+    # Weekend effect with individual variance, payday spike, segment quality
+    amount = np.where(is_weekend, amount * weekend_mult * rng.uniform(0.8, 1.2, n), amount)
+    amount = np.where(calendar["is_payday"][days], amount * rng.uniform(1.05, 1.25, n), amount)
+    amount *= spending_profile["segment_quality"]
+
+    amount = round_to_realistic_amounts(amount, rng)
+
+    use_card = (rng.random(n) < 0.5) if card_account_id else np.zeros(n, dtype=bool)
+    payment_codes = TRANSACTION_DTYPES["payment_method"].categories.get_indexer(["Credit Card", "Debit Card", "Bank Transfer"])
+    payment_method = np.where(use_card, payment_codes[0], payment_codes[1:][rng.integers(0, 2, size=n)])
+
+    return {
+        "customer_id": np.full(n, cust["customer_id"], dtype=np.int64),
+        "account_id": np.where(use_card, card_account_id, primary_account_id).astype(np.int64),
+        "merchant_id": PURCHASE_CODES["merchant_id"][merchant_pos],
+        "date_key": calendar["date_key"][days],
+        "transaction_date": txn_dates,
+        "amount": amount,
+        "transaction_type": np.full(n, TRANSACTION_DTYPES["transaction_type"].categories.get_loc("debit")),
+        "payment_method": payment_method,
+        "mcc_category": PURCHASE_CODES["mcc_category"][merchant_pos],
+        "is_recurring": np.zeros(n, dtype=bool),
+        "recurring_frequency": np.full(n, -1),  # missing
+        "counterparty_type": np.full(n, TRANSACTION_DTYPES["counterparty_type"].categories.get_loc("external")),
+        "counterparty_name": PURCHASE_CODES["counterparty_name"][merchant_pos],
+        "description": PURCHASE_CODES["description"][merchant_pos],
+        "channel": rng.integers(0, 3, size=n),  # codes of App/POS/Online
+    }
+
+def build_account_lookup(df_customer, df_account):
+    """
+    Per-customer account arrays indexed by customer position in df_customer:
+    primary CASA account id, first credit card account id (None when missing) and product count.
+    """
+    n = len(df_customer)
+    customer_pos = pd.Index(df_customer["customer_id"]).get_indexer(df_account["customer_id"])
+    account_ids = df_account["account_id"].to_numpy(dtype=object)
+    account_types = df_account["account_type"].to_numpy(dtype=object)
+
+    def first_account_of(account_type):
+        ids = np.full(n, None, dtype=object)
+        is_type = account_types == account_type
+        positions, first = np.unique(customer_pos[is_type], return_index=True)
+        ids[positions] = account_ids[is_type][first]
+        return ids
+
+    return {
+        "primary_account_id": first_account_of("CASA"),
+        "card_account_id": first_account_of("Credit Card"),
+        "product_count": np.bincount(customer_pos, minlength=n),
+    }
+
+def active_end_date(churn_date, end_date):
+    """Last active day of a customer: churn date, or end_date for customers who stay"""
+    active_end = churn_date if churn_date else end_date.date()
+    if isinstance(active_end, datetime):
+        active_end = active_end.date()
+    return active_end
+
+def first_month_start(day):
+    """First 1st-of-month on or after `day`, as a datetime"""
+    month_start = datetime(day.year, day.month, 1)
+    if month_start.date() < day:
+        month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return month_start
+
+# --- 6. GENERATE fact_transaction ---
+def salary_transactions(c_id, account_id, salary_day, salary, first_date, active_end, txn_counter, rand):
+    """Monthly salary credits for pay dates in [first_date, active_end), numbered from txn_counter"""
+    transactions = []
+    current_month = datetime(first_date.year, first_date.month, 1)
+    while current_month.date() < active_end:
+        pay_date = current_month.replace(day=min(salary_day, 28))
+        if first_date <= pay_date.date() < active_end:
+            transactions.append({
+                "transaction_id": txn_counter + len(transactions),
+                "customer_id": c_id,
+                "account_id": account_id,
+                "merchant_id": "MERCH-100",
+                "date_key": int(pay_date.strftime("%Y%m%d")),
+                "transaction_date": pay_date,
+                "amount": round(salary + rand.uniform(-100, 100), 2),
+                "transaction_type": "credit",
+                "payment_method": "Bank Transfer",
+                "mcc_category": "Income",
+                "is_recurring": True,
+                "recurring_frequency": "monthly",
+                "counterparty_type": "external",
+                "counterparty_name": "Employer",
+                "description": "Direct Deposit - Salary",
+                "channel": "Online",
+                "reference_kind": REFERENCE_SALARY,
+            })
+        current_month = (current_month.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return transactions
+
+def subscription_transactions(c_id, primary_account_id, card_account_id, sub, sub_day, first_date, active_end,
+                              txn_counter, rand):
+    """Monthly charges of subscription merchant `sub` for dates in [first_date, active_end), numbered from txn_counter"""
+    transactions = []
+    sub_amount = SUBSCRIPTION_AMOUNTS.get(sub["merchant_name"], 20)
+    current_month = datetime(first_date.year, first_date.month, 1)
+    while current_month.date() < active_end:
+        sub_date = current_month.replace(day=sub_day)
+        if first_date <= sub_date.date() < active_end:
+            use_card = card_account_id is not None and rand.random() < 0.6
+            account_id = card_account_id if use_card else primary_account_id
+
+            transactions.append({
+                "transaction_id": txn_counter + len(transactions),
+                "customer_id": c_id,
+                "account_id": account_id,
+                "merchant_id": sub["merchant_id"],
+                "date_key": int(sub_date.strftime("%Y%m%d")),
+                "transaction_date": sub_date,
+                "amount": round(sub_amount, 2),
+                "transaction_type": "debit",
+                "payment_method": "Credit Card" if use_card else "Direct Debit",
+                "mcc_category": sub["mcc_category"],
+                "is_recurring": True,
+                "recurring_frequency": "monthly",
+                "counterparty_type": "external",
+                "counterparty_name": sub["merchant_name"],
+                "description": f"{sub['merchant_name']} Monthly",
+                "channel": "Online",
+                "reference_kind": REFERENCE_SUBSCRIPTION,
+            })
+        current_month = (current_month.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return transactions
+
+def generate_discretionary_python(cust, persona, spending_profile, first_date, active_end, num_txns,
+                                  primary_account_id, card_account_id, txn_counter, calendar, rng, rand):
+    """
+    Per-row reference version of the discretionary spend for one customer over [first_date, active_end].
+    Returns transaction records numbered from txn_counter.
+    """
+    transactions = []
+    p_config = PERSONAS[persona]
+    preferred_categories = p_config["spending_categories"]
+    weekend_mult = p_config.get("weekend_spending_mult", 1.0)
+
+    # Dates with day-of-week bias based on persona, drawn for all of the customer's transactions at once
+    window = calendar_window(calendar, first_date, active_end)
+    txn_offsets = sample_transaction_offsets(calendar["is_weekend"][window], weekend_mult, num_txns, rng)
+
+    # General categories everyone uses, drawn for every row at once from the customer's category
+    # mix with +/-30% noise per transaction; a row uses its draw unless it goes to travel or the persona
+    general_categories = np.array(GENERAL_CATEGORIES, dtype=object)[weighted_rows(
+        spending_profile["category_weights"] * rng.uniform(0.7, 1.3, (num_txns, len(GENERAL_CATEGORIES))), rng)]
+
+    for txn_offset, general_category in zip(txn_offsets, general_categories):
+        txn_datetime = datetime.combine(first_date, datetime.min.time()) + timedelta(days=int(txn_offset))
+        day = window[txn_offset]
+        is_weekend = calendar["is_weekend"][day]
+
+        # Category selection - mix of persona preference and general spending
+        # Everyone travels sometimes (vacations, business), not just Frequent Travelers
+        # Seasonal travel boost from the calendar plus the customer's age/wealth boost
+        # Much lower rates - travel is occasional, not frequent
+        travel_boost = float(calendar["travel_boost"][day]) + spending_profile["travel_boost"]
+
+        # Random travel decision - only for non-Travelers
+        if rand.random() < travel_boost and persona != "Frequent Traveler":
+            category = "Travel"
+        elif rand.random() < 0.45 and preferred_categories:  # Reduced to 45% persona preference
+            category = rand.choice(preferred_categories)
+        else:
+            category = general_category
+
+        merchants_in_cat = MERCHANTS_BY_CATEGORY.get(category, MERCHANTS_BY_CATEGORY["Shopping"])
+        merchant = rand.choice(merchants_in_cat)
+
+        amt_range = AMOUNT_RANGES.get(category, (10, 100))
+        amount = rand.uniform(*amt_range)
+
+        # Occasional BIG travel purchases (flights, hotels) - 15% of travel transactions
+        if category == "Travel" and rand.random() < 0.15:
+            # Big travel: flight ($200-800), hotel stay ($150-500)
+            amount = rand.choice([rand.uniform(low, high) for low, high in BIG_TRAVEL_RANGES])
+
+        # Apply individual spending profile multiplier
+        amount *= spending_profile["overall_multiplier"]
+
+        # Apply category preference if exists
+        cat_pref = spending_profile["category_preferences"].get(category, 1.0)
+        amount *= cat_pref
+
+        # Apply seasonal multiplier
+        amount *= rand.uniform(float(calendar["season_low"][day]), float(calendar["season_high"][day]))
+
+        # Weekend effect - but with individual variance
+        if is_weekend:
+            weekend_effect = weekend_mult * rand.uniform(0.8, 1.2)  # Add noise to weekend mult
+            amount *= weekend_effect
+
+        # Payday spike - people spend more right after payday
+        if calendar["is_payday"][day]:
+            amount *= rand.uniform(1.05, 1.25)  # Reduced from 1.1-1.4
+
+        # Segment quality multiplier (HNW buys premium, Mass Market buys budget)
+        amount *= spending_profile["segment_quality"]
+
+        # Round to realistic amount
+        amount = round_to_realistic_amount(amount, rand)
+
+        use_card = card_account_id is not None and rand.random() < 0.5
+        account_id = card_account_id if use_card else primary_account_id
+
+        transactions.append({
+            "transaction_id": txn_counter + len(transactions),
+            "customer_id": cust["customer_id"],
+            "account_id": account_id,
+            "merchant_id": merchant["merchant_id"],
+            "date_key": int(calendar["date_key"][day]),
+            "transaction_date": txn_datetime,
+            "amount": amount,
+            "transaction_type": "debit",
+            "payment_method": "Credit Card" if use_card else rand.choice(["Debit Card", "Bank Transfer"]),
+            "mcc_category": merchant["mcc_category"],
+            "is_recurring": False,
+            "recurring_frequency": None,
+            "counterparty_type": "external",
+            "counterparty_name": merchant["merchant_name"],
+            "description": f"Purchase at {merchant['merchant_name']}",
+            "channel": rand.choice(["App", "POS", "Online"]),
+            "reference_kind": REFERENCE_PURCHASE,
+        })
+    return transactions
+
+def add_discretionary(engine, transactions, numpy_txn_parts, txn_counter, cust, spending_profile, first_date,
+                      active_end, num_txns, primary_account_id, card_account_id, calendar, rng, rand):
+    """
+    Generate one customer's discretionary spend with the chosen engine: records are appended to
+    transactions (python) or a column dict to numpy_txn_parts (numpy). Returns the next txn_counter.
+    """
+    persona = cust["persona_tag"]
+    if engine == "numpy":
+        if num_txns > 0:
+            columns = generate_discretionary_numpy(
+                cust, persona, spending_profile, first_date, active_end, num_txns,
+                primary_account_id, card_account_id, calendar, rng,
+            )
+            numpy_txn_parts.append({
+                "transaction_id": np.arange(txn_counter, txn_counter + num_txns),
+                **columns,
+                "reference_kind": np.full(num_txns, REFERENCE_PURCHASE, dtype=np.int8),
+            })
+        return txn_counter + num_txns
+
+    transactions.extend(generate_discretionary_python(
+        cust, persona, spending_profile, first_date, active_end, num_txns,
+        primary_account_id, card_account_id, txn_counter, calendar, rng, rand,
+    ))
+    return txn_counter + num_txns
+
+def transaction_frame(transactions, numpy_txn_parts):
+    """fact_transaction from per-row records plus numpy engine column parts, in transaction_id order"""
+    df_transaction = pd.DataFrame(transactions)
+    if not df_transaction.empty:
+        df_transaction = df_transaction.astype(TRANSACTION_DTYPES)
+    if numpy_txn_parts:
+        df_numpy_txn = pd.DataFrame({col: np.concatenate([part[col] for part in numpy_txn_parts]) for col in numpy_txn_parts[0]})
+        for col, dtype in TRANSACTION_DTYPES.items():
+            df_numpy_txn[col] = pd.Categorical.from_codes(df_numpy_txn[col], dtype=dtype)
+        # Interleave with salary/subscription rows back into per-customer transaction_id order
+        df_transaction = pd.concat([df_transaction, df_numpy_txn], ignore_index=True)
+        df_transaction = df_transaction.sort_values("transaction_id", kind="stable", ignore_index=True)
+    return df_transaction
+
+def generate_transactions(df_customer, df_account, engine, end_date, seed, calendar):
+    """
+    fact_transaction over each customer's tenure up to end_date, each customer drawing from its own streams.
+    calendar is transaction_calendar() of a dim_date covering the tenures.
+    Returns (df_transaction, state): state holds the per-customer draws that
+    extend_transactions() continues from (salary, subscriptions, spending profile, daily rate).
+    The salary, subscription and discretionary parts are timed as sub-steps of the run report.
+    """
+    transactions = []
+    numpy_txn_parts = []  # column arrays from the numpy engine, one dict per customer
+    customer_state = []
+    txn_counter = 1
+    steps = StepTimes("fact_transaction")
+
+    # Create account lookup
+    account_lookup = build_account_lookup(df_customer, df_account)
+
+    for cust_pos, (_, cust) in enumerate(df_customer.iterrows()):
+        c_id = cust["customer_id"]
+        persona = cust["persona_tag"]
+        join_date = cust["join_date"]
+        active_end = active_end_date(cust["churn_date"], end_date)
+
+        days_active = (active_end - join_date).days
+        if days_active < 1:
+            continue
+
+        # Get customer's CASA account for transactions
+        primary_account_id = account_lookup["primary_account_id"][cust_pos]
+        card_account_id = account_lookup["card_account_id"][cust_pos]
+
+        if primary_account_id is None:
+            continue
+        rng, rand = customer_rngs(seed, c_id, FACT_STREAMS["fact_transaction"])
+        clock, lap_start = time.perf_counter(), txn_counter
+
+        # Generate salary credits (1st or 15th of month)
+        salary_day, salary = 0, 0
+        if cust["employment_type"] == "Salaried":
+            salary_day = rand.choice([1, 15])
+            salary = SALARY_BY_INCOME.get(cust["income_bracket"], 4000)
+            records = salary_transactions(c_id, primary_account_id, salary_day, salary, join_date, active_end, txn_counter,
+                                          rand)
+            transactions.extend(records)
+            txn_counter += len(records)
+        clock, lap_start = steps.lap("salary", clock, txn_counter - lap_start), txn_counter
+
+        # Generate subscription transactions (monthly recurring)
+        subscriptions = rand.sample(
+            [m for m in MERCHANTS if m["is_subscription_merchant"]],
+            k=rand.randint(1, 4)
+        )
+        subscription_days = []
+        for sub in subscriptions:
+            sub_day = rand.randint(1, 28)
+            subscription_days.append(sub_day)
+            records = subscription_transactions(c_id, primary_account_id, card_account_id, sub, sub_day,
+                                                join_date, active_end, txn_counter, rand)
+            transactions.extend(records)
+            txn_counter += len(records)
+        clock, lap_start = steps.lap("subscriptions", clock, txn_counter - lap_start), txn_counter
+
+        # Generate regular spending transactions (persona-driven with individual variance)
+        # Get unique spending profile for this customer
+        spending_profile = get_customer_spending_profile(cust, persona, rand)
+
+        # Variable transaction frequency - not uniform
+        # Spending personality affects frequency too (big spenders shop more often)
+        base_txns = int(days_active / 2.5)
+        freq_mult = 0.7 + (spending_profile["spending_personality"] - 1.0) * 0.3  # personality affects freq
+        activity = rand.uniform(0.6, 1.5)
+        num_txns = int(base_txns * activity * freq_mult)
+        txn_counter = add_discretionary(engine, transactions, numpy_txn_parts, txn_counter, cust, spending_profile,
+                                        join_date, active_end, num_txns, primary_account_id, card_account_id, calendar,
+                                        rng, rand)
+        steps.lap("discretionary", clock, txn_counter - lap_start)
+
+        customer_state.append({
+            "customer_id": c_id,
+            "salary_day": salary_day,
+            "salary": salary,
+            "subscription_merchants": [sub["merchant_id"] for sub in subscriptions],
+            "subscription_days": subscription_days,
+            "spending_profile": spending_profile,
+            "daily_txn_rate": activity * freq_mult / 2.5,
+        })
+
+    state = pd.DataFrame(customer_state, columns=FACT_STATE_COLUMNS["fact_transaction"])
+    clock = time.perf_counter()
+    df_transaction = transaction_frame(transactions, numpy_txn_parts)
+    steps.lap("frame", clock, len(df_transaction))
+    steps.record()
+    return df_transaction, state
+
+def extend_transactions(df_customer, df_account, state, engine, previous_end, end_date, seed, calendar):
+    """
+    fact_transaction for the days after previous_end up to end_date, continuing each customer's
+    salary, subscriptions and spending profile from state. The discretionary count for the window
+    is Poisson around the customer's daily rate. Customer streams are keyed by previous_end too,
+    so each appended window draws fresh numbers. Returns (df_transaction, state).
+    """
+    transactions = []
+    numpy_txn_parts = []
+    txn_counter = 1
+    account_lookup = build_account_lookup(df_customer, df_account)
+    customer_state = dict(zip(state["customer_id"], state.to_dict("records")))
+    first_spend_date = previous_end + timedelta(days=1)
+    steps = StepTimes("fact_transaction")
+
+    for cust_pos, (_, cust) in enumerate(df_customer.iterrows()):
+        c_id = cust["customer_id"]
+        params = customer_state.get(c_id)
+        active_end = active_end_date(cust["churn_date"], end_date)
+        if params is None or active_end <= previous_end:
+            continue
+        primary_account_id = account_lookup["primary_account_id"][cust_pos]
+        card_account_id = account_lookup["card_account_id"][cust_pos]
+        rng, rand = customer_rngs(seed, c_id, FACT_STREAMS["fact_transaction"], previous_end.toordinal())
+        clock, lap_start = time.perf_counter(), txn_counter
+
+        # Recurring series cover [start, active_end), so the previous run stopped just before previous_end
+        if params["salary_day"]:
+            records = salary_transactions(c_id, primary_account_id, params["salary_day"], params["salary"],
+                                          previous_end, active_end, txn_counter, rand)
+            transactions.extend(records)
+            txn_counter += len(records)
+        clock, lap_start = steps.lap("salary", clock, txn_counter - lap_start), txn_counter
+        for merchant_id, sub_day in zip(params["subscription_merchants"], params["subscription_days"]):
+            records = subscription_transactions(c_id, primary_account_id, card_account_id, MERCHANTS_BY_ID[merchant_id],
+                                                sub_day, previous_end, active_end, txn_counter, rand)
+            transactions.extend(records)
+            txn_counter += len(records)
+        clock, lap_start = steps.lap("subscriptions", clock, txn_counter - lap_start), txn_counter
+
+        num_txns = int(rng.poisson(params["daily_txn_rate"] * (active_end - previous_end).days))
+        txn_counter = add_discretionary(engine, transactions, numpy_txn_parts, txn_counter, cust,
+                                        params["spending_profile"], first_spend_date, active_end, num_txns,
+                                        primary_account_id, card_account_id, calendar, rng, rand)
+        steps.lap("discretionary", clock, txn_counter - lap_start)
+
+    clock = time.perf_counter()
+    df_transaction = transaction_frame(transactions, numpy_txn_parts)
+    steps.lap("frame", clock, len(df_transaction))
+    steps.record()
+    return df_transaction, state
+
+# --- 7. GENERATE fact_account_snapshot ---
+def account_snapshots(acc_id, c_id, account_type, credit_limit, principal_amount, interest_rate, product_count,
+                      balance, current, active_end, end_date, snapshot_counter, rand):
+    """
+    Month-start snapshots of one account from the month starting at `current` while before
+    active_end and end_date. Returns the records and the last simulated balance.
+    """
+    snapshots = []
+    while current.date() < active_end and current.date() <= end_date.date():
+        # Simulate balance changes
+        if account_type == "CASA":
+            change = rand.uniform(-0.05, 0.08)
+            balance = max(0, balance * (1 + change))
+        elif account_type == "Credit Card":
+            balance = rand.uniform(0, credit_limit * 0.7)
+        elif account_type == "Loan":
+            # Gradual paydown
+            balance = max(0, balance * 0.98)
+
+        snapshot_date = current.date()
+        date_key = int(current.strftime("%Y%m%d"))
+
+        snapshots.append({
+            "snapshot_id": snapshot_counter + len(snapshots),
+            "account_id": acc_id,
+            "customer_id": c_id,
+            "date_key": date_key,
+            "snapshot_date": snapshot_date,
+            "balance": round(balance, 2),
+            "month_avg_balance": round(balance * 0.95, 2),
+            "month_end_balance": round(balance, 2),
+            "available_credit": round(credit_limit - balance, 2) if account_type == "Credit Card" else None,
+            "credit_utilization_pct": round(balance / credit_limit * 100, 1) if account_type == "Credit Card" and credit_limit else None,
+            "principal_paid": round((principal_amount or 0) - balance, 2) if account_type == "Loan" else None,
+            "principal_remaining": round(balance, 2) if account_type == "Loan" else None,
+            "interest_accrued": round(balance * (interest_rate or 0) / 12, 2) if account_type == "Loan" else None,
+            "total_credits_mtd": round(rand.uniform(1000, 10000), 2) if account_type == "CASA" else None,
+            "total_debits_mtd": round(rand.uniform(800, 9000), 2) if account_type == "CASA" else None,
+            "net_cash_flow_mtd": None,
+            "customer_product_count": int(product_count),
+        })
+
+        current = (current + timedelta(days=32)).replace(day=1)
+    return snapshots, balance
+
+def snapshot_frame(snapshots):
+    df_snapshot = pd.DataFrame(snapshots)
+    if not df_snapshot.empty and "total_credits_mtd" in df_snapshot.columns:
+        df_snapshot["net_cash_flow_mtd"] = df_snapshot["total_credits_mtd"].fillna(0) - df_snapshot["total_debits_mtd"].fillna(0)
+    return df_snapshot
+
+def snapshot_inputs(df_customer, df_account):
+    """Each account's snapshot columns zipped with its customer's churn_date and product count"""
+    # Customer index: each account's churn_date and product count are gathered by customer
+    # position instead of scanning df_customer / df_account once per account
+    customer_pos = pd.Index(df_customer["customer_id"]).get_indexer(df_account["customer_id"])
+    account_churn_dates = df_customer["churn_date"].to_numpy(dtype=object)[customer_pos]
+    account_product_counts = build_account_lookup(df_customer, df_account)["product_count"][customer_pos]
+    account_columns = ["account_id", "customer_id", "account_type", "open_date", "current_balance",
+                       "credit_limit", "principal_amount", "interest_rate"]
+    return zip(df_account[account_columns].itertuples(index=False, name=None), account_churn_dates,
+               account_product_counts)
+
+def generate_snapshots(df_customer, df_account, end_date, seed):
+    """
+    Monthly fact_account_snapshot rows from each account's open month up to end_date.
+    Returns (df_snapshot, state) with each account's last simulated balance.
+    """
+    snapshots = []
+    account_state = []
+    snapshot_counter = 1
+    rngs_of = customer_streams(seed, "fact_account_snapshot")
+
+    # Columnar pass over accounts
+    for (acc_id, c_id, account_type, open_date, current_balance, credit_limit, principal_amount,
+         interest_rate), churn_date, product_count in snapshot_inputs(df_customer, df_account):
+        if isinstance(open_date, str):
+            open_date = datetime.strptime(open_date, "%Y-%m-%d").date()
+
+        active_end = active_end_date(churn_date, end_date)
+
+        # Monthly snapshots
+        records, balance = account_snapshots(acc_id, c_id, account_type, credit_limit, principal_amount, interest_rate,
+                                             product_count, current_balance or 0,
+                                             datetime(open_date.year, open_date.month, 1), active_end, end_date,
+                                             snapshot_counter, rngs_of(c_id)[1])
+        snapshots.extend(records)
+        snapshot_counter += len(records)
+        account_state.append({"account_id": acc_id, "customer_id": c_id, "balance": balance})
+
+    state = pd.DataFrame(account_state, columns=FACT_STATE_COLUMNS["fact_account_snapshot"])
+    return snapshot_frame(snapshots), state
+
+def extend_snapshots(df_customer, df_account, state, previous_end, end_date, seed):
+    """
+    Snapshots for the month starts after the previous run, continuing each account's balance
+    from state. Returns (df_snapshot, updated state).
+    """
+    snapshots = []
+    snapshot_counter = 1
+    balances = dict(zip(state["account_id"], state["balance"]))
+    rngs_of = customer_streams(seed, "fact_account_snapshot", previous_end.toordinal())
+    # The previous run covered month starts before previous_end
+    first_month = first_month_start(previous_end)
+
+    for (acc_id, c_id, account_type, open_date, current_balance, credit_limit, principal_amount,
+         interest_rate), churn_date, product_count in snapshot_inputs(df_customer, df_account):
+        active_end = active_end_date(churn_date, end_date)
+        if acc_id not in balances or active_end <= previous_end:
+            continue
+        records, balances[acc_id] = account_snapshots(acc_id, c_id, account_type, credit_limit, principal_amount,
+                                                      interest_rate, product_count, balances[acc_id], first_month,
+                                                      active_end, end_date, snapshot_counter, rngs_of(c_id)[1])
+        snapshots.extend(records)
+        snapshot_counter += len(records)
+
+    state = state.assign(balance=state["account_id"].map(balances))
+    return snapshot_frame(snapshots), state
+
+# --- 8. GENERATE fact_interaction ---
+def customer_interactions(cust, first_date, active_end, num_interactions, int_counter, rand):
+    """num_interactions contact-center / app interactions of one customer in [first_date, active_end]"""
+    interactions = []
+    churn_date = cust["churn_date"]
+
+    # Get persona-specific channel preferences
+    preferred_channels = PERSONAS[cust["persona_tag"]].get("preferred_channels", ["App", "Call Center", "Branch", "Chatbot"])
+
+    for _ in range(num_interactions):
+        int_date = first_date + timedelta(days=rand.randint(0, (active_end - first_date).days))
+
+        # Sentiment drops before churn - more gradual decline
+        sentiment = rand.uniform(0.55, 1.0)
+        if cust["churn_status"] and churn_date:
+            days_to_churn = (churn_date - int_date).days
+            if days_to_churn < 14:
+                sentiment = rand.uniform(0.05, 0.35)
+            elif days_to_churn < 30:
+                sentiment = rand.uniform(0.15, 0.45)
+            elif days_to_churn < 60:
+                sentiment = rand.uniform(0.25, 0.55)
+            elif days_to_churn < 90:
+                sentiment = rand.uniform(0.35, 0.65)
+
+        # Use persona-preferred channels
+        channel = rand.choice(preferred_channels)
+
+        # Duration varies by channel
+        if channel == "Branch":
+            duration = rand.randint(10, 45)
+        elif channel == "Call Center":
+            duration = rand.randint(5, 30)
+        elif channel == "App":
+            duration = rand.randint(1, 10)
+        else:  # Chatbot
+            duration = rand.randint(2, 15)
+
+        interactions.append({
+            "interaction_id": int_counter + len(interactions),
+            "customer_id": cust["customer_id"],
+            "date_key": int(datetime.combine(int_date, datetime.min.time()).strftime("%Y%m%d")),
+            "interaction_date": int_date,
+            "channel": channel,
+            "interaction_type": rand.choice(["Inquiry", "Inquiry", "Complaint", "Request", "Feedback"]),
+            "reason": rand.choice(INTERACTION_REASONS),
+            "sentiment_score": round(sentiment, 2),
+            "resolution_status": rand.choices(["Resolved", "Pending", "Escalated"], weights=[0.75, 0.15, 0.10])[0],
+            "duration_minutes": duration,
+        })
+    return interactions
+
+def generate_interactions(df_customer, end_date, seed):
+    """
+    fact_interaction over each customer's tenure up to end_date.
+    Returns (df_interaction, state) with each customer's interactions per active day.
+    """
+    interactions = []
+    customer_state = []
+    int_counter = 1
+
+    for _, cust in df_customer.iterrows():
+        join_date = cust["join_date"]
+        active_end = active_end_date(cust["churn_date"], end_date)
+
+        days_active = (active_end - join_date).days
+        if days_active < 1:
+            continue
+        _, rand = customer_rngs(seed, cust["customer_id"], FACT_STREAMS["fact_interaction"])
+
+        # Variable interactions based on engagement with noise
+        base_interactions = max(1, int(cust["engagement_score"] / 10))
+        num_interactions = int(base_interactions * rand.uniform(0.6, 1.5))
+        num_interactions = max(1, num_interactions)
+
+        records = customer_interactions(cust, join_date, active_end, num_interactions, int_counter, rand)
+        interactions.extend(records)
+        int_counter += len(records)
+        customer_state.append({"customer_id": cust["customer_id"], "daily_interactions": num_interactions / days_active})
+
+    state = pd.DataFrame(customer_state, columns=FACT_STATE_COLUMNS["fact_interaction"])
+    return pd.DataFrame(interactions), state
+
+def extend_interactions(df_customer, state, previous_end, end_date, seed):
+    """
+    Interactions for the days after previous_end up to end_date: a Poisson count per customer
+    at the pace the customer kept so far (from state). Returns (df_interaction, state).
+    """
+    interactions = []
+    int_counter = 1
+    daily_interactions = dict(zip(state["customer_id"], state["daily_interactions"]))
+    first_date = previous_end + timedelta(days=1)
+
+    for _, cust in df_customer.iterrows():
+        rate = daily_interactions.get(cust["customer_id"])
+        active_end = active_end_date(cust["churn_date"], end_date)
+        if rate is None or active_end <= previous_end:
+            continue
+        rng, rand = customer_rngs(seed, cust["customer_id"], FACT_STREAMS["fact_interaction"], previous_end.toordinal())
+        num_interactions = int(rng.poisson(rate * (active_end - previous_end).days))
+        records = customer_interactions(cust, first_date, active_end, num_interactions, int_counter, rand)
+        interactions.extend(records)
+        int_counter += len(records)
+
+    return pd.DataFrame(interactions), state
+
+# --- 9. GENERATE fact_loan_schedule ---
+LOAN_STATUSES = np.array(["Paid", "Overdue", "Prepaid", "Scheduled"], dtype=object)
+PAID, OVERDUE, PREPAID, SCHEDULED = range(len(LOAN_STATUSES))
+OVERDUE_CHANCE, PREPAID_CHANCE = 0.03, 0.02  # for payments already due; the rest are Paid
+
+def amortize(loans, end_date, horizon, rngs_of):
+    """
+    Amortization schedules of all loans at once, on a (loan, payment) grid, continuing each loan
+    from its state row (remaining balance, next payment number and that payment's due month).
+    Rows run to maturity, or while the due month is at most `horizon` months past end_date.
+    Payments due more than 30 days before end_date are Paid, Overdue or Prepaid (with extra
+    principal), later ones Scheduled. Prepayments shorten the loan: the payment stays the same,
+    the last one only covers what is left and no rows follow the payoff.
+    rngs_of maps customer_id to that customer's random streams. Returns (df_loan_schedule, state).
+    """
+    n = len(loans)
+    term = loans["term"].to_numpy().astype(int)
+    rate = loans["monthly_rate"].to_numpy(dtype=float)[:, None]
+    payment = loans["monthly_payment"].to_numpy(dtype=float)[:, None]
+    start_balance = loans["remaining"].to_numpy(dtype=float)
+    next_payment = loans["next_payment"].to_numpy().astype(int)
+    first_month = np.array(loans["next_due_month"].tolist(), dtype="datetime64[M]").reshape(n)
+
+    count = np.maximum(term - next_payment + 1, 0)
+    if horizon is not None:
+        last_month = np.datetime64(end_date.date(), "M") + horizon
+        count = np.minimum(count, np.maximum((last_month - first_month).astype(int) + 1, 0))
+    width = int(count.max()) if n else 0
+    k = np.arange(width)
+    due_month = first_month[:, None] + k
+    due = due_month.astype("datetime64[D]") + 14  # due on the 15th
+
+    # Status, payment-day and prepayment draws: one batch per loan from its customer's stream
+    draws = np.zeros((n, width, 3))
+    for i, (c_id, rows) in enumerate(zip(loans["customer_id"], count)):
+        draws[i, :rows] = rngs_of(c_id)[0].random((rows, 3))
+    status = np.select(
+        [due >= np.datetime64(end_date.date() - timedelta(days=30)),
+         draws[..., 0] < OVERDUE_CHANCE, draws[..., 0] < OVERDUE_CHANCE + PREPAID_CHANCE],
+        [SCHEDULED, OVERDUE, PREPAID], PAID,
+    )
+    extra = np.where(status == PREPAID, 500 + 4500 * draws[..., 2], 0.0)
+
+    # Balance after each payment in closed form: b_k = g^k * (b_0 - sum_j<=k extra_j / g^j) - payment * (g^k - 1) / rate
+    growth = (1 + rate) ** (k + 1)
+    annuity = np.where(rate > 0, (growth - 1) / np.where(rate > 0, rate, 1), k + 1)
+    balance = growth * (start_balance[:, None] - np.cumsum(extra / growth, axis=1)) - payment * annuity
+
+    # Payoff truncation: the first payment that clears the balance is the last row
+    # (a sentinel column makes loans not paid off in the grid come out as `width`)
+    payoff = np.concatenate([balance <= 0.005, np.ones((n, 1), dtype=bool)], axis=1).argmax(axis=1)
+    in_schedule = (k < count[:, None]) & (k <= payoff[:, None])
+    before = np.concatenate([start_balance[:, None], balance], axis=1)[:, :width]
+    interest = before * rate
+    principal = np.minimum(payment - interest, before)
+    extra = np.minimum(extra, before - principal)
+    balance = np.maximum(balance, 0)
+
+    days_past_due = np.where(status == OVERDUE, 1 + np.floor(draws[..., 1] * 30), 0).astype(int)
+    days_early = np.select([status == PAID, status == PREPAID],
+                           [np.floor(draws[..., 1] * 6), 5 + np.floor(draws[..., 1] * 11)], 0).astype(int)
+    actual_date = due - days_early + days_past_due
+
+    loan_pos, payment_pos = np.nonzero(in_schedule)
+    scheduled = status[in_schedule] == SCHEDULED
+    payment_due = (principal + interest)[in_schedule]
+    rows_due_month = due_month[in_schedule]
+    df_loan_schedule = pd.DataFrame({
+        "schedule_id": np.arange(1, len(loan_pos) + 1),
+        "account_id": loans["account_id"].to_numpy()[loan_pos],
+        "customer_id": loans["customer_id"].to_numpy()[loan_pos],
+        "date_key": ((rows_due_month.astype("datetime64[Y]").astype(int) + 1970) * 10000
+                     + (rows_due_month.astype(int) % 12 + 1) * 100 + 15),
+        "due_date": to_dates(due[in_schedule]),
+        "payment_number": next_payment[loan_pos] + payment_pos,
+        "total_payments": term[loan_pos],
+        "payment_due": np.round(payment_due, 2),
+        "principal_portion": np.round(principal[in_schedule], 2),
+        "interest_portion": np.round(interest[in_schedule], 2),
+        "payment_status": LOAN_STATUSES[status[in_schedule]],
+        "actual_payment_date": np.where(scheduled, None, to_dates(actual_date[in_schedule])),
+        "actual_amount_paid": np.where(scheduled, np.nan, np.round(payment_due + extra[in_schedule], 2)),
+        "extra_principal_paid": np.round(extra[in_schedule], 2),
+        "days_past_due": days_past_due[in_schedule],
+        "late_fee_charged": np.where(days_past_due[in_schedule] > 0, 25, 0),
+        "cumulative_principal_paid": np.round(loans["principal"].to_numpy(dtype=float)[loan_pos] - balance[in_schedule], 2),
+        "remaining_balance": np.round(balance[in_schedule], 2),
+    })
+
+    # State: continue after the last written row; a paid-off loan has no payments left
+    written = in_schedule.sum(axis=1)
+    last_balance = balance[np.arange(n), np.maximum(written - 1, 0)] if width else start_balance
+    state = loans.assign(
+        remaining=np.where(written > 0, last_balance, start_balance),
+        next_payment=np.where(payoff < count, term + 1, next_payment + written),
+        next_due_month=to_dates(first_month + written),
+    )
+    return df_loan_schedule, state
+
+def generate_loan_schedules(df_account, end_date, seed, horizon=None):
+    """
+    fact_loan_schedule from each loan's first due month (the month after it opened) to maturity,
+    or to `horizon` months past end_date. Returns (df_loan_schedule, state) with each loan's terms,
+    remaining balance and next payment.
+    """
+    loans = df_account[(df_account["account_type"] == "Loan") & (df_account["principal_amount"].fillna(0) != 0)
+                       & (df_account["loan_term_months"].fillna(0) != 0)]
+    principal = loans["principal_amount"].to_numpy(dtype=float)
+    term = loans["loan_term_months"].to_numpy(dtype=float)
+
+    # Level monthly payment of a fully amortizing loan
+    monthly_rate = loans["interest_rate"].to_numpy(dtype=float) / 12
+    growth = (1 + monthly_rate) ** term
+    monthly_payment = np.where(monthly_rate > 0, principal * monthly_rate * growth / np.where(monthly_rate > 0, growth - 1, 1),
+                               principal / term)
+
+    open_months = np.array(loans["open_date"].tolist(), dtype="datetime64[M]").reshape(len(loans))
+    state = pd.DataFrame({
+        "account_id": loans["account_id"].to_numpy(), "customer_id": loans["customer_id"].to_numpy(),
+        "principal": principal, "term": term, "monthly_rate": monthly_rate, "monthly_payment": monthly_payment,
+        "remaining": principal, "next_payment": 1, "next_due_month": to_dates(open_months + 1),
+    }, columns=FACT_STATE_COLUMNS["fact_loan_schedule"])
+    return amortize(state, end_date, horizon, customer_streams(seed, "fact_loan_schedule"))
+
+def extend_loan_schedules(state, previous_end, end_date, seed, horizon=None):
+    """
+    Schedule rows after the ones the previous run wrote, up to `horizon` months past end_date,
+    continuing each loan from state. Rows the previous run wrote as Scheduled are settled by
+    settle_loan_payments.
+    """
+    return amortize(state, end_date, horizon,
+                    customer_streams(seed, "fact_loan_schedule", previous_end.toordinal()))
+
+SETTLE_STREAM = 1  # appended to an append run's loan stream for settle_loan_payments' draws
+
+def settle_loan_payments(df_loan_schedule, previous_end, end_date, seed):
+    """
+    Settle, in place, the payments a previous run wrote as Scheduled that are now due more than 30 days
+    before end_date. Each becomes Paid or Overdue with the chances amortize uses, with its payment date,
+    amount and late fee; rows keep their IDs. The Prepaid share is paid as scheduled, since extra
+    principal would change the balances of the rows after it. Returns the number of payments settled.
+    """
+    due = np.array(df_loan_schedule["due_date"].tolist(), dtype="datetime64[D]").reshape(len(df_loan_schedule))
+    settle = ((df_loan_schedule["payment_status"] == "Scheduled").to_numpy()
+              & (due < np.datetime64(end_date.date() - timedelta(days=30))))
+    rows = np.flatnonzero(settle)
+    rows = rows[np.argsort(df_loan_schedule["schedule_id"].to_numpy()[rows], kind="stable")]
+    if not len(rows):
+        return 0
+
+    # Status and payment-day draws: one batch per customer, in schedule_id order
+    draws = np.empty((len(rows), 2))
+    rngs_of = customer_streams(seed, "fact_loan_schedule", previous_end.toordinal(), SETTLE_STREAM)
+    customers = df_loan_schedule["customer_id"].to_numpy()[rows]
+    for c_id, positions in pd.Series(np.arange(len(rows))).groupby(customers).groups.items():
+        draws[positions] = rngs_of(c_id)[0].random((len(positions), 2))
+    overdue = draws[:, 0] < OVERDUE_CHANCE
+    days_past_due = np.where(overdue, 1 + np.floor(draws[:, 1] * 30), 0).astype(int)
+    days_early = np.where(overdue, 0, np.floor(draws[:, 1] * 6)).astype(int)
+
+    index = df_loan_schedule.index[rows]
+    df_loan_schedule.loc[index, "payment_status"] = LOAN_STATUSES[np.where(overdue, OVERDUE, PAID)]
+    df_loan_schedule.loc[index, "actual_payment_date"] = to_dates(due[rows] - days_early + days_past_due)
+    df_loan_schedule.loc[index, "actual_amount_paid"] = df_loan_schedule.loc[index, "payment_due"].to_numpy()
+    df_loan_schedule.loc[index, "days_past_due"] = days_past_due
+    df_loan_schedule.loc[index, "late_fee_charged"] = np.where(days_past_due > 0, 25, 0)
+    return len(rows)
@@ -0,0 +1,233 @@
+"""
+Array sampling helpers and per-customer spending rules.
+"""
+
+import random
+import numpy as np
+import pandas as pd
+
+from .catalogs import GENERAL_CATEGORIES, GENERAL_CATEGORY_WEIGHTS
+
+# --- RANDOM STREAMS ---
+# Every stream is derived from the run seed with SeedSequence spawn keys, so draws for one shard or
+# one customer never depend on what was generated before it (or on how work is split into shards)
+SHARD_STREAM, CUSTOMER_STREAM = 0, 1
+
+def shard_rng(seed, shard_index):
+    """numpy Generator for the columnar dim tables of one shard"""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(SHARD_STREAM, shard_index)))
+
+def customer_rngs(seed, customer_id, *stream):
+    """
+    Independent (numpy Generator, random.Random) pair for one customer's rows of a fact table.
+    stream tells tables (and append runs) apart. The Generator draws arrays; the random.Random,
+    seeded from it, draws the per-row scalars, where it is several times faster.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(CUSTOMER_STREAM, int(customer_id), *stream)))
+    return rng, random.Random(int(rng.integers(2**63)))
+
+# --- HELPER FUNCTIONS ---
+def generate_phones(size, rng):
+    area, exchange, line = (rng.integers(low, high, size=size).astype(str)
+                            for low, high in [(200, 1000), (100, 1000), (1000, 10000)])
+    return ("+1-" + pd.Series(area) + "-" + exchange + "-" + line).to_numpy(dtype=object)
+
+def lookup(values, mapping, default=None):
+    """Vectorized dict lookup over an array of keys"""
+    return np.array([mapping.get(value, default) for value in values])
+
+def pick_weighted(options, weights, size, rng):
+    """Weighted choice from a small list for `size` rows"""
+    p = np.asarray(weights, dtype=float)
+    return np.array(options, dtype=object)[rng.choice(len(options), size=size, p=p / p.sum())]
+
+def weighted_rows(weights, rng):
+    """One weighted choice per row of a (rows, options) weight matrix; returns option indices"""
+    cum_weights = np.cumsum(weights, axis=1)
+    return (cum_weights < rng.random(len(weights))[:, None] * cum_weights[:, -1:]).sum(axis=1)
+
+def pick(options, size, rng):
+    """Uniform choice from a small list for `size` rows"""
+    return np.array(options, dtype=object)[rng.integers(0, len(options), size=size)]
+
+def random_days(start_days, end_days, rng):
+    """Uniform day number in [start, end] per row - bulk equivalent of fake.date_between"""
+    return start_days + np.floor(rng.random(len(start_days)) * (end_days - start_days + 1)).astype(np.int64)
+
+def to_day_numbers(dates):
+    return np.array(dates, dtype="datetime64[D]").astype(np.int64)
+
+def to_dates(day_numbers):
+    return np.asarray(day_numbers).astype("datetime64[D]").astype(object)
+
+def get_customer_spending_profile(cust, persona, rand):
+    """
+    Generate a unique spending profile for each customer based on multiple factors.
+    Returns a dict with multipliers for different aspects of spending.
+    This creates realistic variance - not everyone in a persona spends the same way.
+    """
+    age = cust["age"]
+    gender = cust.get("gender", "Other")
+    income = cust["income_bracket"]
+    segment = cust["segment"]
+
+    # Base spending personality (some people are frugal, some splurge)
+    # This is the biggest source of individual variance
+    spending_personality = rand.lognormvariate(0, 0.35)  # Range ~0.5-2.0
+    spending_personality = max(0.4, min(2.5, spending_personality))
+
+    # Age factor - spending patterns change with life stage
+    if age < 25:
+        age_factor = rand.uniform(0.6, 1.0)  # Students/young adults spend less overall
+    elif 25 <= age < 35:
+        age_factor = rand.uniform(0.9, 1.3)  # Peak spending years
+    elif 35 <= age < 50:
+        age_factor = rand.uniform(1.0, 1.4)  # Family years, high expenses
+    elif 50 <= age < 65:
+        age_factor = rand.uniform(0.9, 1.2)  # Kids leaving, stable
+    else:
+        age_factor = rand.uniform(0.6, 1.0)  # Retired, fixed income
+
+    # Income factor - this shifts spending up/down significantly
+    income_factors = {
+        "<25K": rand.uniform(0.5, 0.8),
+        "25-50K": rand.uniform(0.7, 1.0),
+        "50-100K": rand.uniform(0.9, 1.3),
+        "100-250K": rand.uniform(1.2, 1.8),
+        "250K+": rand.uniform(1.5, 2.5),
+    }
+    income_factor = income_factors.get(income, 1.0)
+
+    # Gender-based subtle category preferences (not amount, but category mix)
+    # These are SUBTLE and based on aggregate consumer data, not stereotypes
+    category_preferences = {}
+    if gender == "Male":
+        category_preferences = {
+            "Gas": rand.uniform(1.0, 1.3),
+            "Dining": rand.uniform(1.0, 1.2),
+            "Entertainment": rand.uniform(1.0, 1.2),
+            "Shopping": rand.uniform(0.8, 1.0),
+            "Healthcare": rand.uniform(0.8, 1.0),
+        }
+    elif gender == "Female":
+        category_preferences = {
+            "Shopping": rand.uniform(1.0, 1.3),
+            "Healthcare": rand.uniform(1.0, 1.2),
+            "Groceries": rand.uniform(1.0, 1.2),
+            "Gas": rand.uniform(0.8, 1.0),
+        }
+
+    # Everyday category mix (weights over GENERAL_CATEGORIES), fixed per customer;
+    # each transaction only adds its own noise on top
+    category_weights = np.array(GENERAL_CATEGORY_WEIGHTS)
+
+    # Age-based adjustments with randomness
+    if age < 30:
+        category_weights[1] *= rand.uniform(1.2, 1.8)  # Young people dine out more
+        category_weights[5] *= rand.uniform(1.2, 1.7)  # More entertainment
+        category_weights[4] *= rand.uniform(0.3, 0.6)  # Less healthcare
+    elif age > 55:
+        category_weights[4] *= rand.uniform(1.5, 2.5)  # Healthcare increases with age
+        category_weights[1] *= rand.uniform(0.6, 0.9)  # Less dining out
+        category_weights[5] *= rand.uniform(0.5, 0.8)  # Less entertainment
+
+    # Gender-based category preferences
+    category_weights *= [category_preferences.get(c, 1.0) for c in GENERAL_CATEGORIES]
+
+    # Family adjustments
+    if cust.get("has_children"):
+        category_weights[0] *= rand.uniform(1.2, 1.5)  # More groceries for families
+        category_weights[2] *= rand.uniform(1.1, 1.4)  # More shopping (kids stuff)
+        category_weights[5] *= rand.uniform(1.0, 1.3)  # Family entertainment
+
+    # Income adjustments - higher income more dining/entertainment
+    if income in ["100-250K", "250K+"]:
+        category_weights[1] *= rand.uniform(1.1, 1.4)  # More dining
+        category_weights[5] *= rand.uniform(1.1, 1.3)  # More entertainment
+
+    # Age/wealth affects travel slightly (added to the calendar's seasonal travel chance)
+    travel_boost = (0.01 if 25 <= age <= 45 else 0.0) + (0.015 if segment in ["Affluent", "High Net Worth"] else 0.0)
+
+    # Segment affects quality/premium vs budget choices
+    segment_quality_mult = {
+        "Mass Market": rand.uniform(0.7, 1.0),
+        "Affluent": rand.uniform(1.0, 1.4),
+        "High Net Worth": rand.uniform(1.3, 2.0),
+    }.get(segment, 1.0)
+
+    # Final overall multiplier combines all factors
+    overall_mult = spending_personality * age_factor * income_factor * 0.7  # 0.7 to normalize
+    overall_mult = max(0.3, min(3.0, overall_mult))  # Clamp to reasonable range
+
+    return {
+        "overall_multiplier": overall_mult,
+        "spending_personality": spending_personality,
+        "age_factor": age_factor,
+        "income_factor": income_factor,
+        "segment_quality": segment_quality_mult,
+        "category_preferences": category_preferences,
+        "category_weights": category_weights,
+        "travel_boost": travel_boost,
+    }
+
+def round_to_realistic_amount(amount, rand):
+    """Make amounts look more realistic - cluster around round numbers"""
+    if amount < 10:
+        return round(amount, 2)
+    elif amount < 50:
+        # Round to nearest $5 with some noise
+        base = round(amount / 5) * 5
+        return base + rand.uniform(-0.99, 0.99)
+    elif amount < 200:
+        # Cluster around $10 increments
+        base = round(amount / 10) * 10
+        noise = rand.choice([0, 0.49, 0.95, 0.99, -0.01])
+        return base + noise
+    elif amount < 1000:
+        # Cluster around $25 or $50 increments
+        increment = rand.choice([25, 50])
+        base = round(amount / increment) * increment
+        noise = rand.choice([0, 0.49, 0.95, 0.99, -0.01])
+        return base + noise
+    else:
+        # Large amounts - round to nearest $100
+        base = round(amount / 100) * 100
+        return base + rand.choice([0, 0, 0, 50, -50])
+
+def round_to_realistic_amounts(amount, rng):
+    """
+    Array version of round_to_realistic_amount: the same bands and noise sets, applied with masks
+    (every noise draw is made for all rows and picked per band).
+    """
+    amount = np.asarray(amount, dtype=float)
+    n = len(amount)
+    increment = np.select([amount < 50, amount < 200, amount < 1000],
+                          [5, 10, np.array([25, 50])[rng.integers(0, 2, size=n)]], 100)
+    base = np.round(amount / increment) * increment
+    noise = np.select(
+        [amount < 50, amount < 1000],
+        [rng.uniform(-0.99, 0.99, n), np.array([0, 0.49, 0.95, 0.99, -0.01])[rng.integers(0, 5, size=n)]],
+        np.array([0, 0, 0, 50, -50])[rng.integers(0, 5, size=n)],
+    )
+    return np.where(amount < 10, np.round(amount, 2), base + noise)
+
+# Days of the month around typical paydays
+PAYDAYS = [1, 2, 14, 15, 16, 28, 29, 30, 31]
+
+def seasonal_range(month, day):
+    """
+    Spending varies by season/holidays: (low, high) bounds of the seasonal spending multiplier
+    for arrays of month and day of month.
+    """
+    return np.select(
+        [
+            (month == 11) & (day >= 20),  # Black Friday / Holiday shopping
+            (month == 12) & (day <= 25),
+            np.isin(month, [8, 9]),  # Back to school
+            np.isin(month, [6, 7]),  # Summer travel
+            np.isin(month, [1, 2]),  # Post-holiday slump
+        ],
+        [np.array([1.3, 1.8])[:, None], np.array([1.4, 2.0])[:, None], np.array([1.1, 1.3])[:, None],
+         np.array([1.1, 1.2])[:, None], np.array([0.7, 0.9])[:, None]],
+        np.array([0.9, 1.1])[:, None],
+    )
@@ -0,0 +1,46 @@
+"""
+Faker identity pools sampled by index when building dim_customer.
+"""
+
+import os
+import numpy as np
+from faker import Faker
+
+from .config import LOCALE, IDENTITY_POOL_SIZE
+
+# --- IDENTITY POOLS ---
+IDENTITY_FIELDS = ["first_name", "last_name", "email_local_part", "email_domain", "occupation"]
+_identity_pools = {}  # per-process memo keyed by (seed, locale, size)
+
+def build_identity_pool(seed, locale, size):
+    """Call Faker `size` times per field; customers then sample from these arrays by index"""
+    pool_fake = Faker(locale)
+    pool_fake.seed_instance(seed)
+    emails = [pool_fake.email().split("@") for _ in range(size)]
+    return {
+        "first_name": np.array([pool_fake.first_name() for _ in range(size)]),
+        "last_name": np.array([pool_fake.last_name() for _ in range(size)]),
+        "email_local_part": np.array([local for local, _ in emails]),
+        "email_domain": np.array([domain for _, domain in emails]),
+        "occupation": np.array([pool_fake.job()[:50] for _ in range(size)]),
+    }
+
+def identity_pool(seed, locale=LOCALE, size=IDENTITY_POOL_SIZE, cache_dir=None):
+    """
+    Identity pool for (seed, locale, size), built once per process.
+    With cache_dir set the pool is stored as an .npz file there and reused across runs and workers.
+    """
+    key = (seed, locale, size)
+    if key in _identity_pools:
+        return _identity_pools[key]
+    cache_file = cache_dir and os.path.join(cache_dir, f"identity_pool_{locale}_{seed}_{size}.npz")
+    if cache_file and os.path.exists(cache_file):
+        with np.load(cache_file) as cached:
+            pool = {field: cached[field] for field in IDENTITY_FIELDS}
+    else:
+        pool = build_identity_pool(seed, locale, size)
+        if cache_file:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(cache_file, **pool)
+    _identity_pools[key] = pool
+    return pool
@@ -0,0 +1,318 @@
+"""
+Sharded generation and the generate() / generate_files() entry points.
+"""
+
+import dataclasses
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import os
+import numpy as np
+import pandas as pd
+
+from .checkpoint import RunCheckpoint, run_fingerprint
+from .config import GeneratorConfig
+from .dims import dim_date_end, generate_dim_date, generate_dim_product, generate_dim_merchant, generate_customers, generate_accounts
+from .facts import (
+    generate_transactions, generate_snapshots, generate_interactions, generate_loan_schedules, transaction_calendar,
+)
+from .helpers import shard_rng
+from .identities import identity_pool
+from .export import TABLE_WRITERS, export_pool, run_concurrently, write_tables
+from .report import (
+    PROFILE, REPORT_FILE, STAGE_RECORDS, finish_profiling, run_recorded, run_report, stage, start_profiling, take_records,
+    write_report,
+)
+from .state import run_manifest, save_state
+
+# --- SHARDED GENERATION ---
+SHARD_TABLES = ["dim_customer", "dim_account", "fact_transaction", "fact_account_snapshot",
+                "fact_interaction", "fact_loan_schedule"]
+STATIC_TABLES = ["dim_date", "dim_product", "dim_merchant"]
+ALL_TABLES = STATIC_TABLES + SHARD_TABLES
+# Stages that can be profiled (GeneratorConfig.profile); "run" is the whole run
+PROFILE_STAGES = ALL_TABLES + ["export", "run"]
+PROFILE_DIR = "_profile"  # default profile directory, under the output directory
+
+# Shard-local ID columns: (column, table whose row counter it follows)
+SHARD_LOCAL_IDS = {
+    "dim_account": [("account_id", "dim_account")],
+    "fact_transaction": [("transaction_id", "fact_transaction"), ("account_id", "dim_account")],
+    "fact_account_snapshot": [("snapshot_id", "fact_account_snapshot"), ("account_id", "dim_account")],
+    "fact_interaction": [("interaction_id", "fact_interaction")],
+    "fact_loan_schedule": [("schedule_id", "fact_loan_schedule"), ("account_id", "dim_account")],
+}
+
+def requested_tables(config):
+    """Tables a config asks for, in ALL_TABLES order"""
+    if config.tables is None:
+        return list(ALL_TABLES)
+    unknown = set(config.tables) - set(ALL_TABLES)
+    if unknown:
+        raise ValueError(f"Unknown tables: {sorted(unknown)}")
+    return [table for table in ALL_TABLES if table in config.tables]
+
+def generate_shard(shard_index, customer_ids, config, calendar):
+    """
+    Generate customers, accounts and the requested fact tables for one shard of customers.
+    calendar is the run's transaction_calendar(), built once from dim_date.
+    The dims draw columns from the shard's own stream and every fact table from per-customer
+    streams (all spawned from the seed), so the result is the same whichever process runs the
+    shard. IDs other than customer_id are shard-local, numbered from 1. Every table is timed as a stage.
+    Returns (tables, state) - state holds the generator state of each fact table for append runs.
+    """
+    rng = shard_rng(config.seed, shard_index)
+    with stage("dim_customer") as record:
+        df_customer = generate_customers(customer_ids, identity_pool(config.seed, cache_dir=config.identity_cache),
+                                         config.start_date, config.end_date, config.as_of_date, rng)
+        record["rows"] = len(df_customer)
+    with stage("dim_account") as record:
+        df_account = generate_accounts(df_customer, config.end_date, rng)
+        record["rows"] = len(df_account)
+    tables = {"dim_customer": df_customer, "dim_account": df_account}
+    state = {}
+    wanted = requested_tables(config)
+    if "fact_transaction" in wanted:
+        with stage("fact_transaction") as record:
+            tables["fact_transaction"], state["fact_transaction"] = generate_transactions(
+                df_customer, df_account, config.engine, config.end_date, config.seed, calendar)
+            record["rows"] = len(tables["fact_transaction"])
+    if "fact_account_snapshot" in wanted:
+        with stage("fact_account_snapshot") as record:
+            tables["fact_account_snapshot"], state["fact_account_snapshot"] = generate_snapshots(
+                df_customer, df_account, config.end_date, config.seed)
+            record["rows"] = len(tables["fact_account_snapshot"])
+    if "fact_interaction" in wanted:
+        with stage("fact_interaction") as record:
+            tables["fact_interaction"], state["fact_interaction"] = generate_interactions(
+                df_customer, config.end_date, config.seed)
+            record["rows"] = len(tables["fact_interaction"])
+    if "fact_loan_schedule" in wanted:
+        with stage("fact_loan_schedule") as record:
+            tables["fact_loan_schedule"], state["fact_loan_schedule"] = generate_loan_schedules(
+                df_account, config.end_date, config.seed, config.loan_horizon)
+            record["rows"] = len(tables["fact_loan_schedule"])
+    return tables, state
+
+def globalize_shard(tables, state, offsets):
+    """Rewrite one shard's local IDs (tables and state) into the global sequence; advances offsets in place"""
+    for table, df in tables.items():
+        if df.empty:
+            continue
+        for column, counter_table in SHARD_LOCAL_IDS.get(table, []):
+            df[column] += offsets[counter_table]
+    for df in state.values():
+        if "account_id" in df:
+            df["account_id"] += offsets["dim_account"]
+    for table, df in tables.items():
+        offsets[table] += len(df)
+    return tables, state
+
+def map_shards(shard_fn, shard_args, workers):
+    """
+    Yield shard_fn(*args) for each shard's args, in shard order.
+    With workers > 1 at most 2 * workers shards are in flight, so memory stays bounded;
+    the stage records a worker makes come back with its shard.
+    """
+    if workers <= 1:
+        for args in shard_args:
+            yield shard_fn(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for args in shard_args:
+            pending.append(pool.submit(run_recorded, PROFILE, shard_fn, *args))
+            if len(pending) >= 2 * workers:
+                yield collect_records(pending.popleft().result())
+        while pending:
+            yield collect_records(pending.popleft().result())
+
+def collect_records(recorded):
+    """Shard result from run_recorded(), with its stage records added to this process's"""
+    result, records = recorded
+    STAGE_RECORDS.extend(records)
+    return result
+
+def shard_stage(shard_index):
+    return f"shard-{shard_index:06d}"
+
+def iter_shards(config, calendar, checkpoint=None):
+    """
+    Yield each shard's (tables, state), with global IDs, in shard order. calendar goes to every shard.
+    With a checkpoint, shards it already holds are loaded instead of generated and new ones are saved to it.
+    """
+    customer_ids = np.arange(1, config.num_customers + 1, dtype=np.int64)
+    shards = [customer_ids[i:i + config.shard_size] for i in range(0, len(customer_ids), config.shard_size)]
+    done = {shard_index for shard_index in range(len(shards)) if checkpoint and checkpoint.has(shard_stage(shard_index))}
+    offsets = dict.fromkeys(SHARD_TABLES, 0)
+    if config.workers > 1 and config.identity_cache:
+        identity_pool(config.seed, cache_dir=config.identity_cache)  # build once so workers load it from disk
+    shard_args = ((shard_index, shard_ids, config, calendar) for shard_index, shard_ids in enumerate(shards)
+                  if shard_index not in done)
+    generated = map_shards(generate_shard, shard_args, config.workers)
+    for shard_index in range(len(shards)):
+        if shard_index in done:
+            tables, state = checkpoint.load(shard_stage(shard_index))
+        else:
+            tables, state = next(generated)
+            if checkpoint:
+                checkpoint.save(shard_stage(shard_index), (tables, state))  # before IDs are made global
+        yield globalize_shard(tables, state, offsets)
+    generated.close()
+
+def merge_shards(shard_results):
+    """Concatenate shard outputs in shard order"""
+    frames = {}
+    for tables in shard_results:
+        for table, df in tables.items():
+            frames.setdefault(table, [])
+            if not df.empty:
+                frames[table].append(df)
+    return {table: pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame() for table, dfs in frames.items()}
+
+def merge_states(shard_states):
+    """Concatenate shard generator state in shard order (empty frames kept, so columns survive)"""
+    if not shard_states:
+        return {}
+    return {table: pd.concat([state[table] for state in shard_states], ignore_index=True) for table in shard_states[0]}
+
+def generate_static_tables(config, checkpoint=None):
+    """
+    dim_date (through the last loan due date, see dim_date_end), dim_product and dim_merchant -
+    they do not depend on the customers
+    """
+    if checkpoint and checkpoint.has("static"):
+        return checkpoint.load("static")
+    tables = {}
+    date_end = dim_date_end(config.end_date, config.loan_horizon)
+    for table, build in [("dim_date", lambda: generate_dim_date(config.start_date, date_end)),
+                         ("dim_product", generate_dim_product), ("dim_merchant", generate_dim_merchant)]:
+        with stage(table) as record:
+            tables[table] = build()
+            record["rows"] = len(tables[table])
+    if checkpoint:
+        checkpoint.save("static", tables)
+    return tables
+
+def start_run(config):
+    """
+    Pin the run's as_of_date (so every shard, and a resumed run, dates birthdays from the same day)
+    and open config.checkpoint_dir if set. Returns (config, checkpoint or None).
+    """
+    config = config or GeneratorConfig()
+    if config.checkpoint_dir:
+        checkpoint = RunCheckpoint(config.checkpoint_dir)
+        return checkpoint.start(config), checkpoint
+    if config.as_of_date is None:
+        config = dataclasses.replace(config, as_of_date=datetime.now())
+    return config, None
+
+def start_run_profiling(config):
+    """Start profiling config.profile's stages, if any"""
+    unknown = set(config.profile or []) - set(PROFILE_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages to profile: {sorted(unknown)}")
+    start_profiling(config.profile, config.profile_dir or f"{config.output_dir}/{PROFILE_DIR}")
+
+def run_settings(config):
+    """Run settings recorded in the run report"""
+    return {**run_fingerprint(config), "workers": config.workers, "format": config.format, "stream": config.stream,
+            "chunk_rows": config.chunk_rows, "compression": config.compression, "export_threads": config.export_threads}
+
+def new_summary():
+    return {"rows": Counter(), "personas": Counter(), "mortgage_no_life": 0, "recurring": 0}
+
+def summarize_shard(tables, summary):
+    """Accumulate row counts and headline stats for the completion report"""
+    for table, df in tables.items():
+        summary["rows"][table] += len(df)
+    df_customer = tables["dim_customer"]
+    df_account = tables["dim_account"]
+    df_transaction = tables.get("fact_transaction", pd.DataFrame())
+    summary["personas"].update(df_customer["persona_tag"].value_counts().to_dict())
+    # Customers never span shards, so per-shard set differences add up to the global count
+    mortgage_holders = set(df_account[df_account["product_name"] == "Home Mortgage"]["customer_id"])
+    life_insurance_holders = set(df_account[df_account["product_name"].str.contains("Life", na=False)]["customer_id"])
+    summary["mortgage_no_life"] += len(mortgage_holders - life_insurance_holders)
+    if not df_transaction.empty:
+        summary["recurring"] += int(df_transaction["is_recurring"].sum())
+
+# --- PUBLIC API ---
+def generate(config=None):
+    """
+    Build the tables requested by config in memory and return {table name: DataFrame}.
+    Frames are in generator form: int64 surrogate keys, Categorical low-cardinality columns
+    and date objects; conform_table(table, df) gives the exported form.
+    """
+    config, checkpoint = start_run(config)
+    wanted = requested_tables(config)
+    start_run_profiling(config)
+    tables = generate_static_tables(config, checkpoint)
+    if set(wanted) & set(SHARD_TABLES):
+        calendar = transaction_calendar(tables["dim_date"])
+        tables.update(merge_shards(tables for tables, _ in iter_shards(config, calendar, checkpoint)))
+    if checkpoint:
+        checkpoint.clear()
+    take_records()  # stage records are only reported by generate_files()
+    finish_profiling()
+    return {table: tables[table] for table in wanted}
+
+def generate_files(config=None):
+    """
+    Generate the requested tables and write them to config.output_dir in config.format.
+    With config.stream, shard tables are written in chunks as they are generated instead of
+    being merged in memory first. The fact tables' generator state is saved next to the output
+    for append_files(). With config.checkpoint_dir, finished stages are checkpointed there and a
+    rerun with the same settings resumes from them; the checkpoint is removed once the files are written.
+    Tables are written concurrently on config.export_threads threads (with config.stream, each shard's
+    chunks of the different tables). Stage timings are written to <output_dir>/run_report.json. With config.profile, those stages run
+    under cProfile and their profiles plus hotspots.txt go to config.profile_dir.
+    Returns the run summary (row counts, personas, cross-sell stats, "report": the run report,
+    "hotspots": the profile summary or "").
+    """
+    config, checkpoint = start_run(config)
+    wanted = requested_tables(config)
+    os.makedirs(config.output_dir, exist_ok=True)
+    summary = new_summary()
+    take_records()  # drop records an earlier run left in this process
+    start_run_profiling(config)
+    with stage("run") as run_record:
+        static_tables = generate_static_tables(config, checkpoint)
+
+        to_write = {table: df for table, df in static_tables.items() if table in wanted}
+        shard_wanted = [table for table in SHARD_TABLES if table in wanted]
+        if shard_wanted:
+            calendar = transaction_calendar(static_tables["dim_date"])
+            if config.stream:
+                shard_states = []
+                writers = {table: TABLE_WRITERS[config.format](table, config.output_dir, config.chunk_rows,
+                                                               config.numeric_ids, compression=config.compression)
+                           for table in shard_wanted}
+                with export_pool(config.format, config.export_threads) as pool:
+                    for tables, state in iter_shards(config, calendar, checkpoint):
+                        summarize_shard(tables, summary)
+                        shard_states.append(state)
+                        run_concurrently(pool, [(writers[table].write, tables[table]) for table in shard_wanted])
+                    run_concurrently(pool, [(writer.close,) for writer in writers.values()])
+            else:
+                shard_results = list(iter_shards(config, calendar, checkpoint))
+                shard_states = [state for _, state in shard_results]
+                merged = merge_shards(tables for tables, _ in shard_results)
+                del shard_results
+                summarize_shard(merged, summary)
+                to_write.update((table, merged[table]) for table in shard_wanted)
+            save_state(config.output_dir, run_manifest(config, summary["rows"]), merge_states(shard_states))
+        # Static tables have no ID columns, so numeric_ids leaves them as they are
+        write_tables(to_write, config.output_dir, config.format, config.numeric_ids, config.compression,
+                     config.export_threads)
+        for table in static_tables:
+            if table in wanted:
+                summary["rows"][table] += len(static_tables[table])
+        run_record["rows"] = sum(summary["rows"].values())
+    summary["report"] = run_report(run_settings(config), take_records())
+    write_report(summary["report"], f"{config.output_dir}/{REPORT_FILE}")
+    summary["hotspots"] = finish_profiling()
+    if checkpoint:
+        checkpoint.clear()
+    return summary
@@ -0,0 +1,266 @@
+"""
+Run instrumentation: each generator stage records its start/end time, row count, rows/second and
+peak memory. Shard workers send their records back with their results, and a run ends with a
+report - run_report.json next to the output plus a summary table for stdout. Selected stages can
+also run under cProfile, with a hotspot summary attributed to the generator's own functions.
+"""
+
+import cProfile
+import glob
+import itertools
+import json
+import os
+import pstats
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+REPORT_FILE = "run_report.json"
+APPEND_REPORT_FILE = "append_report.json"
+
+STAGE_RECORDS = []  # finished stages of this process, in the order they ended
+OPEN_STAGES = []  # stages being timed in any thread: [record, RSS at start, peak RSS so far]
+PROFILE = {"stages": [], "directory": None}  # stages run under cProfile and where their profiles go
+PROFILERS = {}  # stage name -> cProfile.Profile accumulating that stage's calls in this process
+STAGE_LOCK = threading.Lock()  # guards OPEN_STAGES, the peak reset and the choice of profiler across threads
+PART_NUMBERS = itertools.count()
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --- MEMORY ---
+# On Linux VmRSS / VmHWM come from /proc and writing 5 to clear_refs resets the high-water mark,
+# so each stage sees its own peak. Elsewhere only the process-wide ru_maxrss is available and a
+# stage's delta is how far it raised that.
+def memory_mb():
+    """(current RSS, peak RSS since the last reset) in MB"""
+    try:
+        with open("/proc/self/status") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(fields["VmRSS"].split()[0]) / 1024, int(fields["VmHWM"].split()[0]) / 1024
+    except (OSError, KeyError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+        return peak, peak
+
+def reset_peak():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+def fold_peak():
+    """
+    Carry the high-water mark into every open stage before it is reset (it is shared by all threads).
+    Callers hold STAGE_LOCK.
+    """
+    _, peak = memory_mb()
+    for entry in OPEN_STAGES:
+        entry[2] = max(entry[2], peak)
+
+def timestamp():
+    return datetime.now().isoformat(timespec="milliseconds")
+
+# --- STAGES ---
+@contextmanager
+def stage(name):
+    """
+    Time a block as one stage; set the row count on the yielded record:
+
+        with stage("dim_account") as record:
+            df_account = generate_accounts(...)
+            record["rows"] = len(df_account)
+
+    Stages nest; an outer stage's peak includes its inner stages. Stages may run in several threads
+    (concurrent export); their peaks then overlap, and STAGE_LOCK serializes their bookkeeping. A stage
+    listed in PROFILE["stages"] runs under its own profiler, unless another profiled stage is open
+    (one profiler at a time).
+    """
+    record = {"stage": name, "started_at": timestamp(), "rows": 0}
+    profiler = None
+    with STAGE_LOCK:
+        fold_peak()
+        rss, _ = memory_mb()
+        reset_peak()
+        entry = [record, rss, rss]
+        if name in PROFILE["stages"] and not any(open_entry[0]["stage"] in PROFILE["stages"] for open_entry in OPEN_STAGES):
+            profiler = PROFILERS.setdefault(name, cProfile.Profile())
+        OPEN_STAGES.append(entry)
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        yield record
+    finally:
+        if profiler:
+            profiler.disable()
+        seconds = time.perf_counter() - start
+        with STAGE_LOCK:
+            fold_peak()
+            OPEN_STAGES[:] = [open_entry for open_entry in OPEN_STAGES if open_entry is not entry]
+            record.update(ended_at=timestamp(), seconds=seconds,
+                          rows_per_second=record["rows"] / seconds if seconds else None,
+                          peak_rss_mb=entry[2], peak_mem_delta_mb=entry[2] - entry[1])
+            STAGE_RECORDS.append(record)
+
+class StepTimes:
+    """
+    Cumulative time and rows of sub-steps that interleave inside a stage, such as the salary,
+    subscription and discretionary parts of every customer's transactions. A lap costs two clock
+    reads and no memory probe; record() adds one "<stage>.<step>" record per step.
+    """
+
+    def __init__(self, stage_name):
+        self.stage = stage_name
+        self.started_at = timestamp()
+        self.totals = {}
+
+    def lap(self, step, clock, rows=0):
+        """Charge the time since clock (a time.perf_counter() value) to step; returns the new clock"""
+        now = time.perf_counter()
+        seconds, count = self.totals.get(step, (0.0, 0))
+        self.totals[step] = (seconds + now - clock, count + rows)
+        return now
+
+    def record(self):
+        ended_at = timestamp()
+        for step, (seconds, rows) in self.totals.items():
+            STAGE_RECORDS.append({
+                "stage": f"{self.stage}.{step}", "started_at": self.started_at, "rows": rows, "ended_at": ended_at,
+                "seconds": seconds, "rows_per_second": rows / seconds if seconds else None,
+                "peak_rss_mb": None, "peak_mem_delta_mb": None,
+            })
+
+def take_records():
+    """Remove and return the records collected so far in this process"""
+    records = list(STAGE_RECORDS)
+    STAGE_RECORDS.clear()
+    return records
+
+def run_recorded(profile, fn, *args):
+    """
+    fn(*args) plus the stage records it made - how shard workers ship theirs to the parent process.
+    profile is the parent's PROFILE; the worker's profiles are saved to its directory after the call.
+    Records and profiles a forked worker inherited from the parent are dropped first.
+    """
+    take_records()
+    PROFILE.update(profile)
+    PROFILERS.clear()
+    result = fn(*args)
+    save_profiles()
+    return result, take_records()
+
+# --- RUN REPORT ---
+def run_report(settings, records):
+    """
+    Report of one run: its settings, per-stage totals (calls, seconds, rows, rows/second, largest
+    peak and peak delta) and the raw records. Stage times add up over shards, so with several
+    workers they exceed the run's wall time; the "run" stage is the wall time.
+    """
+    roots = {}
+    for record in records:
+        roots.setdefault(record["stage"].split(".")[0], len(roots))
+    stages = {}
+    for record in sorted(records, key=lambda r: (roots[r["stage"].split(".")[0]], "." in r["stage"])):
+        total = stages.setdefault(record["stage"], {
+            "calls": 0, "seconds": 0.0, "rows": 0, "peak_rss_mb": None, "peak_mem_delta_mb": None,
+            "first_started_at": record["started_at"], "last_ended_at": record["ended_at"],
+        })
+        total["calls"] += 1
+        total["seconds"] += record["seconds"]
+        total["rows"] += record["rows"]
+        for field in ("peak_rss_mb", "peak_mem_delta_mb"):
+            if record[field] is not None:
+                total[field] = max(total[field] if total[field] is not None else record[field], record[field])
+        total["first_started_at"] = min(total["first_started_at"], record["started_at"])
+        total["last_ended_at"] = max(total["last_ended_at"], record["ended_at"])
+    for total in stages.values():
+        total["rows_per_second"] = total["rows"] / total["seconds"] if total["seconds"] else None
+    return {"settings": settings, "stages": stages, "records": records}
+
+def write_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+
+def format_report(report):
+    """Per-stage summary table of a run report"""
+    stages = report["stages"]
+    wall = stages["run"]["seconds"] if "run" in stages else sum(total["seconds"] for total in stages.values())
+    lines = [f"{'Stage':<34} {'Calls':>6} {'Seconds':>9} {'% run':>6} {'Rows':>13} {'Rows/s':>12} {'Peak +MB':>9}"]
+    for name, total in stages.items():
+        indent = "  " if "." in name else ""
+        rate = f"{total['rows_per_second']:,.0f}" if total["rows"] and total["rows_per_second"] else "-"
+        delta = f"{total['peak_mem_delta_mb']:.0f}" if total["peak_mem_delta_mb"] is not None else "-"
+        share = total["seconds"] / wall * 100 if wall else 0
+        lines.append(f"{indent + name:<34} {total['calls']:>6,} {total['seconds']:>9.2f} {share:>5.0f}% "
+                     f"{total['rows']:>13,} {rate:>12} {delta:>9}")
+    return "\n".join(lines)
+
+# --- PROFILING ---
+def start_profiling(stages, directory):
+    """Profile the named stages of this run (and its workers) into directory; stages=None turns profiling off"""
+    PROFILE.update(stages=list(stages or []), directory=directory)
+    PROFILERS.clear()
+    if stages:
+        os.makedirs(directory, exist_ok=True)
+        for part in glob.glob(f"{directory}/*.part.prof"):  # left by a crashed run
+            os.remove(part)
+
+def save_profiles():
+    """Write this process's profiles as part files, <stage>.<pid>-<n>.part.prof, and start them afresh"""
+    for name, profiler in PROFILERS.items():
+        profiler.dump_stats(f"{PROFILE['directory']}/{name}.{os.getpid()}-{next(PART_NUMBERS)}.part.prof")
+    PROFILERS.clear()
+
+def generator_hotspots(stats, top):
+    """
+    Top generator functions of a profile (functions of the mockup package, other than this module). A function's
+    time is its own plus what it spent in direct calls to library code (pandas, numpy, random, builtins),
+    so e.g. a DataFrame built inside get_customer_spending_profile counts against it.
+    """
+    def in_package(func):
+        return func[0].startswith(PACKAGE_DIR) and func[0] != os.path.abspath(__file__)
+
+    attributed = {func: tottime for func, (_, _, tottime, _, _) in stats.stats.items() if in_package(func)}
+    for callee, (_, _, _, _, callers) in stats.stats.items():
+        if in_package(callee):
+            continue
+        for caller, (_, _, _, cumtime) in callers.items():
+            if caller in attributed:
+                attributed[caller] += cumtime
+    rows = []
+    for func, seconds in sorted(attributed.items(), key=lambda item: -item[1])[:top]:
+        _, calls, _, cumtime, _ = stats.stats[func]
+        rows.append({"function": func[2], "location": f"{os.path.relpath(func[0], PACKAGE_DIR)}:{func[1]}",
+                     "calls": calls, "seconds": seconds, "cumulative_seconds": cumtime})
+    return rows
+
+def finish_profiling(top=20):
+    """
+    Merge every process's part files into <directory>/<stage>.prof (pstats / snakeviz format) and write
+    hotspots.txt with each stage's top generator functions. Returns the hotspot text ("" when not profiling).
+    """
+    if not PROFILE["stages"]:
+        return ""
+    save_profiles()
+    directory = PROFILE["directory"]
+    lines = []
+    for name in PROFILE["stages"]:
+        parts = sorted(glob.glob(f"{directory}/{glob.escape(name)}.*.part.prof"))
+        if not parts:
+            continue
+        stats = pstats.Stats(*parts)
+        stats.dump_stats(f"{directory}/{name}.prof")
+        for part in parts:
+            os.remove(part)
+        lines.append(f"{name} ({stats.total_tt:.2f}s profiled, {directory}/{name}.prof)")
+        lines.append(f"  {'Function':<36} {'Location':<18} {'Calls':>10} {'Seconds':>9} {'Cumulative':>11}")
+        for row in generator_hotspots(stats, top):
+            lines.append(f"  {row['function']:<36} {row['location']:<18} {row['calls']:>10,} {row['seconds']:>9.2f} "
+                         f"{row['cumulative_seconds']:>11.2f}")
+    text = "\n".join(lines)
+    with open(f"{directory}/hotspots.txt", "w") as f:
+        f.write(text + "\n")
+    PROFILE.update(stages=[], directory=None)
+    return text
@@ -0,0 +1,168 @@
+"""
+Exported table schemas, the write-time conversion of generated frames and the warehouse DDL.
+"""
+
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# --- OUTPUT SCHEMAS ---
+# Column order and type per exported table. Numeric columns are cast before writing so a
+# chunk renders exactly like the full table (e.g. a chunk without prepayments still writes 0.0)
+TABLE_SCHEMAS = {
+    "dim_date": {
+        "date_key": "int", "full_date": "date", "year": "int", "quarter": "int", "month": "int",
+        "month_name": "str", "week_of_year": "int", "day_of_month": "int", "day_of_week": "int",
+        "day_name": "str", "is_weekend": "bool", "is_holiday": "bool", "fiscal_year": "int",
+        "fiscal_quarter": "int",
+    },
+    "dim_product": {
+        "product_id": "str", "product_name": "str", "product_type": "str", "product_category": "str",
+        "min_balance": "float", "annual_fee": "float", "interest_rate_min": "float",
+        "interest_rate_max": "float", "is_active": "bool", "description": "str",
+    },
+    "dim_merchant": {
+        "merchant_id": "str", "merchant_name": "str", "mcc_code": "str", "mcc_category": "str",
+        "merchant_type": "str", "is_subscription_merchant": "bool",
+    },
+    "dim_customer": {
+        "customer_id": "id", "first_name": "str", "last_name": "str", "date_of_birth": "date",
+        "age": "int", "gender": "str", "email": "str", "phone": "str", "address_city": "str",
+        "address_state": "str", "address_country": "str", "marital_status": "str",
+        "has_children": "bool", "num_dependents": "int", "occupation": "str", "employment_type": "str",
+        "income_bracket": "str", "home_ownership": "str", "segment": "str", "kyc_status": "str",
+        "join_date": "date", "preferred_channel": "str", "engagement_score": "int", "persona_tag": "str",
+        "risk_tolerance": "str", "churn_status": "bool", "churn_date": "date",
+    },
+    "dim_account": {
+        "account_id": "id", "customer_id": "id", "account_type": "str", "product_name": "str",
+        "status": "str", "open_date": "date", "maturity_date": "date", "account_number": "str",
+        "credit_limit": "float", "available_balance": "float", "principal_amount": "float",
+        "interest_rate": "float", "loan_term_months": "float", "payoff_amount": "float",
+        "outstanding_balance": "float", "cd_term_months": "float", "annual_yield": "float",
+        "average_balance": "float", "tin_type": "str", "tin_number": "str", "coverage_amount": "float",
+        "premium_amount": "float", "beneficiary_count": "float", "policy_status": "str",
+        "policy_sub_status": "str", "security_type": "str", "units_held": "float",
+        "purchase_price": "float", "current_value": "float", "current_balance": "float", "currency": "str",
+    },
+    "fact_transaction": {
+        "transaction_id": "id", "customer_id": "id", "account_id": "id", "merchant_id": "str",
+        "date_key": "int", "transaction_date": "date", "amount": "float", "transaction_type": "str",
+        "payment_method": "str", "mcc_category": "str", "is_recurring": "bool",
+        "recurring_frequency": "str", "counterparty_type": "str", "counterparty_name": "str",
+        "description": "str", "channel": "str", "reference_number": "str",
+    },
+    "fact_account_snapshot": {
+        "snapshot_id": "id", "account_id": "id", "customer_id": "id", "date_key": "int",
+        "snapshot_date": "date", "balance": "float", "month_avg_balance": "float",
+        "month_end_balance": "float", "available_credit": "float", "credit_utilization_pct": "float",
+        "principal_paid": "float", "principal_remaining": "float", "interest_accrued": "float",
+        "total_credits_mtd": "float", "total_debits_mtd": "float", "net_cash_flow_mtd": "float",
+        "customer_product_count": "int",
+    },
+    "fact_interaction": {
+        "interaction_id": "id", "customer_id": "id", "date_key": "int", "interaction_date": "date",
+        "channel": "str", "interaction_type": "str", "reason": "str", "sentiment_score": "float",
+        "resolution_status": "str", "duration_minutes": "int",
+    },
+    "fact_loan_schedule": {
+        "schedule_id": "id", "account_id": "id", "customer_id": "id", "date_key": "int",
+        "due_date": "date", "payment_number": "int", "total_payments": "float", "payment_due": "float",
+        "principal_portion": "float", "interest_portion": "float", "payment_status": "str",
+        "actual_payment_date": "date", "actual_amount_paid": "float", "extra_principal_paid": "float",
+        "days_past_due": "int", "late_fee_charged": "int", "cumulative_principal_paid": "float",
+        "remaining_balance": "float",
+    },
+}
+
+# Surrogate keys are int64 while generating; "id" columns are rendered as prefix + zero-padded number on write
+ID_FORMATS = {
+    "customer_id": ("CUST-", 6),
+    "account_id": ("ACC-", 8),
+    "transaction_id": ("TXN-", 10),
+    "snapshot_id": ("SNAP-", 10),
+    "interaction_id": ("INT-", 10),
+    "schedule_id": ("SCHED-", 10),
+}
+# fact_transaction carries a reference_kind code; reference_number is its prefix + the transaction number
+REFERENCE_SALARY, REFERENCE_SUBSCRIPTION, REFERENCE_PURCHASE = 0, 1, 2
+REFERENCE_PREFIXES = np.array(["SAL", "SUB", "PUR"], dtype=object)
+
+def format_ids(ids, prefix, width):
+    """Render integer keys as prefixed IDs like 'TXN-0000000042'"""
+    return prefix + pd.Series(ids, dtype="int64").astype(str).str.zfill(width)
+
+def conform_table(table, df, numeric_ids=False):
+    """
+    Fix column order and dtypes of a table (or chunk of one) before writing.
+    "id" columns become prefixed strings unless numeric_ids keeps the int64 keys.
+    """
+    schema = TABLE_SCHEMAS[table]
+    if "reference_kind" in df:
+        df = df.assign(reference_number=REFERENCE_PREFIXES[df["reference_kind"].to_numpy()]
+                       + df["transaction_id"].astype(str).to_numpy())
+    df = df.reindex(columns=list(schema))
+    if not len(df):
+        return df
+    casts = {col: {"int": "int64", "float": "float64", "bool": "bool", "id": "int64"}[kind]
+             for col, kind in schema.items() if kind in ("int", "float", "bool", "id")}
+    df = df.astype(casts)
+    if not numeric_ids:
+        for col, kind in schema.items():
+            if kind == "id":
+                df[col] = format_ids(df[col].to_numpy(), *ID_FORMATS[col])
+    return df
+
+def restore_table(table, df):
+    """
+    Inverse of conform_table for tables read back from disk: "id" columns become int64 keys
+    again and "date" columns date objects (None where missing).
+    """
+    df = df.copy()
+    for col, kind in TABLE_SCHEMAS[table].items():
+        if col not in df:
+            continue
+        if kind == "id" and not pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype(str).str.slice(len(ID_FORMATS[col][0])).astype("int64")
+        elif kind == "date":
+            dates = pd.to_datetime(df[col])
+            df[col] = np.where(dates.isna(), None, dates.dt.date.to_numpy(dtype=object))
+    return df
+
+# --- WAREHOUSE DDL ---
+# schema/*.sql holds the star schema in BigQuery DDL; local databases get it translated per dialect
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schema")
+BIGQUERY_TYPES = {"str": "STRING", "id": "STRING", "int": "INT64", "float": "NUMERIC", "bool": "BOOL", "date": "DATE"}
+# NUMERIC is loaded as a double, like the float64 columns of the Parquet output
+DIALECT_TYPES = {
+    "duckdb": {"STRING": "VARCHAR", "INT64": "BIGINT", "NUMERIC": "DOUBLE", "BOOL": "BOOLEAN"},
+    "sqlite": {"STRING": "TEXT", "INT64": "INTEGER", "NUMERIC": "REAL", "BOOL": "BOOLEAN", "DATE": "TEXT",
+               "TIMESTAMP": "TEXT"},
+}
+
+def warehouse_ddl(table, dialect, schema_dir=SCHEMA_DIR):
+    """
+    CREATE TABLE statement for schema/<table>.sql, translated from BigQuery to dialect ("duckdb" or "sqlite").
+    The DDL is reconciled with TABLE_SCHEMAS: generated columns missing from it are added at the end,
+    and DDL columns the generator does not write lose NOT NULL (they load as NULL or their DEFAULT).
+    """
+    with open(f"{schema_dir}/{table}.sql") as f:
+        sql = re.sub(r"--[^\n]*", "", f.read())
+    body = re.search(r"CREATE TABLE[^(]*\((.*?)\)\s*;", sql, re.S).group(1)
+    schema = TABLE_SCHEMAS[table]
+    columns = {}
+    for definition in body.split(","):
+        if definition.strip():
+            name, column_type = definition.strip().split(None, 1)
+            columns[name] = column_type if name in schema else column_type.replace(" NOT NULL", "")
+    for col, kind in schema.items():
+        columns.setdefault(col, BIGQUERY_TYPES[kind])
+
+    types = DIALECT_TYPES[dialect]
+    definitions = [
+        f"{name} " + re.sub(r"\b[A-Z0-9_]+\b", lambda m: types.get(m.group(0), m.group(0)),
+                            column_type.replace("CURRENT_TIMESTAMP()", "CURRENT_TIMESTAMP"))
+        for name, column_type in columns.items()
+    ]
+    return f"CREATE TABLE {table} (\n    " + ",\n    ".join(definitions) + "\n)"
@@ -0,0 +1,48 @@
+"""
+Generator state saved next to the output so append_files() can extend a run past its end date.
+"""
+
+import json
+import os
+import pandas as pd
+
+from .facts import FACT_STATE_COLUMNS
+
+STATE_DIR = "_state"
+
+def run_manifest(config, rows):
+    """What an append run needs to know about the run that wrote an output directory"""
+    return {
+        "seed": config.seed,
+        "tables": config.tables,
+        "start_date": config.start_date.date().isoformat(),
+        "end_date": config.end_date.date().isoformat(),
+        "engine": config.engine,
+        "loan_horizon": config.loan_horizon,
+        "format": config.format,
+        "numeric_ids": config.numeric_ids,
+        "compression": config.compression,
+        "shard_size": config.shard_size,
+        "rows": {table: int(count) for table, count in rows.items() if table in FACT_STATE_COLUMNS},
+    }
+
+def save_state(output_dir, manifest, state):
+    """
+    Write <output_dir>/_state: manifest.json plus one pickle per fact table with the
+    per-customer / per-account state (it holds lists and dicts, e.g. spending profiles).
+    """
+    state_dir = f"{output_dir}/{STATE_DIR}"
+    os.makedirs(state_dir, exist_ok=True)
+    for table, df in state.items():
+        df.to_pickle(f"{state_dir}/{table}.pkl")
+    with open(f"{state_dir}/manifest.json", "w") as f:
+        json.dump({**manifest, "state_tables": sorted(state)}, f, indent=2)
+
+def load_state(output_dir):
+    """Return (manifest, {fact table: state frame}) saved by save_state()"""
+    state_dir = f"{output_dir}/{STATE_DIR}"
+    if not os.path.exists(f"{state_dir}/manifest.json"):
+        raise FileNotFoundError(f"No generator state in {state_dir}; regenerate {output_dir} before appending to it")
+    with open(f"{state_dir}/manifest.json") as f:
+        manifest = json.load(f)
+    return manifest, {table: pd.read_pickle(f"{state_dir}/{table}.pkl") for table in manifest["state_tables"]}
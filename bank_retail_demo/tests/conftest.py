@@ -0,0 +1,21 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mockup import GeneratorConfig  # noqa: E402
+
+# A short, pinned run: small enough for a test, several shards so sharding is exercised
+SMALL_RUN = {"num_customers": 40, "shard_size": 15, "seed": 3, "start_date": datetime(2024, 1, 1),
+             "end_date": datetime(2024, 6, 30), "as_of_date": datetime(2025, 1, 1)}
+
+
+@pytest.fixture
+def small_config():
+    """GeneratorConfig factory for a small pinned run; keyword arguments override its settings"""
+    def make(**overrides):
+        return GeneratorConfig(**{**SMALL_RUN, **overrides})
+    return make
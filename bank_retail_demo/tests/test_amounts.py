@@ -0,0 +1,38 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mockup.helpers import round_to_realistic_amount, round_to_realistic_amounts
+
+DRAWS = 100_000
+
+
+@pytest.fixture(scope="module")
+def rounded():
+    """The same raw amounts, across every band, rounded by the scalar and the array version"""
+    amounts = np.random.default_rng(17).lognormal(4.5, 1.3, DRAWS)
+    rand = random.Random(17)
+    return {
+        "scalar": np.array([round_to_realistic_amount(amount, rand) for amount in amounts]),
+        "array": round_to_realistic_amounts(amounts, np.random.default_rng(17)),
+    }
+
+
+def cents_shares(values):
+    return pd.Series(np.round(np.round(values, 2) * 100).astype(np.int64) % 100).value_counts(normalize=True)
+
+
+def test_cents_endings_match(rounded):
+    scalar, array = cents_shares(rounded["scalar"]), cents_shares(rounded["array"])
+    assert (array.sub(scalar, fill_value=0).abs() < 0.005).all()
+    # The round-number look: .00, .49, .95 and .99 endings dominate
+    assert array.loc[[0, 49, 95, 99]].sum() == pytest.approx(scalar.loc[[0, 49, 95, 99]].sum(), abs=0.01)
+
+
+@pytest.mark.parametrize("low, high", [(0, 10), (10, 50), (50, 200), (200, 1000), (1000, np.inf)])
+def test_bands_round_alike(rounded, low, high):
+    scalar, array = rounded["scalar"], rounded["array"]
+    assert np.mean(array[(array >= low) & (array < high)]) == pytest.approx(
+        np.mean(scalar[(scalar >= low) & (scalar < high)]), rel=0.02)
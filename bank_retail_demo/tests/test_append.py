@@ -0,0 +1,53 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from mockup import generate_files
+from mockup.append import append_files
+from mockup.export import read_table
+
+APPEND_END = datetime(2024, 9, 30)
+LOAN_TABLES = ["dim_customer", "dim_account", "fact_loan_schedule"]
+
+
+@pytest.mark.parametrize("fmt, horizon", [("csv", None), ("csv", 3), ("parquet", None)])
+def test_append_settles_scheduled_loan_payments_in_place(small_config, tmp_path, fmt, horizon):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    output_dir = str(tmp_path)
+    generate_files(small_config(output_dir=output_dir, format=fmt, loan_horizon=horizon, tables=LOAN_TABLES))
+    before = read_table("fact_loan_schedule", output_dir, fmt).set_index("schedule_id")
+    summary = append_files(output_dir, APPEND_END)
+    after = read_table("fact_loan_schedule", output_dir, fmt).set_index("schedule_id")
+
+    # Payments now due more than 30 days before the new end date are settled, keeping their IDs and amounts
+    settled_by = (APPEND_END - timedelta(days=30)).date()
+    assert not ((after["payment_status"] == "Scheduled") & (after["due_date"] < settled_by)).any()
+    was_scheduled = before.index[(before["payment_status"] == "Scheduled") & (before["due_date"] < settled_by)]
+    assert summary["settled"] == len(was_scheduled) > 0
+    assert set(after.loc[was_scheduled, "payment_status"]) <= {"Paid", "Overdue"}
+    assert (after.loc[was_scheduled, "actual_amount_paid"] == after.loc[was_scheduled, "payment_due"]).all()
+    # Every other written row is unchanged; only net new rows count as appended
+    unchanged = before.index.difference(was_scheduled)
+    assert after.loc[unchanged].equals(before.loc[unchanged])
+    assert summary["rows"]["fact_loan_schedule"] == len(after) - len(before)
+    if horizon is None:
+        assert len(after) == len(before)
+    else:
+        assert after["due_date"].max() > before["due_date"].max()
+    for _, payments in after.groupby("account_id"):
+        numbers = payments["payment_number"].sort_values().tolist()
+        assert numbers == list(range(1, len(numbers) + 1))
+
+
+def test_append_leaves_unrequested_dim_date_alone(small_config, tmp_path):
+    generate_files(small_config(output_dir=str(tmp_path), tables=LOAN_TABLES))
+    append_files(str(tmp_path), APPEND_END)
+    assert not os.path.exists(f"{tmp_path}/dim_date.csv")
+
+
+def test_append_rewrites_dim_date_for_the_longer_range(small_config, tmp_path):
+    generate_files(small_config(output_dir=str(tmp_path), tables=["dim_date", *LOAN_TABLES]))
+    append_files(str(tmp_path), APPEND_END)
+    assert read_table("dim_date", str(tmp_path), "csv")["full_date"].max() >= APPEND_END.date()
@@ -0,0 +1,32 @@
+import importlib.util
+import os
+
+import pytest
+
+BENCH_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench_generator.py")
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("bench_generator", BENCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def results(rates, **settings):
+    return {"commit": "abc1234", "timestamp": "2026-01-01T00:00:00", "engine": "python", "format": "csv",
+            "shard_size": 1000, "compression": None, "export_threads": None, **settings,
+            "tiers": [{"customers": 1000, "stages": {stage: {"rows_per_second": rate} for stage, rate in rates.items()}}]}
+
+
+def test_compare_flags_slower_stages(bench, capsys):
+    baseline = results({"fact_transaction": 1000.0, "export": 5000.0, "dim_date": None})
+    current = results({"fact_transaction": 800.0, "export": 4900.0, "dim_date": None})
+    assert bench.compare(current, baseline, tolerance=0.15) == [(1000, "fact_transaction")]
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_compare_lists_differing_settings(bench, capsys):
+    bench.compare(results({"export": 1.0}, format="parquet"), results({"export": 1.0}), tolerance=0.15)
+    assert "format differs: csv in the baseline, parquet now" in capsys.readouterr().out
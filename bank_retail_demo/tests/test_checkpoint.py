@@ -0,0 +1,46 @@
+import glob
+import os
+
+import pytest
+
+import mockup.pipeline
+from mockup import generate_files
+
+
+def csv_bytes(output_dir):
+    return {os.path.basename(path): open(path, "rb").read() for path in glob.glob(f"{output_dir}/*.csv")}
+
+
+def test_resumed_run_is_byte_identical(small_config, tmp_path, monkeypatch):
+    generate_files(small_config(output_dir=str(tmp_path / "uninterrupted")))
+
+    config = small_config(output_dir=str(tmp_path / "resumed"), checkpoint_dir=str(tmp_path / "checkpoint"))
+    generate_shard = mockup.pipeline.generate_shard
+
+    def crash_on_last_shard(shard_index, *args):
+        if shard_index == 2:
+            raise MemoryError("simulated crash")
+        return generate_shard(shard_index, *args)
+
+    monkeypatch.setattr(mockup.pipeline, "generate_shard", crash_on_last_shard)
+    with pytest.raises(MemoryError):
+        generate_files(config)
+    assert sorted(os.listdir(tmp_path / "checkpoint")) == ["manifest.json", "shard-000000.pkl", "shard-000001.pkl",
+                                                          "static.pkl"]
+
+    monkeypatch.setattr(mockup.pipeline, "generate_shard", generate_shard)
+    generate_files(config)
+    assert csv_bytes(tmp_path / "resumed") == csv_bytes(tmp_path / "uninterrupted")
+    assert not os.path.exists(tmp_path / "checkpoint")
+
+
+def test_checkpoint_rejects_other_settings(small_config, tmp_path, monkeypatch):
+    def crash(*args):
+        raise MemoryError("simulated crash")
+
+    monkeypatch.setattr(mockup.pipeline, "generate_shard", crash)
+    with pytest.raises(MemoryError):
+        generate_files(small_config(output_dir=str(tmp_path / "out"), checkpoint_dir=str(tmp_path / "checkpoint")))
+    with pytest.raises(ValueError, match="different settings"):
+        generate_files(small_config(output_dir=str(tmp_path / "out"), checkpoint_dir=str(tmp_path / "checkpoint"),
+                                    seed=4))
@@ -0,0 +1,63 @@
+import gzip
+import io
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from mockup.dims import generate_dim_date
+from mockup.export import TABLE_WRITERS, read_table
+from mockup.schemas import conform_table
+
+pa = pytest.importorskip("pyarrow")
+
+DECOMPRESS = {
+    None: lambda path: open(path, "rb").read(),
+    "gzip": lambda path: gzip.open(path).read(),
+    "zstd": lambda path: pa.input_stream(path, compression="zstd").read(),
+}
+EXTENSIONS = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+
+def small_tables():
+    """Small frames in generator form: quotes, commas and missing values, whole floats, booleans and dates"""
+    return {
+        "fact_interaction": pd.DataFrame({
+            "interaction_id": [1, 2, 3], "customer_id": [7, 7, 42], "date_key": [20240105, 20240212, 20240301],
+            "interaction_date": [date(2024, 1, 5), date(2024, 2, 12), date(2024, 3, 1)],
+            "channel": ["Mobile App", "Branch", "Call Center"], "interaction_type": ["Login", 'Said "hi", left', None],
+            "reason": ["Balance check", None, "Card lost"], "sentiment_score": [1.0, 0.25, None],
+            "resolution_status": ["Resolved", "Resolved", "Escalated"], "duration_minutes": [1, 12, 30],
+        }),
+        "dim_date": generate_dim_date(datetime(2024, 12, 20), datetime(2024, 12, 31)),
+    }
+
+
+def write_in_chunks(fmt, table, df, output_dir, compression=None, append=False):
+    writer = TABLE_WRITERS[fmt](table, output_dir, chunk_rows=2, append=append, compression=compression)
+    for start in range(0, len(df), 2):
+        writer.write(df.iloc[start:start + 2])
+    writer.close()
+
+
+@pytest.mark.parametrize("table", ["fact_interaction", "dim_date"])
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_csv_writer_matches_to_csv_bytes(tmp_path, table, compression):
+    df = small_tables()[table]
+    write_in_chunks("csv", table, df, str(tmp_path), compression)
+    write_in_chunks("csv", table, df, str(tmp_path), compression, append=True)
+    expected = io.StringIO()
+    conform_table(table, pd.concat([df, df], ignore_index=True)).to_csv(expected, index=False)
+    assert DECOMPRESS[compression](f"{tmp_path}/{table}{EXTENSIONS[compression]}") == expected.getvalue().encode()
+
+
+@pytest.mark.parametrize("table", ["fact_interaction", "dim_date"])
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_arrow_csv_writer_reads_back_the_same(tmp_path, table, compression):
+    df = small_tables()[table]
+    (tmp_path / "pandas").mkdir()
+    (tmp_path / "arrow").mkdir()
+    write_in_chunks("csv", table, df, f"{tmp_path}/pandas")
+    write_in_chunks("csv-arrow", table, df, f"{tmp_path}/arrow", compression)
+    pd.testing.assert_frame_equal(read_table(table, f"{tmp_path}/arrow", "csv-arrow"),
+                                  read_table(table, f"{tmp_path}/pandas", "csv"))
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+
+from data_loader import load_table
+from mockup import GeneratorConfig, generate_files
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def parquet_dir(tmp_path_factory):
+    output_dir = str(tmp_path_factory.mktemp("parquet"))
+    generate_files(GeneratorConfig(num_customers=20, start_date=datetime(2024, 10, 1), end_date=datetime(2024, 12, 31),
+                                   output_dir=output_dir, format="parquet", tables=["fact_transaction"],
+                                   as_of_date=datetime(2025, 1, 1)))
+    return output_dir
+
+
+def test_partitioned_table_drops_month(parquet_dir):
+    df = load_table("fact_transaction", data_dir=parquet_dir)
+    assert "month" not in df.columns
+    assert len(df)
+
+
+def test_partitioned_table_with_columns(parquet_dir):
+    df = load_table("fact_transaction", columns=["amount", "mcc_category"], data_dir=parquet_dir)
+    assert list(df.columns) == ["amount", "mcc_category"]
+    assert len(df) == len(load_table("fact_transaction", data_dir=parquet_dir))
+
+
+def test_partitioned_table_with_columns_and_filters(parquet_dir):
+    df = load_table("fact_transaction", columns=["amount", "transaction_date"],
+                    filters=[("month", ">=", 202412)], data_dir=parquet_dir)
+    assert list(df.columns) == ["amount", "transaction_date"]
+    assert len(df) and (df["transaction_date"].astype(str) >= "2024-12-01").all()
+
+
+def test_partitioned_table_with_month_column(parquet_dir):
+    df = load_table("fact_transaction", columns=["amount", "month"], data_dir=parquet_dir)
+    assert set(df["month"]) <= {202410, 202411, 202412}
@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from mockup.facts import sample_transaction_offsets
+
+DRAWS = 200_000
+ON_WEEKEND = np.array([(date(2024, 1, 1) + timedelta(days=day)).weekday() >= 5 for day in range(366)])
+
+
+def rejection_loop_offsets(on_weekend, weekend_mult, size, rng):
+    """The sampler it replaced: redraw a disfavored day with some probability, keeping the 10th draw"""
+    offsets = rng.integers(0, len(on_weekend), size)
+    if not (weekend_mult > 1.3 or weekend_mult < 0.9):
+        return offsets
+    skip_weekend, skip_prob = (True, 0.45) if weekend_mult < 0.9 else (False, 0.35)
+    pending = np.ones(size, dtype=bool)
+    for _ in range(9):
+        pending &= (on_weekend[offsets] == skip_weekend) & (rng.random(size) < skip_prob)
+        offsets = np.where(pending, rng.integers(0, len(on_weekend), size), offsets)
+    return offsets
+
+
+@pytest.mark.parametrize("weekend_mult", [0.8, 1.0, 1.2, 1.5])
+def test_weekend_split_matches_rejection_loop(weekend_mult):
+    rng = np.random.default_rng(8)
+    sampled = ON_WEEKEND[sample_transaction_offsets(ON_WEEKEND, weekend_mult, DRAWS, rng)].mean()
+    reference = ON_WEEKEND[rejection_loop_offsets(ON_WEEKEND, weekend_mult, DRAWS, rng)].mean()
+    assert sampled == pytest.approx(reference, abs=0.005)
+
+
+def test_offsets_stay_in_window():
+    offsets = sample_transaction_offsets(ON_WEEKEND[:10], 1.5, 1000, np.random.default_rng(0))
+    assert offsets.min() >= 0 and offsets.max() < 10
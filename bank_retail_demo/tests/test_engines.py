@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from mockup import GeneratorConfig, generate
+
+
+@pytest.fixture(scope="module")
+def discretionary():
+    """Discretionary (non-recurring) transactions of the same customers from each engine"""
+    frames = {}
+    for engine in ("python", "numpy"):
+        tables = generate(GeneratorConfig(num_customers=150, seed=3, engine=engine, start_date=datetime(2024, 1, 1),
+                                          end_date=datetime(2024, 12, 31), as_of_date=datetime(2025, 1, 1),
+                                          tables=["fact_transaction"]))
+        df = tables["fact_transaction"]
+        frames[engine] = df[~df["is_recurring"]]
+    return frames
+
+
+def shares(df, column):
+    return df[column].value_counts(normalize=True)
+
+
+def test_same_transaction_counts(discretionary):
+    assert len(discretionary["numpy"]) == len(discretionary["python"])
+
+
+def test_amounts_match(discretionary):
+    python, numpy = discretionary["python"]["amount"], discretionary["numpy"]["amount"]
+    assert numpy.mean() == pytest.approx(python.mean(), rel=0.05)
+    assert numpy.median() == pytest.approx(python.median(), rel=0.05)
+
+
+@pytest.mark.parametrize("column", ["mcc_category", "payment_method", "channel"])
+def test_category_mix_matches(discretionary, column):
+    python, numpy = shares(discretionary["python"], column), shares(discretionary["numpy"], column)
+    assert (numpy.sub(python, fill_value=0).abs() < 0.02).all()
+
+
+def test_weekend_share_matches(discretionary):
+    weekend = {engine: (pd.to_datetime(df["transaction_date"]).dt.dayofweek >= 5).mean()
+               for engine, df in discretionary.items()}
+    assert weekend["numpy"] == pytest.approx(weekend["python"], abs=0.02)
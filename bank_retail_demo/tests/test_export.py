@@ -0,0 +1,31 @@
+from datetime import datetime
+
+import pytest
+
+from mockup import GeneratorConfig, generate
+from mockup.export import read_table, write_table
+from mockup.schemas import conform_table
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return generate(GeneratorConfig(num_customers=20, start_date=datetime(2024, 10, 1), end_date=datetime(2024, 12, 31),
+                                    tables=["dim_date", "fact_interaction"], as_of_date=datetime(2025, 1, 1)))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_read_table_keeps_dim_date_month(tables, tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    write_table("dim_date", tables["dim_date"], str(tmp_path), fmt)
+    df = read_table("dim_date", str(tmp_path), fmt)
+    assert list(df.columns) == list(conform_table("dim_date", tables["dim_date"]).columns)
+    assert df["month"].tolist() == tables["dim_date"]["month"].tolist()
+
+
+def test_read_table_drops_partition_column(tables, tmp_path):
+    pytest.importorskip("pyarrow")
+    write_table("fact_interaction", tables["fact_interaction"], str(tmp_path), "parquet")
+    df = read_table("fact_interaction", str(tmp_path), "parquet")
+    assert "month" not in df.columns
+    assert len(df) == len(tables["fact_interaction"])
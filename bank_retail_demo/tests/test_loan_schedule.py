@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import pytest
+
+from mockup import generate, generate_files
+from mockup.append import append_files
+from mockup.dims import dim_date_end
+from mockup.export import read_table
+
+
+@pytest.mark.parametrize("horizon", [None, 3])
+def test_every_due_date_joins_dim_date(small_config, horizon):
+    config = small_config(loan_horizon=horizon, tables=["dim_date", "fact_loan_schedule"])
+    tables = generate(config)
+    df_date, df_loan_schedule = tables["dim_date"], tables["fact_loan_schedule"]
+    assert df_loan_schedule["date_key"].isin(df_date["date_key"]).all()
+    assert df_loan_schedule["due_date"].isin(df_date["full_date"]).all()
+    assert df_date["full_date"].max() == dim_date_end(config.end_date, horizon).date()
+
+
+def test_appended_due_dates_join_dim_date(small_config, tmp_path):
+    generate_files(small_config(output_dir=str(tmp_path), loan_horizon=3,
+                                tables=["dim_date", "dim_customer", "dim_account", "fact_loan_schedule"]))
+    append_files(str(tmp_path), datetime(2024, 9, 30))
+    df_date = read_table("dim_date", str(tmp_path), "csv")
+    df_loan_schedule = read_table("fact_loan_schedule", str(tmp_path), "csv")
+    assert df_loan_schedule["date_key"].isin(df_date["date_key"]).all()
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from mockup import report
+from mockup.dims import generate_dim_date
+from mockup.export import CsvTableWriter
+from mockup.report import finish_profiling, stage, start_profiling, take_records
+
+
+def test_concurrent_stages_keep_their_records(tmp_path):
+    take_records()
+    start_profiling(["export"], str(tmp_path))
+
+    def timed(i):
+        with stage("export") as record:
+            record["rows"] = i
+            sum(range(10_000))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(timed, range(200)))
+    records = take_records()
+    assert sorted(record["rows"] for record in records) == list(range(200))
+    assert report.OPEN_STAGES == []
+    assert "export" in finish_profiling()
+
+
+def test_export_is_timed_per_flush(tmp_path):
+    take_records()
+    df = generate_dim_date(datetime(2024, 1, 1), datetime(2024, 1, 10))
+    writer = CsvTableWriter("dim_date", str(tmp_path), chunk_rows=4)
+    for row in range(10):
+        writer.write(df.iloc[[row]])
+    writer.close()
+    records = [record for record in take_records() if record["stage"] == "export"]
+    # Flushes of 4, 4 and the last 2 rows, then the finish
+    assert [record["rows"] for record in records] == [4, 4, 2, 0]
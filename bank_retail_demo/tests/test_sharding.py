@@ -0,0 +1,28 @@
+import glob
+import os
+
+from mockup import ALL_TABLES, generate_files
+from mockup.export import read_table
+
+
+def csv_bytes(output_dir):
+    return {os.path.basename(path): open(path, "rb").read() for path in glob.glob(f"{output_dir}/*.csv")}
+
+
+def test_output_does_not_depend_on_workers(small_config, tmp_path):
+    outputs = {}
+    for workers in (1, 3):
+        output_dir = str(tmp_path / f"workers-{workers}")
+        generate_files(small_config(workers=workers, output_dir=output_dir))
+        outputs[workers] = csv_bytes(output_dir)
+    assert sorted(outputs[1]) == sorted(f"{table}.csv" for table in ALL_TABLES)
+    assert outputs[3] == outputs[1]
+
+
+def test_ids_are_globally_unique(small_config, tmp_path):
+    summary = generate_files(small_config(output_dir=str(tmp_path)))
+    assert summary["rows"]["dim_customer"] == 40
+    for table, column in [("dim_account", "account_id"), ("fact_transaction", "transaction_id"),
+                          ("fact_loan_schedule", "schedule_id")]:
+        ids = read_table(table, str(tmp_path), "csv")[column]
+        assert ids.is_unique and ids.min() == 1 and ids.max() == len(ids)
@@ -0,0 +1,29 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from mockup import ALL_TABLES, generate_files
+from mockup.export import read_table
+
+
+def csv_bytes(output_dir):
+    return {os.path.basename(path): open(path, "rb").read() for path in glob.glob(f"{output_dir}/*.csv")}
+
+
+def test_streamed_csv_matches_in_memory(small_config, tmp_path):
+    generate_files(small_config(output_dir=str(tmp_path / "memory")))
+    generate_files(small_config(output_dir=str(tmp_path / "stream"), stream=True, chunk_rows=300))
+    in_memory = csv_bytes(tmp_path / "memory")
+    assert len(in_memory) == len(ALL_TABLES)
+    assert csv_bytes(tmp_path / "stream") == in_memory
+
+
+def test_streamed_parquet_matches_in_memory(small_config, tmp_path):
+    pytest.importorskip("pyarrow")
+    generate_files(small_config(output_dir=str(tmp_path / "memory"), format="parquet"))
+    generate_files(small_config(output_dir=str(tmp_path / "stream"), format="parquet", stream=True, chunk_rows=300))
+    for table in ALL_TABLES:
+        pd.testing.assert_frame_equal(read_table(table, str(tmp_path / "stream"), "parquet"),
+                                      read_table(table, str(tmp_path / "memory"), "parquet"))
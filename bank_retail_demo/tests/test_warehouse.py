@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from mockup import ALL_TABLES, generate_files
+from mockup.append import append_files
+from mockup.export import connect_warehouse, read_table
+
+
+def warehouse_rows(output_dir, dialect):
+    connection = connect_warehouse(output_dir, dialect)
+    rows = {table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in ALL_TABLES}
+    connection.close()
+    return rows
+
+
+def row_values(df):
+    """
+    Rows in key order as plain values: partitioned Parquet reads back by month, its strings as categoricals,
+    SQLite booleans as 0 / 1 and DuckDB's missing integers as <NA>
+    """
+    df = df.sort_values(df.columns[0], ignore_index=True).astype(object)
+    return df.where(df.notna(), None)
+
+
+@pytest.fixture(params=["sqlite", "duckdb"])
+def dialect(request):
+    if request.param == "duckdb":
+        pytest.importorskip("duckdb")
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+@pytest.fixture
+def parquet_dir(small_config, tmp_path):
+    """The same run as typed Parquet files, to compare the warehouse tables with"""
+    pytest.importorskip("pyarrow")
+    generate_files(small_config(output_dir=str(tmp_path / "parquet"), format="parquet"))
+    return str(tmp_path / "parquet")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_warehouse_holds_the_generated_rows(small_config, tmp_path, parquet_dir, dialect, stream):
+    output_dir = str(tmp_path / dialect)
+    summary = generate_files(small_config(output_dir=output_dir, format=dialect, stream=stream, chunk_rows=300))
+    assert warehouse_rows(output_dir, dialect) == {table: summary["rows"][table] for table in ALL_TABLES}
+    for table in ALL_TABLES:
+        pd.testing.assert_frame_equal(row_values(read_table(table, output_dir, dialect)),
+                                      row_values(read_table(table, parquet_dir, "parquet")), check_dtype=False)
+
+
+def test_warehouse_append(small_config, tmp_path, dialect):
+    output_dir = str(tmp_path)
+    generate_files(small_config(output_dir=output_dir, format=dialect))
+    before = warehouse_rows(output_dir, dialect)
+    summary = append_files(output_dir, datetime(2024, 9, 30))
+    after = warehouse_rows(output_dir, dialect)
+    assert summary["rows"]["fact_transaction"] > 0
+    for table, rows in summary["rows"].items():
+        if table != "dim_date":
+            assert after[table] == before[table] + rows
+    schedule = read_table("fact_loan_schedule", output_dir, dialect)
+    assert schedule["schedule_id"].is_unique
+    assert schedule["date_key"].isin(read_table("dim_date", output_dir, dialect)["date_key"]).all()